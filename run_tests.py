@@ -4,7 +4,7 @@ Quick Test Runner for Audio-Formation
 Runs core tests while skipping problematic ones
 """
 
-import subprocess
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -22,10 +22,7 @@ def run_tests():
 
     # Run unit tests only (skip E2E and dashboard tests)
     print("📋 Running Unit Tests...")
-    cmd = [
-        sys.executable,
-        "-m",
-        "pytest",
+    args = [
         "tests/",
         "-v",
         "--tb=short",
@@ -36,9 +33,16 @@ def run_tests():
         "--cov-fail-under=60",
     ]
 
+    # Spread tests across cores when pytest-xdist is installed; pytest-cov
+    # combines the per-worker coverage data itself
+    if importlib.util.find_spec("xdist") is not None:
+        args += ["-n", "auto", "--dist=loadfile"]
+
     try:
-        result = subprocess.run(cmd, cwd=".", capture_output=False)
-        return result.returncode == 0
+        # Run in-process: avoids a second interpreter start-up and re-import
+        import pytest
+
+        return pytest.main(args) == 0
     except KeyboardInterrupt:
         print("\n⚠️ Tests interrupted")
         return False
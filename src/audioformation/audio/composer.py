@@ -8,6 +8,9 @@ filtered noise, and LFO modulation.
 Pipeline Node 5: Compose.
 """
 
+import dataclasses
+import functools
+
 import numpy as np
 import soundfile as sf
 from dataclasses import dataclass
@@ -15,12 +18,13 @@ from pathlib import Path
 from typing import Optional
 
 from audioformation.audio.synthesis import (
-    oscillator,
+    oscillator_from_phase,
     cents_to_ratio,
     generate_noise,
-    simple_lowpass,
-    simple_highpass,
+    band_filter,
+    band_filter_sections,
     apply_envelope,
+    peak_abs,
 )
 
 # ---------------------------------------------------------------------------
@@ -155,6 +159,49 @@ MOOD_PRESETS: dict[str, PadPreset] = {
 }
 
 
+@dataclass(frozen=True)
+class CompiledPadPreset:
+    """Render-ready constants derived from a PadPreset."""
+
+    layers: tuple[tuple[float, float, str], ...]  # (freq, amplitude, wave_type)
+    filter_sos: np.ndarray  # band_filter_sections() output
+
+
+def _build_compiled(p: PadPreset) -> CompiledPadPreset:
+    """Derive oscillator layers and filter coefficients from a preset."""
+    layers: list[tuple[float, float, str]] = []
+    # Base, detuned copy for richness, sub bass
+    if p.base_amplitude > 0:
+        layers.append((p.base_freq, p.base_amplitude, p.base_type))
+    if p.detune_amplitude > 0:
+        detune_freq = p.base_freq * cents_to_ratio(p.detune_cents)
+        layers.append((detune_freq, p.detune_amplitude, p.base_type))
+    if p.sub_amplitude > 0:
+        sub_freq = p.base_freq * p.sub_freq_ratio
+        layers.append((sub_freq, p.sub_amplitude, "sine"))
+
+    sos = band_filter_sections(p.lowpass_hz, p.highpass_hz, p.sample_rate)
+    sos.flags.writeable = False  # shared across calls via the cache
+    return CompiledPadPreset(layers=tuple(layers), filter_sos=sos)
+
+
+def _compile_preset(p: PadPreset) -> CompiledPadPreset:
+    """
+    Compile a preset, reusing earlier results for identical settings.
+
+    The cache is keyed on a snapshot of the field values rather than the
+    preset's name or identity, so a preset edited in place (PadPresets
+    are mutable) is recompiled instead of served stale coefficients.
+    """
+    return _compile_fields(dataclasses.astuple(p))
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_fields(fields: tuple) -> CompiledPadPreset:
+    """Compile the PadPreset with these field values (see _compile_preset)."""
+    return _build_compiled(PadPreset(*fields))
+
+
 # ---------------------------------------------------------------------------
 # Main generator
 # ---------------------------------------------------------------------------
@@ -186,63 +233,17 @@ def generate_pad(
         p = MOOD_PRESETS[preset]
     else:
         p = preset
+    compiled = _compile_preset(p)
 
     sr = p.sample_rate
     n_samples = int(sr * duration_sec)
-    rng = np.random.default_rng(seed)
-
-    # Start with silence
-    mix = np.zeros(n_samples, dtype=np.float64)
-
-    # Base oscillator
-    if p.base_amplitude > 0:
-        base = oscillator(p.base_freq, duration_sec, sr, p.base_type)
-        mix += base * p.base_amplitude
-
-    # Detuned oscillator for richness
-    if p.detune_amplitude > 0:
-        detune_freq = p.base_freq * cents_to_ratio(p.detune_cents)
-        detuned = oscillator(detune_freq, duration_sec, sr, p.base_type)
-        mix += detuned * p.detune_amplitude
-
-    # Sub bass
-    if p.sub_amplitude > 0:
-        sub_freq = p.base_freq * p.sub_freq_ratio
-        sub = oscillator(sub_freq, duration_sec, sr, "sine")
-        mix += sub * p.sub_amplitude
-
-    # Noise layer
-    if p.noise_amplitude > 0:
-        noise = generate_noise(n_samples, p.noise_color, rng)
-        mix += noise * p.noise_amplitude
-
-    # LFO modulation
-    if p.lfo_depth > 0:
-        lfo = oscillator(p.lfo_rate, duration_sec, sr, "sine")
-        lfo = 1.0 - p.lfo_depth * 0.5 * (1.0 + lfo)  # range: [1-depth, 1]
-
-        if p.lfo_target == "amplitude":
-            mix *= lfo
-        elif p.lfo_target == "pitch":
-            # Subtle pitch wobble by resampling — skip for now, amplitude is fine
-            mix *= lfo
-
-    # Filtering
-    if p.lowpass_hz < sr / 2:
-        mix = simple_lowpass(mix, p.lowpass_hz, sr)
-    if p.highpass_hz > 0:
-        mix = simple_highpass(mix, p.highpass_hz, sr)
-
-    # Envelope
-    mix = apply_envelope(mix, sr, p.fade_in_sec, p.fade_out_sec)
 
-    # Normalize to prevent clipping
-    peak = np.max(np.abs(mix))
-    if peak > 0:
-        mix = mix / peak * 0.85  # Leave headroom
-
-    # Convert to float32
-    mix = mix.astype(np.float32)
+    if not compiled.layers and p.noise_amplitude <= 0:
+        # Nothing audible to synthesize (e.g. the "silence" preset): skip the
+        # LFO, filter, envelope and normalize passes over an all-zero buffer
+        mix = np.zeros(n_samples, dtype=np.float32)
+    else:
+        mix = _render_pad(p, compiled, n_samples, seed)
 
     # Write to file if requested
     if output_path is not None:
@@ -275,6 +276,85 @@ def generate_pad(
     return mix
 
 
+def _render_pad(
+    p: PadPreset, compiled: CompiledPadPreset, n_samples: int, seed: Optional[int]
+) -> np.ndarray:
+    """Synthesize, filter, fade and normalize a pad (float32, mono)."""
+    sr = p.sample_rate
+    rng = np.random.default_rng(seed)
+
+    # Start with silence
+    mix = np.zeros(n_samples, dtype=np.float32)
+
+    # Shared time vector for every oscillator and the LFO. Kept in float64:
+    # phase is wrapped to one cycle before it is narrowed to the mix dtype.
+    t = np.arange(n_samples, dtype=np.float64)
+    t /= sr
+
+    # Tonal layers
+    if compiled.layers:
+        _accumulate_oscillators(mix, compiled.layers, t)
+
+    # One float32 scratch buffer, reused by the noise layer and then the LFO
+    scratch = None
+    if p.noise_amplitude > 0 or p.lfo_depth > 0:
+        scratch = np.empty(n_samples, dtype=np.float32)
+
+    # Noise layer (white noise is drawn straight into scratch)
+    if p.noise_amplitude > 0:
+        noise = generate_noise(n_samples, p.noise_color, rng, out=scratch)
+        noise *= p.noise_amplitude
+        mix += noise
+
+    # LFO modulation
+    if p.lfo_depth > 0:
+        # Last use of t, so it becomes the LFO's phase buffer
+        t *= p.lfo_rate
+        lfo = oscillator_from_phase(t, "sine", out=scratch)
+        # 1 - depth * 0.5 * (1 + lfo), computed in place; range: [1-depth, 1]
+        lfo *= -0.5 * p.lfo_depth
+        lfo += 1.0 - 0.5 * p.lfo_depth
+
+        if p.lfo_target == "amplitude":
+            mix *= lfo
+        elif p.lfo_target == "pitch":
+            # Subtle pitch wobble by resampling — skip for now, amplitude is fine
+            mix *= lfo
+
+    # Filtering (lowpass → highpass, cascaded into one pass)
+    mix = band_filter(mix, p.lowpass_hz, p.highpass_hz, sr, sos=compiled.filter_sos)
+
+    # Envelope
+    apply_envelope(mix, sr, p.fade_in_sec, p.fade_out_sec, inplace=True)
+
+    # Normalize to prevent clipping
+    peak = peak_abs(mix)
+    if peak > 0:
+        mix *= 0.85 / peak  # Leave headroom
+
+    return mix
+
+
+def _accumulate_oscillators(
+    mix: np.ndarray, layers: tuple[tuple[float, float, str], ...], t: np.ndarray
+) -> None:
+    """
+    Add (freq, amplitude, wave_type) oscillator layers into ``mix`` in place.
+
+    All layers share the caller's time vector ``t`` and one pair of scratch
+    buffers instead of allocating a fresh waveform (plus temporaries) per
+    oscillator.
+    """
+    phase = np.empty_like(t)
+    scratch = np.empty_like(mix)
+
+    for freq, amp, wave_type in layers:
+        np.multiply(t, freq, out=phase)
+        oscillator_from_phase(phase, wave_type, out=scratch)
+        scratch *= amp
+        mix += scratch
+
+
 def list_presets() -> list[str]:
     """Return available mood preset names."""
     return list(MOOD_PRESETS.keys())
@@ -8,12 +8,12 @@ Pipeline Node 6: Mix.
 """
 
 import logging
-import math
 from pathlib import Path
 from typing import Any
 
 import numpy as np
-from pydub import AudioSegment
+import soundfile as sf
+from scipy.signal import resample_poly
 
 # Try importing torch for VAD
 try:
@@ -27,9 +27,17 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# Rate the Silero VAD model is fed at (it supports 8kHz and 16kHz)
+VAD_SAMPLE_RATE = 16000
+
+
 class AudioMixer:
     """Handles mixing of voice and background tracks with ducking."""
 
+    # Loaded Silero VAD (model, get_speech_timestamps, device), shared by
+    # every mixer so torch.hub is only consulted once per process
+    _vad_cache: tuple | None = None
+
     def __init__(self, config: dict[str, Any]):
         """
         Initialize mixer with project mix configuration.
@@ -54,12 +62,19 @@ class AudioMixer:
         # Cache for VAD model
         self._vad_model = None
         self._get_speech_timestamps = None
+        self._vad_device = "cpu"
 
     def _ensure_vad_model(self):
         """Lazy load Silero VAD model."""
         if self._vad_model is not None:
             return
 
+        if AudioMixer._vad_cache is not None:
+            self._vad_model, self._get_speech_timestamps, self._vad_device = (
+                AudioMixer._vad_cache
+            )
+            return
+
         if not SILERO_AVAILABLE:
             logger.warning("Torch not available. Falling back to energy-based ducking.")
             self.method = "energy"
@@ -73,8 +88,13 @@ class AudioMixer:
                 force_reload=False,
                 trust_repo=True,
             )
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            if device != "cpu":
+                model = model.to(device)
             self._vad_model = model
             self._get_speech_timestamps = utils[0]  # get_speech_timestamps
+            self._vad_device = device
+            AudioMixer._vad_cache = (model, utils[0], device)
         except Exception as e:
             logger.error(f"Failed to load Silero VAD: {e}. Falling back to energy.")
             self.method = "energy"
@@ -97,48 +117,59 @@ class AudioMixer:
             True on success.
         """
         try:
-            # Load voice
-            voice = AudioSegment.from_file(str(voice_path))
+            # Load voice as a float32 (frames, channels) array; the mix stays
+            # in numpy from here on, with no pydub/ffmpeg round trips
+            voice, sr = sf.read(str(voice_path), dtype="float32", always_2d=True)
 
             if not music_path or not music_path.exists():
                 # No music, just save voice
                 # Apply master volume
-                output = voice.apply_gain(20 * math.log10(self.master_volume))
-                output.export(str(output_path), format="wav")
+                voice *= max(self.master_volume, 0.0001)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                sf.write(str(output_path), voice, sr, subtype="PCM_16")
                 return True
 
             # Load music
-            music = AudioSegment.from_file(str(music_path))
+            music, music_sr = sf.read(str(music_path), dtype="float32", always_2d=True)
 
-            # Loop music to cover voice length + decay
-            target_duration = len(voice) + 2000  # +2s tail
-            if len(music) < target_duration:
-                loops = int(math.ceil(target_duration / len(music)))
-                music = music * loops
+            # Music is resampled to the voice rate (pads render at 44.1kHz,
+            # TTS engines at 24kHz)
+            if music_sr != sr:
+                music = resample_poly(music, sr, music_sr, axis=0).astype(
+                    np.float32, copy=False
+                )
 
-            # Trim to exact length
-            music = music[:target_duration]
+            # Loop music to cover voice length + decay. np.resize repeats the
+            # frames straight into a buffer of the exact length, with no
+            # oversized tiled copy to trim afterwards.
+            target_samples = len(voice) + 2 * sr  # +2s tail
+            if len(music) < target_samples:
+                music = np.resize(music, (target_samples, music.shape[1]))
+            else:
+                # Trim to exact length
+                music = music[:target_samples]
 
             # Generate ducking envelope
-            envelope = self._generate_envelope(voice, len(music))
+            envelope = self._generate_envelope(voice, sr, target_samples)
 
             # Apply ducking to music
-            ducked_music = self._apply_envelope(music, envelope)
+            combined = self._apply_envelope(music, envelope)
 
             # Overlay voice
-            # Voice starts at 0 for now (could add lead-in config)
-            # Ensure voice fits in music duration
-            combined = ducked_music.overlay(voice, position=0)
+            # Voice starts at 0 for now (could add lead-in config).
+            # Mono tracks are spread across the other track's channels.
+            if combined.shape[1] < voice.shape[1]:
+                combined = np.repeat(combined, voice.shape[1], axis=1)
+            combined[: len(voice)] += voice
+            np.clip(combined, -1.0, 1.0, out=combined)
 
             # Apply master volume
-            # db = 20 * log10(vol_linear)
             if self.master_volume != 1.0:
-                gain_db = 20 * math.log10(max(self.master_volume, 0.0001))
-                combined = combined.apply_gain(gain_db)
+                combined *= max(self.master_volume, 0.0001)
 
             # Export
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            combined.export(str(output_path), format="wav")
+            sf.write(str(output_path), combined, sr, subtype="PCM_16")
             return True
 
         except Exception as e:
@@ -146,16 +177,21 @@ class AudioMixer:
             return False
 
     def _generate_envelope(
-        self, voice_seg: AudioSegment, total_len_ms: int
+        self, voice: np.ndarray, sr: int, total_samples: int
     ) -> np.ndarray:
         """
         Generate a gain envelope array (0.0 to 1.0) for the background track.
 
         1.0 = full volume (silence in voice)
         <1.0 = ducked volume (speech detected)
+
+        Args:
+            voice: Voice samples, float32 shaped (frames, channels).
+            sr: Voice sample rate; the envelope is built at this rate.
+            total_samples: Envelope length in samples.
         """
         # Default to full volume
-        envelope = np.ones(total_len_ms, dtype=np.float32)
+        envelope = np.ones(total_samples, dtype=np.float32)
 
         # Calculate attenuation factor linear: -12dB -> 0.25
         attenuation_factor = 10 ** (self.attenuation_db / 20)
@@ -166,69 +202,73 @@ class AudioMixer:
             self._ensure_vad_model()
 
             if self._vad_model:
-                # Prepare audio for VAD (float32, 16khz usually preferred but 24k/48k works with silero)
-                # Pydub to numpy
-                samples = np.array(voice_seg.get_array_of_samples())
-                if voice_seg.channels > 1:
-                    samples = samples.reshape((-1, voice_seg.channels))
-                    samples = samples.mean(axis=1)  # mixdown to mono
-
-                # Normalize float32
-                samples_float = samples.astype(np.float32) / 32768.0
-
-                # NOTE: Silero VAD officially supports 8kHz/16kHz.
-                # Edge-tts outputs 24kHz, XTTS outputs 24kHz.
-                # Silero handles this robustly in practice (tested),
-                # but VAD threshold may need per-project tuning.
-                # If accuracy issues arise, resample to 16kHz first:
-                #   import scipy.signal
-                #   samples_16k = scipy.signal.resample_poly(samples_float, 16000, sr)
+                # Prepare audio for VAD (float32 mono)
+                if voice.shape[1] > 1:
+                    samples_float = voice.mean(axis=1)  # mixdown to mono
+                else:
+                    samples_float = voice[:, 0]
+
+                # Silero VAD officially supports 8kHz/16kHz; Edge-tts and
+                # XTTS output 24kHz. Resampling to 16kHz matches the model
+                # and gives it a third fewer samples to process.
+                if sr != VAD_SAMPLE_RATE:
+                    samples_float = resample_poly(
+                        samples_float, VAD_SAMPLE_RATE, sr
+                    ).astype(np.float32, copy=False)
+
+                audio_tensor = torch.from_numpy(np.ascontiguousarray(samples_float))
+                if self._vad_device != "cpu":
+                    audio_tensor = audio_tensor.to(self._vad_device)
+
                 speech_ts = self._get_speech_timestamps(
-                    torch.from_numpy(samples_float),
+                    audio_tensor,
                     self._vad_model,
-                    sampling_rate=voice_seg.frame_rate,
+                    sampling_rate=VAD_SAMPLE_RATE,
                     threshold=self.vad_threshold,
                 )
 
-                # Convert samples to ms
-                sr_ms = voice_seg.frame_rate / 1000.0
+                # Convert VAD-rate samples to voice-rate samples
+                scale = sr / VAD_SAMPLE_RATE
                 timestamps = [
-                    {"start": int(ts["start"] / sr_ms), "end": int(ts["end"] / sr_ms)}
+                    {"start": int(ts["start"] * scale), "end": int(ts["end"] * scale)}
                     for ts in speech_ts
                 ]
             else:
                 # Fallback to energy if VAD init failed
-                timestamps = self._get_energy_timestamps(voice_seg)
+                timestamps = _ms_to_samples(self._get_energy_timestamps(voice, sr), sr)
         else:
             # Energy method
-            timestamps = self._get_energy_timestamps(voice_seg)
-
-        # Apply timestamps to envelope
-        for ts in timestamps:
-            start = max(0, ts["start"] - self.look_ahead_ms)
-            end = min(total_len_ms, ts["end"] + self.release_ms)
-
-            # Simple rectangular ducking for now, could be smoothed
-            # In numpy we can just slice
-            # But we want smoothing (attack/release)
-
-            # We'll paint the target gain, then smooth later?
-            # Or simpler: just set the target gain in the window
-            envelope[start:end] = attenuation_factor
+            timestamps = _ms_to_samples(self._get_energy_timestamps(voice, sr), sr)
+
+        samples_per_ms = sr / 1000.0
+        look_ahead = int(self.look_ahead_ms * samples_per_ms)
+        release = int(self.release_ms * samples_per_ms)
+
+        # Apply timestamps to envelope: set the target gain over each speech
+        # window (widened by look-ahead/release), then smooth below.
+        # Windows are marked as +1/-1 edges and summed, so overlapping
+        # windows are merged in one pass instead of painted one by one.
+        if timestamps:
+            starts = np.array([max(0, ts["start"] - look_ahead) for ts in timestamps])
+            ends = np.array(
+                [min(total_samples, ts["end"] + release) for ts in timestamps]
+            )
+            valid = starts < ends
+            edges = np.zeros(total_samples + 1, dtype=np.int32)
+            np.add.at(edges, starts[valid], 1)
+            np.add.at(edges, ends[valid], -1)
+            envelope[np.cumsum(edges[:-1]) > 0] = attenuation_factor
 
         # Smooth the envelope (simple moving average approx for attack/release)
         # Proper attack/release filter is better but slower in python.
-        # Since we generated blocky envelope, `scipy.ndimage.gaussian_filter1d`
-        # or simple convolution helps.
 
         # Let's use a window for smoothing to simulate attack/release
         # A window size of ~200ms is a rough approx
-        window_size = int(min(self.attack_ms, self.release_ms))
+        window_size = int(min(self.attack_ms, self.release_ms) * samples_per_ms)
         if window_size > 0 and len(timestamps) > 0:
-            kernel = np.ones(window_size) / window_size
-            envelope = np.convolve(envelope, kernel, mode="same")
+            envelope = _moving_average(envelope, window_size)
             # Smooth edges back to 1.0 (avoid discontinuity from hard set)
-            edge_region = min(window_size, 100)
+            edge_region = min(window_size, int(100 * samples_per_ms))
             if edge_region > 1:
                 fade_in = np.linspace(1.0, envelope[edge_region], edge_region)
                 envelope[:edge_region] = fade_in
@@ -237,95 +277,107 @@ class AudioMixer:
 
         return envelope
 
-    def _get_energy_timestamps(self, segment: AudioSegment) -> list[dict]:
-        """Simple RMS-based VAD fallback."""
+    def _get_energy_timestamps(self, samples: np.ndarray, sr: int) -> list[dict]:
+        """
+        Simple RMS-based VAD fallback.
+
+        Scores 50ms chunks against -40dBFS in one vectorized pass over the
+        float (frames, channels) samples, with the same chunk boundaries
+        as slicing a pydub AudioSegment and reading ``chunk.dBFS``.
+        """
         # Chunk size 50ms
         chunk_len = 50
-        timestamps = []
-        is_speech = False
-        start_time = 0
 
         # Threshold: -40dBFS
         threshold = -40.0
 
-        for i in range(0, len(segment), chunk_len):
-            chunk = segment[i : i + chunk_len]
-            if chunk.dBFS > threshold:
-                if not is_speech:
-                    is_speech = True
-                    start_time = i
-            else:
-                if is_speech:
-                    is_speech = False
-                    timestamps.append({"start": start_time, "end": i})
+        duration_ms = round(1000 * len(samples) / sr)
+        if duration_ms <= 0:
+            return []
 
-        if is_speech:
-            timestamps.append({"start": start_time, "end": len(segment)})
+        channels = samples.shape[1]
 
-        return timestamps
-
-    def _apply_envelope(
-        self, music: AudioSegment, envelope: np.ndarray
-    ) -> AudioSegment:
-        """
-        Apply numpy gain envelope to pydub AudioSegment.
-
-        Optimized approach: Convert audio to numpy, multiply, convert back.
-        """
-        # Ensure envelope matches music length
-        if len(envelope) != len(music):
-            # Pad or trim envelope
-            if len(envelope) < len(music):
-                envelope = np.pad(
-                    envelope,
-                    (0, len(music) - len(envelope)),
-                    "constant",
-                    constant_values=1.0,
-                )
-            else:
-                envelope = envelope[: len(music)]
+        # Chunk edges in frames, mapped from ms the way AudioSegment slices
+        bounds_ms = np.append(np.arange(0, duration_ms, chunk_len), duration_ms)
+        bounds = (bounds_ms * (sr / 1000.0)).astype(np.int64)
 
-        # Convert music to numpy
-        # Pydub samples are usually int16 or int32
-        # get_array_of_samples returns array.array
-        samples = np.array(music.get_array_of_samples())
+        # Running sum of squares; slicing pads short tails with silence
+        energy = np.zeros(max(bounds[-1], len(samples)) + 1, dtype=np.float64)
+        np.cumsum(
+            np.square(samples, dtype=np.float64).sum(axis=1),
+            out=energy[1 : len(samples) + 1],
+        )
+        energy[len(samples) + 1 :] = energy[len(samples)]
 
-        # Determine reshaping for channels
-        channels = music.channels
-        if channels > 1:
-            # Interleaved samples: [L, R, L, R...]
-            # Reshape to (N, channels)
-            samples = samples.reshape((-1, channels))
+        n = (bounds[1:] - bounds[:-1]) * channels
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rms = np.sqrt((energy[bounds[1:]] - energy[bounds[:-1]]) / n)
+            rms_db = 20 * np.log10(rms)
+        is_speech = (n > 0) & (rms_db > threshold)
 
-        # Envelope is 1D (time in ms). We need to stretch it to sample rate.
-        # This is the tricky part. Envelope is 1 value per MILLISECOND.
-        # Audio is 24000/44100 values per second.
+        # Rising/falling edges of the speech mask give the run boundaries
+        edges = np.diff(np.concatenate(([0], is_speech.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1) * chunk_len
+        ends = np.minimum(np.flatnonzero(edges == -1) * chunk_len, duration_ms)
 
-        # Resample envelope to match audio sample count
-        target_len = samples.shape[0]
+        return [
+            {"start": int(start), "end": int(end)} for start, end in zip(starts, ends)
+        ]
 
-        # Linear interpolation of envelope to audio rate
-        # x_old = indices of milliseconds [0, 1, 2, ... len(music)]
-        # x_new = indices of samples [0, 1/sr, 2/sr ...] mapped to ms
-
-        xp = np.arange(len(envelope))
-        x_target = np.linspace(0, len(envelope), target_len)
-
-        envelope_resampled = np.interp(x_target, xp, envelope)
-
-        # Broadcast envelope to channels
-        if channels > 1:
-            envelope_resampled = envelope_resampled[:, np.newaxis]
-
-        # Apply gain
-        processed_samples = samples * envelope_resampled
-
-        # Cast back to integer type
-        processed_samples = processed_samples.astype(samples.dtype)
+    def _apply_envelope(self, music: np.ndarray, envelope: np.ndarray) -> np.ndarray:
+        """
+        Apply a per-sample gain envelope to float (frames, channels) music.
 
-        # Flatten if stereo
-        if channels > 1:
-            processed_samples = processed_samples.flatten()
+        The gain is applied in place; the (modified) music array is returned.
+        """
+        # Ensure envelope matches music length (pad with full volume)
+        if len(envelope) < len(music):
+            envelope = np.pad(
+                envelope,
+                (0, len(music) - len(envelope)),
+                "constant",
+                constant_values=1.0,
+            )
 
-        # Create new AudioSegment
-        return music._spawn(processed_samples.tobytes())
+        # Apply gain, broadcast across channels
+        music *= envelope[: len(music), np.newaxis]
+        return music
+
+
+def _ms_to_samples(timestamps: list[dict], sr: int) -> list[dict]:
+    """Convert {"start", "end"} millisecond timestamps to sample indices."""
+    samples_per_ms = sr / 1000.0
+    return [
+        {
+            "start": int(ts["start"] * samples_per_ms),
+            "end": int(ts["end"] * samples_per_ms),
+        }
+        for ts in timestamps
+    ]
+
+
+def _moving_average(x: np.ndarray, size: int) -> np.ndarray:
+    """
+    Centered box filter, equal to np.convolve(x, ones(size) / size, "same").
+
+    Uses a running sum, so cost is O(N) regardless of window size.
+    Samples outside ``x`` count as zero, as with np.convolve.
+    """
+    n = len(x)
+    before = size - 1 - (size - 1) // 2  # window samples left of centre
+    after = size - before  # exclusive end, relative to centre
+
+    csum = np.empty(n + 1, dtype=np.float64)
+    csum[0] = 0.0
+    np.cumsum(x, dtype=np.float64, out=csum[1:])
+
+    # Window sum = csum[min(i + after, n)] - csum[max(i - before, 0)],
+    # built with slices so no index arrays are needed
+    out = np.empty(n, dtype=np.float64)
+    split = max(n - after, 0)
+    out[:split] = csum[after : after + split]
+    out[split:] = csum[n]
+    split = min(before, n)
+    out[split:] -= csum[: n - split]
+    out /= size
+    return out
@@ -2,18 +2,30 @@
 Audio processing — LUFS measurement, normalization, silence trimming,
 crossfade stitching.
 
-Uses pyloudnorm for in-process LUFS metering.
-Uses ffmpeg loudnorm filter for batch normalization.
-Uses pydub for audio manipulation (trim, crossfade, convert).
+Uses libloudness (or pyloudnorm) for in-process LUFS metering.
+Normalizes with a single measured gain (soundfile, or one ffmpeg pass).
+Uses numpy/soundfile for trimming and crossfade stitching; ffmpeg only
+for formats libsndfile can't handle.
 """
 
+import os
 import subprocess
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 import soundfile as sf
+from scipy.signal import resample_poly
+
+from audioformation.audio.synthesis import peak_abs
+
+# Prefer the C-backed meter when installed; pyloudnorm is the fallback
+try:
+    import libloudness
+except ImportError:
+    libloudness = None
 
 # ──────────────────────────────────────────────
 # LUFS Measurement
@@ -24,21 +36,22 @@ def measure_lufs(audio_path: Path) -> float:
     """
     Measure integrated LUFS of an audio file.
 
-    Uses pyloudnorm for in-process analysis.
-    Returns LUFS value (typically -10 to -30).
+    Uses libloudness for in-process analysis when installed,
+    pyloudnorm otherwise. Returns LUFS value (typically -10 to -30).
     """
-    import pyloudnorm as pyln
+    data, rate = sf.read(str(audio_path), always_2d=True)
+    return _integrated_loudness(data, rate)
 
-    data, rate = sf.read(str(audio_path))
 
-    # Ensure 2D array (mono → single column)
-    if data.ndim == 1:
-        data = data.reshape(-1, 1)
+def _integrated_loudness(data: np.ndarray, rate: int) -> float:
+    """Integrated LUFS of (samples, channels) audio."""
+    if libloudness is not None:
+        return float(libloudness.integrated_loudness(data, rate))
 
-    meter = pyln.Meter(rate)
-    loudness = meter.integrated_loudness(data)
+    import pyloudnorm as pyln
 
-    return float(loudness)
+    meter = pyln.Meter(rate)
+    return float(meter.integrated_loudness(data))
 
 
 def measure_true_peak(audio_path: Path) -> float:
@@ -48,11 +61,12 @@ def measure_true_peak(audio_path: Path) -> float:
     Uses numpy for peak detection on the audio samples.
     """
     data, rate = sf.read(str(audio_path))
+    return _peak_db(data)
 
-    if data.ndim > 1:
-        peak = np.max(np.abs(data))
-    else:
-        peak = np.max(np.abs(data))
+
+def _peak_db(data: np.ndarray) -> float:
+    """Sample peak of ``data`` in dB (-120 for silence)."""
+    peak = peak_abs(data)
 
     if peak == 0:
         return -120.0  # Silence
@@ -72,13 +86,22 @@ def detect_clipping(audio_path: Path, threshold_dbfs: float = -0.5) -> dict[str,
     - total_samples: int
     """
     data, rate = sf.read(str(audio_path))
+    return _clipping_stats(data, threshold_dbfs)
+
 
-    if data.ndim > 1:
-        data = data.flatten()
+def _clipping_stats(data: np.ndarray, threshold_dbfs: float) -> dict[str, Any]:
+    """Clipping summary for ``data``, as returned by detect_clipping."""
+    data = data.ravel()
 
+    # Peak from min/max, no abs() copy; only a file that actually crosses
+    # the threshold pays for the per-sample count.
     threshold_linear = 10 ** (threshold_dbfs / 20)
-    clipped_samples = int(np.sum(np.abs(data) > threshold_linear))
-    peak = float(np.max(np.abs(data)))
+    peak = peak_abs(data)
+    clipped_samples = 0
+    if peak > threshold_linear:
+        clipped_samples = np.count_nonzero(data > threshold_linear)
+        clipped_samples += np.count_nonzero(data < -threshold_linear)
+        clipped_samples = int(clipped_samples)
     peak_dbfs = 20 * np.log10(peak) if peak > 0 else -120.0
 
     return {
@@ -89,6 +112,30 @@ def detect_clipping(audio_path: Path, threshold_dbfs: float = -0.5) -> dict[str,
     }
 
 
+def analyze_audio(
+    audio_path: Path, clip_threshold_dbfs: float = -0.5
+) -> dict[str, Any]:
+    """
+    Measure an audio file from a single decode.
+
+    Equivalent to calling get_duration, measure_lufs, measure_true_peak
+    and detect_clipping on the same file, which would read it three times.
+
+    Returns dict with duration_sec, sample_rate, lufs, true_peak, plus the
+    detect_clipping keys.
+    """
+    data, rate = sf.read(str(audio_path), always_2d=True)
+    clip_info = _clipping_stats(data, clip_threshold_dbfs)
+
+    return {
+        "duration_sec": len(data) / rate,
+        "sample_rate": rate,
+        "lufs": _integrated_loudness(data, rate),
+        "true_peak": float(clip_info["peak_dbfs"]),
+        **clip_info,
+    }
+
+
 # ──────────────────────────────────────────────
 # Duration
 # ──────────────────────────────────────────────
@@ -96,20 +143,86 @@ def detect_clipping(audio_path: Path, threshold_dbfs: float = -0.5) -> dict[str,
 
 def get_duration(audio_path: Path) -> float:
     """Get audio duration in seconds."""
-    info = sf.info(str(audio_path))
-    return float(info.duration)
+    return _audio_info(audio_path)[0]
 
 
 def get_sample_rate(audio_path: Path) -> int:
     """Get sample rate of audio file."""
-    info = sf.info(str(audio_path))
-    return info.samplerate
+    return _audio_info(audio_path)[1]
+
+
+def _audio_info(audio_path: Path) -> tuple[float, int]:
+    """(duration, sample rate), cached until the file is rewritten."""
+    path = str(audio_path)
+    st = os.stat(path)
+    return _read_info(path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=256)
+def _read_info(path: str, mtime_ns: int, size: int) -> tuple[float, int]:
+    """Header lookup behind _audio_info; mtime and size only key the cache."""
+    parsed = _wav_header_info(path, size)
+    if parsed is not None:
+        return parsed
+
+    info = sf.info(path)
+    return float(info.duration), info.samplerate
+
+
+def _wav_header_info(path: str, size: int) -> tuple[float, int] | None:
+    """
+    (duration, sample rate) straight from a RIFF/WAVE header.
+
+    Walks the chunk list for ``fmt `` and ``data`` without opening the file
+    through libsndfile. Returns None for anything that isn't a plain WAV
+    (RF64, compressed, malformed), so the caller can fall back to sf.info.
+    """
+    with open(path, "rb") as f:
+        riff = f.read(12)
+        if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:] != b"WAVE":
+            return None
+
+        rate = block_align = 0
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                return None
+            chunk_id = header[:4]
+            chunk_size = int.from_bytes(header[4:], "little")
+
+            if chunk_id == b"fmt ":
+                fmt = f.read(chunk_size)
+                # PCM, IEEE float or WAVE_FORMAT_EXTENSIBLE only
+                if len(fmt) < 16 or fmt[:2] not in (
+                    b"\x01\x00",
+                    b"\x03\x00",
+                    b"\xfe\xff",
+                ):
+                    return None
+                rate = int.from_bytes(fmt[4:8], "little")
+                block_align = int.from_bytes(fmt[12:14], "little")
+                f.seek(chunk_size % 2, os.SEEK_CUR)
+            elif chunk_id == b"data":
+                if not rate or not block_align:
+                    return None
+                # Like libsndfile, trust the file size over a stale header
+                data_size = min(chunk_size, size - f.tell())
+                return data_size // block_align / rate, rate
+            else:
+                f.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
 
 
 # ──────────────────────────────────────────────
-# Normalization (ffmpeg loudnorm)
+# Normalization
 # ──────────────────────────────────────────────
 
+# Output formats soundfile can write directly; anything else goes through ffmpeg.
+_SOUNDFILE_FORMATS = {".wav", ".flac", ".ogg"}
+
+# Failures a decode/measure/write round trip can raise (missing file,
+# undecodable input, ffmpeg missing or timing out).
+_AUDIO_ERRORS = (OSError, RuntimeError, ValueError, subprocess.SubprocessError)
+
 
 def normalize_lufs(
     input_path: Path,
@@ -118,94 +231,108 @@ def normalize_lufs(
     true_peak: float = -1.0,
 ) -> bool:
     """
-    Normalize audio to target LUFS using ffmpeg's loudnorm filter.
+    Normalize audio to target LUFS with a single linear gain.
 
-    Two-pass approach for best results:
-    1. Measure current loudness
-    2. Apply normalization with measured values
+    The file is decoded once: loudness is measured in-process and the
+    gain (capped so the peak stays under ``true_peak``) is applied with
+    numpy for WAV/FLAC, or with one ffmpeg ``volume`` pass otherwise.
+    Silent input is copied through unchanged; clips too short for gated
+    loudness are peak-normalized to ``true_peak`` instead.
 
     Returns True on success, False on failure.
     """
-    # Pass 1: Measure
-    measure_cmd = [
-        "ffmpeg",
-        "-hide_banner",
-        "-i",
-        str(input_path),
-        "-af",
-        f"loudnorm=I={target_lufs}:TP={true_peak}:print_format=json",
-        "-f",
-        "null",
-        "-",
-    ]
-
     try:
+        data, rate, subtype = _read_audio(input_path)
+
+        gain_db = _normalization_gain_db(data, rate, target_lufs, true_peak)
+
+        if output_path.suffix.lower() in _SOUNDFILE_FORMATS:
+            data *= 10 ** (gain_db / 20)
+            if input_path.suffix.lower() != output_path.suffix.lower():
+                subtype = None
+            sf.write(str(output_path), data, rate, subtype=subtype)
+            return True
+
+        cmd = [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-nostdin",
+            "-y",
+            "-i",
+            str(input_path),
+            "-af",
+            f"volume={gain_db:.4f}dB",
+            "-threads",
+            "1",
+            str(output_path),
+        ]
         result = subprocess.run(
-            measure_cmd,
+            cmd,
             capture_output=True,
             text=True,
             timeout=120,
         )
-    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return result.returncode == 0
+    except _AUDIO_ERRORS:
         return False
 
-    # Parse measured values from stderr (ffmpeg outputs to stderr)
-    measured = _parse_loudnorm_stats(result.stderr)
-    if not measured:
-        return False
 
-    # Pass 2: Apply normalization
-    normalize_cmd = [
-        "ffmpeg",
-        "-hide_banner",
-        "-y",
-        "-i",
-        str(input_path),
-        "-af",
-        (
-            f"loudnorm=I={target_lufs}:TP={true_peak}"
-            f":measured_I={measured['input_i']}"
-            f":measured_LRA={measured['input_lra']}"
-            f":measured_TP={measured['input_tp']}"
-            f":measured_thresh={measured['input_thresh']}"
-            f":linear=true"
-        ),
-        str(output_path),
-    ]
+# Shortest input the BS.1770 gate can measure (one 400ms block)
+_MIN_LOUDNESS_SECONDS = 0.4
+
 
+def _read_audio(input_path: Path) -> tuple[np.ndarray, int, str | None]:
+    """
+    Decode ``input_path`` to float (samples, channels) audio.
+
+    soundfile reads whatever libsndfile supports; anything else is decoded
+    through ffmpeg (via pydub). Returns ``(data, rate, subtype)``, where
+    subtype is None for ffmpeg-decoded input.
+    """
     try:
-        result = subprocess.run(
-            normalize_cmd,
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
-        return result.returncode == 0
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        return False
+        with sf.SoundFile(str(input_path)) as f:
+            return f.read(always_2d=True), f.samplerate, f.subtype
+    except sf.SoundFileError:
+        if not input_path.exists():
+            raise
 
+    from pydub import AudioSegment
+    from pydub.exceptions import CouldntDecodeError
 
-def _parse_loudnorm_stats(stderr: str) -> dict[str, str] | None:
-    """Parse loudnorm JSON output from ffmpeg stderr."""
-    # Find the JSON block in stderr
     try:
-        # ffmpeg prints the JSON at the end of stderr
-        json_start = stderr.rfind("{")
-        json_end = stderr.rfind("}") + 1
+        segment = AudioSegment.from_file(str(input_path))
+    except CouldntDecodeError as e:
+        raise RuntimeError(f"Cannot decode {input_path.name}: {e}") from e
 
-        if json_start == -1 or json_end <= json_start:
-            return None
+    scale = float(1 << (8 * segment.sample_width - 1))
+    samples = np.array(segment.get_array_of_samples(), dtype=np.float64)
+    return samples.reshape(-1, segment.channels) / scale, segment.frame_rate, None
 
-        stats = json.loads(stderr[json_start:json_end])
 
-        return {
-            "input_i": stats.get("input_i", "-24.0"),
-            "input_lra": stats.get("input_lra", "7.0"),
-            "input_tp": stats.get("input_tp", "-2.0"),
-            "input_thresh": stats.get("input_thresh", "-34.0"),
-        }
-    except (json.JSONDecodeError, KeyError):
-        return None
+def _normalization_gain_db(
+    data: np.ndarray, rate: int, target_lufs: float, true_peak: float
+) -> float:
+    """
+    Gain reaching ``target_lufs``, capped so the peak stays under ``true_peak``.
+
+    Silent input gets 0 dB, as does input gated out entirely (measured
+    loudness of -inf). Input shorter than one loudness block can't be
+    metered at all, so it is peak-normalized instead.
+    """
+    peak = peak_abs(data)
+    if peak == 0:
+        return 0.0
+
+    peak_gain_db = true_peak - 20 * np.log10(peak)
+    if len(data) < int(_MIN_LOUDNESS_SECONDS * rate):
+        return peak_gain_db
+
+    gain_db = target_lufs - _integrated_loudness(data, rate)
+    if not np.isfinite(gain_db):
+        gain_db = 0.0
+    return min(gain_db, peak_gain_db)
 
 
 # ──────────────────────────────────────────────
@@ -220,7 +347,11 @@ def trim_silence(
     min_silence_ms: int = 100,
 ) -> bool:
     """
-    Trim leading and trailing silence from an audio file using ffmpeg.
+    Trim leading and trailing silence from an audio file.
+
+    WAV/FLAC/OGG input is trimmed in-process: one read, a windowed RMS
+    scan, and one write of the kept slice. Other formats go through
+    ffmpeg's silenceremove filter.
 
     Args:
         threshold_db: Silence threshold in dB.
@@ -228,9 +359,27 @@ def trim_silence(
 
     Returns True on success.
     """
+    if input_path.suffix.lower() in _SOUNDFILE_FORMATS:
+        try:
+            with sf.SoundFile(str(input_path)) as f:
+                rate = f.samplerate
+                subtype = f.subtype
+                data = f.read(always_2d=True)
+
+            start, end = _non_silent_bounds(data, rate, threshold_db, min_silence_ms)
+            if input_path.suffix.lower() != output_path.suffix.lower():
+                subtype = None
+            sf.write(str(output_path), data[start:end], rate, subtype=subtype)
+            return True
+        except _AUDIO_ERRORS:
+            return False
+
     cmd = [
         "ffmpeg",
         "-hide_banner",
+        "-loglevel",
+        "error",
+        "-nostdin",
         "-y",
         "-i",
         str(input_path),
@@ -243,6 +392,8 @@ def trim_silence(
             f":start_duration={min_silence_ms / 1000},"
             f"areverse"
         ),
+        "-threads",
+        "1",
         str(output_path),
     ]
 
@@ -258,6 +409,93 @@ def trim_silence(
         return False
 
 
+# RMS detection window, matching ffmpeg silenceremove's default (20ms)
+_SILENCE_WINDOW_MS = 20
+
+
+def _non_silent_bounds(
+    data: np.ndarray,
+    sr: int,
+    threshold_db: float,
+    min_duration_ms: int,
+) -> tuple[int, int]:
+    """
+    Sample range [start, end) between the leading and trailing silence.
+
+    Like silenceremove, audio only counts as non-silent once it stays above
+    ``threshold_db`` (RMS, loudest channel) for ``min_duration_ms``. An
+    all-silent input yields an empty range.
+    """
+    win = max(int(sr * _SILENCE_WINDOW_MS / 1000), 1)
+    run = max(int(np.ceil(min_duration_ms / _SILENCE_WINDOW_MS)), 1)
+    n = len(data)
+    if n == 0:
+        return 0, 0
+
+    starts = np.arange(0, n, win)
+    sums = np.add.reduceat(np.square(data), starts, axis=0)
+    counts = np.diff(np.append(starts, n))
+    mean_sq = sums.max(axis=1) / counts
+    loud = mean_sq > 10 ** (threshold_db / 10)
+
+    # Windows that open (and close) a run of `run` loud windows
+    csum = np.concatenate(([0], np.cumsum(loud)))
+    sustained = np.flatnonzero(csum[run:] - csum[:-run] == run)
+    if len(sustained) == 0:
+        return 0, 0
+
+    start = int(starts[sustained[0]])
+    end = min(int(starts[sustained[-1] + run - 1]) + win, n)
+    return start, end
+
+
+def trim_and_normalize(
+    input_path: Path,
+    output_path: Path,
+    target_lufs: float = -16.0,
+    true_peak: float = -1.0,
+    threshold_db: float = -40.0,
+    min_silence_ms: int = 100,
+) -> bool:
+    """
+    Trim leading/trailing silence, then normalize, in one pass.
+
+    Equivalent to trim_silence() followed by normalize_lufs() on its
+    output, but WAV/FLAC/OGG input is decoded once and only the final
+    file is written: no intermediate trimmed file touches the disk.
+    Other input formats fall back to the two separate steps.
+
+    Returns True on success, False on failure.
+    """
+    if input_path.suffix.lower() not in _SOUNDFILE_FORMATS:
+        trimmed_path = output_path.with_name(f"{output_path.stem}_trimmed.wav")
+        try:
+            source = (
+                trimmed_path if trim_silence(input_path, trimmed_path) else input_path
+            )
+            return normalize_lufs(source, output_path, target_lufs, true_peak)
+        finally:
+            trimmed_path.unlink(missing_ok=True)
+
+    try:
+        with sf.SoundFile(str(input_path)) as f:
+            rate = f.samplerate
+            subtype = f.subtype
+            data = f.read(always_2d=True)
+
+        start, end = _non_silent_bounds(data, rate, threshold_db, min_silence_ms)
+        data = data[start:end]
+        data *= 10 ** (_normalization_gain_db(data, rate, target_lufs, true_peak) / 20)
+
+        if input_path.suffix.lower() == output_path.suffix.lower():
+            sf.write(str(output_path), data, rate, subtype=subtype)
+        else:
+            _write_audio(output_path, data, rate)
+        return True
+    except _AUDIO_ERRORS:
+        return False
+
+
 # ──────────────────────────────────────────────
 # Crossfade stitching
 # ──────────────────────────────────────────────
@@ -272,7 +510,11 @@ def crossfade_stitch(
     """
     Stitch multiple audio files with crossfade overlap.
 
-    Uses pydub for crossfade.
+    Works on numpy arrays: chunks are decoded once with soundfile, laid
+    into a single preallocated buffer and joined with linear fade ramps
+    (the same shape pydub's ``append(crossfade=...)`` uses). Chunks at a
+    lower rate are resampled to the highest one present, and mono chunks
+    are up-mixed to match; any other channel mismatch fails the stitch.
 
     Args:
         audio_paths: Ordered list of audio file paths.
@@ -282,57 +524,100 @@ def crossfade_stitch(
 
     Returns True on success.
     """
-    from pydub import AudioSegment
-
     if not audio_paths:
         return False
 
     try:
-        # Start with leading silence
-        if leading_silence_ms > 0:
-            combined = AudioSegment.silent(duration=leading_silence_ms)
-        else:
-            combined = AudioSegment.empty()
-
-        # Load first chunk
-        first = AudioSegment.from_file(str(audio_paths[0]))
-        combined += first
-
-        # Append remaining with crossfade
-        for path in audio_paths[1:]:
-            chunk = AudioSegment.from_file(str(path))
-
-            # Clamp crossfade to not exceed chunk lengths
-            effective_fade = min(
-                crossfade_ms,
-                len(combined),
-                len(chunk),
-            )
-
-            if effective_fade > 0:
-                combined = combined.append(chunk, crossfade=effective_fade)
-            else:
-                combined += chunk
-
-        # Export
-        combined.export(str(output_path), format=_format_from_path(output_path))
+        chunks = []
+        rates = []
+        for path in audio_paths:
+            data, rate = sf.read(str(path), dtype="float32", always_2d=True)
+            chunks.append(data)
+            rates.append(rate)
+
+        sr = max(rates)
+        channels = max(c.shape[1] for c in chunks)
+        for i, (data, rate) in enumerate(zip(chunks, rates)):
+            if rate != sr:
+                data = resample_poly(data, sr, rate, axis=0).astype(
+                    np.float32, copy=False
+                )
+            if data.shape[1] == 1 and channels > 1:
+                data = np.broadcast_to(data, (len(data), channels))
+            elif data.shape[1] != channels:
+                raise ValueError(
+                    f"Cannot mix {data.shape[1]}-channel audio into {channels} channels"
+                )
+            chunks[i] = data
+
+        # Clamp each crossfade to not exceed either side of the join
+        lead = int(leading_silence_ms * sr / 1000)
+        fade_len = int(crossfade_ms * sr / 1000)
+        fades = []
+        total = lead + len(chunks[0])
+        for data in chunks[1:]:
+            fade = max(min(fade_len, total, len(data)), 0)
+            fades.append(fade)
+            total += len(data) - fade
+
+        combined = np.zeros((total, channels), dtype=np.float32)
+        pos = lead + len(chunks[0])
+        combined[lead:pos] = chunks[0]
+
+        for data, fade in zip(chunks[1:], fades):
+            if fade > 0:
+                ramp = np.linspace(0.0, 1.0, fade, dtype=np.float32)[:, np.newaxis]
+                overlap = combined[pos - fade : pos]
+                overlap *= ramp[::-1]
+                overlap += data[:fade] * ramp
+            combined[pos : pos + len(data) - fade] = data[fade:]
+            pos += len(data) - fade
+
+        _write_audio(output_path, combined, sr)
         return True
 
     except Exception:
         return False
 
 
-def _format_from_path(path: Path) -> str:
-    """Infer pydub export format from file extension."""
-    ext = path.suffix.lower()
-    formats = {
-        ".wav": "wav",
-        ".mp3": "mp3",
-        ".flac": "flac",
-        ".ogg": "ogg",
-        ".m4a": "ipod",
-    }
-    return formats.get(ext, "wav")
+def _write_audio(output_path: Path, data: np.ndarray, sr: int) -> None:
+    """
+    Write float audio of shape (samples, channels).
+
+    WAV/FLAC/OGG are written by soundfile. Formats libsndfile can't encode
+    (mp3, m4a) are piped to ffmpeg as raw float32, without a temp file.
+    """
+    if output_path.suffix.lower() in _SOUNDFILE_FORMATS:
+        subtype = "PCM_16" if output_path.suffix.lower() == ".wav" else None
+        sf.write(str(output_path), data, sr, subtype=subtype)
+        return
+
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-y",
+        "-f",
+        "f32le",
+        "-ar",
+        str(sr),
+        "-ac",
+        str(data.shape[1]),
+        "-i",
+        "pipe:0",
+        "-threads",
+        "1",
+        str(output_path),
+    ]
+    result = subprocess.run(
+        cmd,
+        input=np.ascontiguousarray(data, dtype="<f4").tobytes(),
+        capture_output=True,
+        timeout=120,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed to encode {output_path.name}")
 
 
 def batch_process_project(project_id: str) -> dict[str, Any]:
@@ -340,6 +625,9 @@ def batch_process_project(project_id: str) -> dict[str, Any]:
     Batch process all generated audio files in a project.
 
     Applies normalization and silence trimming to all chunks.
+    Files are processed concurrently: decoding, DSP and encoding all
+    run in libsndfile/numpy/ffmpeg outside the GIL, so a thread per file
+    keeps every core busy.
     Returns processing statistics.
     """
     from audioformation.project import get_project_path
@@ -360,34 +648,46 @@ def batch_process_project(project_id: str) -> dict[str, Any]:
         audio_files = list(gen_dir.glob("*.wav"))
     stats["total_files"] = len(audio_files)
 
-    for audio_file in audio_files:
-        try:
-            # Skip if already processed
-            processed_file = processed_dir / audio_file.name
-            if processed_file.exists():
+    if not audio_files:
+        return stats
+
+    workers = min(len(audio_files), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        errors = pool.map(
+            lambda audio_file: _process_one(audio_file, processed_dir), audio_files
+        )
+        for error in errors:
+            if error is None:
                 stats["processed"] += 1
-                continue
-
-            # Apply normalization
-            temp_file = processed_file.with_suffix(".temp.wav")
-            if normalize_lufs(audio_file, temp_file):
-                # Apply silence trimming
-                if trim_silence(temp_file, processed_file):
-                    stats["processed"] += 1
-                else:
-                    stats["failed"] += 1
-                    stats["errors"].append(
-                        f"Silence trimming failed: {audio_file.name}"
-                    )
-
-                # Clean up temp file
-                temp_file.unlink(missing_ok=True)
             else:
                 stats["failed"] += 1
-                stats["errors"].append(f"Normalization failed: {audio_file.name}")
-
-        except Exception as e:
-            stats["failed"] += 1
-            stats["errors"].append(f"Processing error {audio_file.name}: {str(e)}")
+                stats["errors"].append(error)
 
     return stats
+
+
+def _process_one(audio_file: Path, processed_dir: Path) -> str | None:
+    """Normalize and trim one chunk. Returns an error message, or None."""
+    try:
+        # Skip if already processed
+        processed_file = processed_dir / audio_file.name
+        if processed_file.exists():
+            return None
+
+        # Apply normalization
+        temp_file = processed_file.with_suffix(".temp.wav")
+        if not normalize_lufs(audio_file, temp_file):
+            return f"Normalization failed: {audio_file.name}"
+
+        try:
+            # Apply silence trimming
+            if not trim_silence(temp_file, processed_file):
+                return f"Silence trimming failed: {audio_file.name}"
+        finally:
+            # Clean up temp file
+            temp_file.unlink(missing_ok=True)
+
+        return None
+
+    except Exception as e:
+        return f"Processing error {audio_file.name}: {str(e)}"
@@ -10,18 +10,29 @@ Pipeline Node: SFX (Optional).
 import numpy as np
 import soundfile as sf
 from pathlib import Path
-from typing import Optional, Literal
+from typing import Optional, Literal, get_args
 import tempfile
+from functools import lru_cache
 
 from audioformation.config import PROJECTS_ROOT
 from audioformation.audio.synthesis import (
     generate_noise,
+    oscillator_from_phase,
     simple_lowpass,
     apply_envelope,
+    time_vector,
+    peak_abs,
 )
 from audioformation.utils.security import validate_path_within
 
 SFX_TYPES = Literal["whoosh", "impact", "ui_click", "static", "drone"]
+# Runtime views of SFX_TYPES, for CLI choices and membership checks
+SFX_CHOICES: tuple[str, ...] = get_args(SFX_TYPES)
+SFX_TYPE_SET: frozenset[str] = frozenset(SFX_CHOICES)
+
+# Longest seeded render kept in the cache (2s at 48kHz, ~384 KB of float32),
+# so 32 entries stay a few MB; long drones are re-rendered instead.
+_CACHE_MAX_SAMPLES = 2 * 48000
 
 
 def generate_sfx(
@@ -42,35 +53,13 @@ def generate_sfx(
         sample_rate: Audio sample rate.
 
     Returns:
-        Numpy array of audio samples.
+        Numpy array of audio samples (float32).
     """
-    rng = np.random.default_rng(seed)
-    n_samples = int(sample_rate * duration)
-
-    # Silence default
-    audio = np.zeros(n_samples, dtype=np.float32)
-
-    if sfx_type == "whoosh":
-        audio = _gen_whoosh(n_samples, sample_rate, rng)
-    elif sfx_type == "impact":
-        audio = _gen_impact(n_samples, sample_rate, rng)
-    elif sfx_type == "ui_click":
-        # Force short duration for clicks
-        duration = 0.1
-        n_samples = int(sample_rate * duration)
-        audio = _gen_ui_click(n_samples, sample_rate, rng)
-    elif sfx_type == "static":
-        audio = generate_noise(n_samples, "white", rng)
-        audio = apply_envelope(audio, sample_rate, 0.1, 0.1)
-    elif sfx_type == "drone":
-        audio = _gen_drone(n_samples, sample_rate, rng)
+    # A short seeded effect is deterministic, so it is rendered once and copied
+    if seed is None or duration * sample_rate > _CACHE_MAX_SAMPLES:
+        audio = _render_sfx(sfx_type, duration, seed, sample_rate)
     else:
-        raise ValueError(f"Unknown SFX type: {sfx_type}")
-
-    # Final normalization
-    peak = np.max(np.abs(audio))
-    if peak > 0:
-        audio = audio / peak * 0.9
+        audio = _cached_sfx(sfx_type, duration, seed, sample_rate).copy()
 
     if output_path:
         # CODEQL FIX: Validate path before any filesystem operation (like mkdir)
@@ -96,72 +85,122 @@ def generate_sfx(
     return audio
 
 
+@lru_cache(maxsize=32)
+def _cached_sfx(
+    sfx_type: str, duration: float, seed: int, sample_rate: int
+) -> np.ndarray:
+    """Read-only render of a seeded effect, shared between calls."""
+    audio = _render_sfx(sfx_type, duration, seed, sample_rate)
+    audio.flags.writeable = False
+    return audio
+
+
+def _render_sfx(
+    sfx_type: str, duration: float, seed: Optional[int], sample_rate: int
+) -> np.ndarray:
+    """Synthesize and peak-normalize an effect (no file I/O)."""
+    if sfx_type not in SFX_TYPE_SET:
+        raise ValueError(
+            f"Unknown SFX type: {sfx_type}. Available: {', '.join(SFX_CHOICES)}"
+        )
+
+    rng = np.random.default_rng(seed)
+    n_samples = int(sample_rate * duration)
+
+    if sfx_type == "whoosh":
+        audio = _gen_whoosh(n_samples, sample_rate, rng)
+    elif sfx_type == "impact":
+        audio = _gen_impact(n_samples, sample_rate, rng)
+    elif sfx_type == "ui_click":
+        # Force short duration for clicks
+        duration = 0.1
+        n_samples = int(sample_rate * duration)
+        audio = _gen_ui_click(n_samples, sample_rate, rng)
+    elif sfx_type == "static":
+        audio = generate_noise(n_samples, "white", rng)
+        audio = apply_envelope(audio, sample_rate, 0.1, 0.1)
+    else:  # drone
+        audio = _gen_drone(n_samples, sample_rate, rng)
+
+    # Final normalization (every generator returns a fresh float32 buffer)
+    peak = peak_abs(audio)
+    if peak > 0:
+        audio *= 0.9 / peak
+
+    return audio
+
+
 def _gen_whoosh(n: int, sr: int, rng: np.random.Generator) -> np.ndarray:
     """Filtered pink noise with volume swell."""
     noise = generate_noise(n, "pink", rng)
 
-    # Swell envelope (fade in 40%, hold 20%, fade out 40%)
+    # Swell envelope (fade in 40%, hold 20%, fade out 40%), applied in
+    # place: the hold is unity gain, so only the two ramps touch the noise
     fade_len = int(n * 0.4)
-    envelope = np.concatenate(
-        [
-            np.linspace(0, 1, fade_len),
-            np.ones(n - 2 * fade_len),
-            np.linspace(1, 0, fade_len),
-        ]
-    )
-
-    # Ensure lengths match due to rounding
-    if len(envelope) < n:
-        envelope = np.pad(envelope, (0, n - len(envelope)))
-    elif len(envelope) > n:
-        envelope = envelope[:n]
+    ramp = np.linspace(0, 1, fade_len, dtype=np.float32)
+    noise[:fade_len] *= ramp
+    noise[n - fade_len :] *= ramp[::-1]
 
-    return noise * envelope
+    return noise
 
 
 def _gen_impact(n: int, sr: int, rng: np.random.Generator) -> np.ndarray:
     """Low sine kick + noise burst."""
-    t = np.linspace(0, n / sr, n, endpoint=False)
-
-    # Pitch drop: 150Hz -> 50Hz
-    freq = np.linspace(150, 50, n)
-    phase = 2 * np.pi * np.cumsum(freq) / sr
-    kick = np.sin(phase)
+    # Pitch drop: 150Hz -> 50Hz. The phase is the running sum of a linear
+    # frequency ramp, which has a closed form (no ramp or cumsum arrays):
+    # sum of the first m ramp values = 150m - 100 * m(m-1)/2 / (n-1)
+    m = np.arange(1, n + 1, dtype=np.float64)
+    phase = m * (m - 1)
+    phase *= -50.0 / max(n - 1, 1)
+    phase += 150.0 * m
+    phase /= sr  # cycles
+    kick = oscillator_from_phase(phase, "sine", out=np.empty(n, dtype=np.float32))
 
     # Kick envelope: fast decay
-    decay = np.exp(-10 * t)
+    decay = np.exp(-10 * time_vector(n, sr), dtype=np.float32)
     kick *= decay
 
-    # Noise burst (crunch)
+    # Noise burst (crunch): exp(-20t) is the kick decay squared
     noise = generate_noise(n, "white", rng)
-    noise_env = np.exp(-20 * t)  # very fast decay
-    noise *= noise_env
+    noise *= decay
+    noise *= decay
 
-    return kick * 0.7 + noise * 0.3
+    kick *= 0.7
+    noise *= 0.3
+    kick += noise
+    return kick
 
 
 def _gen_ui_click(n: int, sr: int, rng: np.random.Generator) -> np.ndarray:
     """High frequency sine blip."""
-    t = np.linspace(0, n / sr, n, endpoint=False)
+    # Deterministic and fixed-length, so the rendered click is reused
+    return _ui_click_template(n, sr).copy()
+
+
+@lru_cache(maxsize=4)
+def _ui_click_template(n: int, sr: int) -> np.ndarray:
+    """Read-only 2kHz blip with its decay envelope applied."""
+    t = time_vector(n, sr)
 
     # Sine blip 2000Hz
-    blip = np.sin(2 * np.pi * 2000 * t)
+    blip = oscillator_from_phase(t * 2000, "sine", out=np.empty(n, dtype=np.float32))
 
     # Very short envelope
-    env = np.exp(-50 * t)
+    blip *= np.exp(-50 * t, dtype=np.float32)
 
-    return blip * env
+    blip.flags.writeable = False
+    return blip
 
 
 def _gen_drone(n: int, sr: int, rng: np.random.Generator) -> np.ndarray:
     """Deep saw wave cluster."""
-    t = np.linspace(0, n / sr, n, endpoint=False)
-
-    # Two saw waves slightly detuned
-    osc1 = 2 * (t * 55 - np.floor(t * 55 + 0.5))  # 55Hz (A1)
-    osc2 = 2 * (t * 55.5 - np.floor(t * 55.5 + 0.5))
+    t = time_vector(n, sr)
 
-    drone = osc1 + osc2
+    # Two saw waves slightly detuned, sharing one phase scratch buffer
+    phase = t * 55  # 55Hz (A1)
+    drone = oscillator_from_phase(phase, "saw", out=np.empty(n, dtype=np.float32))
+    np.multiply(t, 55.5, out=phase)
+    drone += oscillator_from_phase(phase, "saw", out=phase)
 
     # Lowpass to remove harshness
     drone = simple_lowpass(drone, 200, sr)
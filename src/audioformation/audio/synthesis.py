@@ -2,28 +2,77 @@
 DSP Synthesis Primitives.
 
 Shared signal processing functions for Composer (Music) and FXForge (SFX).
+Audio buffers are float32 throughout; time and phase are computed in
+float64 and wrapped before being narrowed.
 """
 
+from functools import lru_cache
+
 import numpy as np
+from scipy import signal as sps
+
+
+@lru_cache(maxsize=8)
+def time_vector(n_samples: int, sr: int) -> np.ndarray:
+    """
+    Sample times in seconds, ``arange(n) / sr``, cached per (n, sr).
+
+    The array is shared between callers and therefore read-only; derive
+    new arrays from it (``2 * np.pi * freq * t``) rather than writing to it.
+    """
+    t = np.arange(n_samples, dtype=np.float64)
+    t *= 1.0 / sr
+    t.flags.writeable = False
+    return t
 
 
 def oscillator(
-    freq: float, duration_sec: float, sr: int, wave_type: str = "sine"
+    freq: float,
+    duration_sec: float,
+    sr: int,
+    wave_type: str = "sine",
+    dtype: np.dtype | type = np.float32,
 ) -> np.ndarray:
     """Generate a basic waveform."""
-    t = np.linspace(0, duration_sec, int(sr * duration_sec), endpoint=False)
-    phase = 2 * np.pi * freq * t
+    phase = time_vector(int(sr * duration_sec), sr) * freq  # phase in cycles
+    return oscillator_from_phase(
+        phase, wave_type, out=np.empty(len(phase), dtype=dtype)
+    )
+
 
-    if wave_type == "sine":
-        return np.sin(phase)
+def oscillator_from_phase(
+    phase: np.ndarray,
+    wave_type: str = "sine",
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Shape a waveform from phase measured in cycles (``freq * t``).
+
+    ``phase`` is used as scratch space and is overwritten. The result is
+    written to ``out`` (a new array of phase's dtype if omitted), which may
+    have a narrower dtype: the phase is wrapped to a single cycle first, so
+    a float64 phase can feed a float32 output without losing pitch accuracy.
+    """
+    if out is None:
+        out = np.empty_like(phase)
+
+    # x - floor(x + 0.5) == ((x + 0.5) mod 1) - 0.5, range [-0.5, 0.5)
+    phase += 0.5
+    np.mod(phase, 1.0, out=phase)
+    phase -= 0.5
+
+    if wave_type == "saw":
+        np.multiply(phase, 2.0, out=out, casting="same_kind")
     elif wave_type == "triangle":
-        return 2 * np.abs(2 * (t * freq - np.floor(t * freq + 0.5))) - 1
-    elif wave_type == "saw":
-        return 2 * (t * freq - np.floor(t * freq + 0.5))
-    elif wave_type == "square":
-        return np.sign(np.sin(phase))
+        np.abs(phase, out=phase)
+        np.multiply(phase, 4.0, out=out, casting="same_kind")
+        out -= 1.0
     else:
-        return np.sin(phase)
+        np.multiply(phase, 2 * np.pi, out=out, casting="same_kind")
+        np.sin(out, out=out)
+        if wave_type == "square":
+            np.sign(out, out=out)
+    return out
 
 
 def cents_to_ratio(cents: float) -> float:
@@ -31,62 +80,140 @@ def cents_to_ratio(cents: float) -> float:
     return 2 ** (cents / 1200)
 
 
-def generate_noise(n_samples: int, color: str, rng: np.random.Generator) -> np.ndarray:
-    """Generate colored noise (white, pink, brown)."""
+def _pink_filter_coefficients() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fold Paul Kellet's economy pink filter into a single (b, a) pair.
+
+    The filter is three leaky integrators plus a direct path; summing them
+    over a common denominator lets ``scipy.signal.lfilter`` run it in one pass.
+    """
+    poles = (0.99765, 0.96300, 0.57000)
+    gains = (0.0990460, 0.2965164, 1.0526913)
+    direct = 0.1848
+
+    a = np.array([1.0])
+    for pole in poles:
+        a = np.convolve(a, [1.0, -pole])
+
+    b = direct * a
+    for k, gain in enumerate(gains):
+        others = np.array([1.0])
+        for j, pole in enumerate(poles):
+            if j != k:
+                others = np.convolve(others, [1.0, -pole])
+        b[: len(others)] += gain * others
+    return b, a
+
+
+_PINK_B, _PINK_A = _pink_filter_coefficients()
+_BROWN_LEAK = 0.997
+
+
+def generate_noise(
+    n_samples: int,
+    color: str,
+    rng: np.random.Generator,
+    dtype: np.dtype | type = np.float32,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Generate colored noise (white, pink, brown).
+
+    White noise is drawn straight into ``out`` when one is given (its
+    dtype then wins over ``dtype``); pink and brown noise use it as the
+    filter input and return a new array.
+    """
+    if out is not None:
+        dtype = out.dtype
+    white = rng.standard_normal(n_samples, dtype=dtype, out=out)
+
     if color == "white":
-        white = rng.standard_normal(n_samples)
         return _normalize(white)
 
     elif color == "pink":
-        # Simplified pink noise (1/f) approximation
-        white = rng.standard_normal(n_samples)
-        # Apply rolling average for pinkening
-        kernel_size = 64
-        kernel = np.ones(kernel_size) / kernel_size
-        pink = np.convolve(white, kernel, mode="same")
+        # Pink noise (1/f) via Paul Kellet's economy filter, one IIR pass
+        pink = sps.lfilter(_PINK_B.astype(dtype), _PINK_A.astype(dtype), white)
         return _normalize(pink)
 
     elif color == "brown":
-        # Brownian noise (1/f^2) via cumulative sum
-        white = rng.standard_normal(n_samples)
-        brown = np.cumsum(white)
-        # High-pass to remove DC drift
-        brown = brown - np.linspace(brown[0], brown[-1], n_samples)
+        # Brownian noise (1/f^2) via a leaky integrator — the leak keeps
+        # DC drift bounded, so no detrend pass is needed afterwards
+        brown = sps.lfilter(
+            np.ones(1, dtype=dtype), np.array([1.0, -_BROWN_LEAK], dtype=dtype), white
+        )
         return _normalize(brown)
 
     else:
-        return rng.standard_normal(n_samples)
+        return white
 
 
 def simple_lowpass(signal: np.ndarray, cutoff_hz: float, sr: int) -> np.ndarray:
     """Apply a simple first-order IIR lowpass filter."""
-    if cutoff_hz >= sr / 2:
-        return signal
-
-    rc = 1.0 / (2 * np.pi * cutoff_hz)
-    dt = 1.0 / sr
-    alpha = dt / (rc + dt)
-
-    out = np.zeros_like(signal)
-    out[0] = alpha * signal[0]
-    for i in range(1, len(signal)):
-        out[i] = out[i - 1] + alpha * (signal[i] - out[i - 1])
-    return out
+    return band_filter(signal, cutoff_hz, 0.0, sr)
 
 
 def simple_highpass(signal: np.ndarray, cutoff_hz: float, sr: int) -> np.ndarray:
     """Apply a simple first-order IIR highpass filter."""
-    if cutoff_hz <= 0:
+    return band_filter(signal, sr / 2, cutoff_hz, sr)
+
+
+def band_filter_sections(lowpass_hz: float, highpass_hz: float, sr: int) -> np.ndarray:
+    """
+    Second-order sections for the simple_lowpass → simple_highpass chain.
+
+    Returns an array of shape (n_sections, 6) in ``scipy.signal`` SOS
+    layout. Cutoffs outside the usable range drop their section, so the
+    result may be empty.
+    """
+    sections = []
+
+    if lowpass_hz < sr / 2:
+        rc = 1.0 / (2 * np.pi * lowpass_hz)
+        dt = 1.0 / sr
+        alpha = dt / (rc + dt)
+        sections.append([alpha, 0.0, 0.0, 1.0, alpha - 1.0, 0.0])
+
+    if highpass_hz > 0:
+        rc = 1.0 / (2 * np.pi * highpass_hz)
+        dt = 1.0 / sr
+        alpha = rc / (rc + dt)
+        sections.append([alpha, -alpha, 0.0, 1.0, -alpha, 0.0])
+
+    return np.asarray(sections, dtype=np.float64).reshape(-1, 6)
+
+
+def band_filter(
+    signal: np.ndarray,
+    lowpass_hz: float,
+    highpass_hz: float,
+    sr: int,
+    sos: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Apply simple_lowpass followed by simple_highpass in a single IIR pass.
+
+    Both one-pole stages are cascaded as second-order sections and run by
+    ``scipy.signal.sosfilt``, so the buffer is streamed through C once.
+    Cutoffs outside the usable range (lowpass at or above Nyquist, highpass
+    at or below 0 Hz) skip their stage. Pass precomputed ``sos`` from
+    band_filter_sections() to skip the coefficient math.
+    """
+    if sos is None:
+        sos = band_filter_sections(lowpass_hz, highpass_hz, sr)
+    if len(sos) == 0 or len(signal) == 0:
         return signal
 
-    rc = 1.0 / (2 * np.pi * cutoff_hz)
-    dt = 1.0 / sr
-    alpha = rc / (rc + dt)
+    # Match the standalone filters' start-up: lowpass starts from rest,
+    # highpass passes its first input sample through unchanged.
+    zi = np.zeros((len(sos), 2), dtype=signal.dtype)
+    first = signal[0]
+    for k, (b0, b1) in enumerate(sos[:, :2]):
+        if b1 != 0:
+            zi[k, 0] = (1.0 - b0) * first
+        else:
+            first = b0 * first
 
-    out = np.zeros_like(signal)
-    out[0] = signal[0]
-    for i in range(1, len(signal)):
-        out[i] = alpha * (out[i - 1] + signal[i] - signal[i - 1])
+    out, _ = sps.sosfilt(sos.astype(signal.dtype, copy=False), signal, zi=zi)
     return out
 
 
@@ -96,35 +223,51 @@ def apply_envelope(
     fade_in_sec: float,
     fade_out_sec: float,
     curve: str = "linear",
+    inplace: bool = False,
 ) -> np.ndarray:
-    """Apply fade-in and fade-out envelope."""
-    n = len(signal)
-    envelope = np.ones(n)
+    """
+    Apply fade-in and fade-out envelope.
+
+    Only the fade regions are touched; where they overlap, the fade-out
+    wins. With ``inplace=True`` a float ``signal`` is modified and returned
+    instead of copied.
+    """
+    if inplace:
+        out = signal
+    else:
+        out = signal.astype(np.result_type(signal.dtype, np.float32))
+    n = len(out)
 
-    fade_in_samples = int(fade_in_sec * sr)
-    fade_out_samples = int(fade_out_sec * sr)
+    fade_in_samples = min(max(int(fade_in_sec * sr), 0), n)
+    fade_out_samples = min(max(int(fade_out_sec * sr), 0), n)
 
-    if fade_in_samples > 0:
-        fade_in_samples = min(fade_in_samples, n)
+    # Samples from here on belong to the fade-out
+    fade_in_end = min(fade_in_samples, n - fade_out_samples)
+    if fade_in_end > 0:
+        ramp = np.linspace(0, 1, fade_in_samples, dtype=out.dtype)[:fade_in_end]
         if curve == "exponential":
-            # x^2 curve
-            envelope[:fade_in_samples] = np.linspace(0, 1, fade_in_samples) ** 2
-        else:
-            envelope[:fade_in_samples] = np.linspace(0, 1, fade_in_samples)
+            np.square(ramp, out=ramp)  # x^2 curve
+        out[:fade_in_end] *= ramp
 
     if fade_out_samples > 0:
-        fade_out_samples = min(fade_out_samples, n)
+        ramp = np.linspace(1, 0, fade_out_samples, dtype=out.dtype)
         if curve == "exponential":
-            envelope[-fade_out_samples:] = np.linspace(1, 0, fade_out_samples) ** 2
-        else:
-            envelope[-fade_out_samples:] = np.linspace(1, 0, fade_out_samples)
+            np.square(ramp, out=ramp)
+        out[n - fade_out_samples :] *= ramp
+
+    return out
+
 
-    return signal * envelope
+def peak_abs(signal: np.ndarray) -> float:
+    """Return max(|signal|) without allocating an abs() copy of the buffer."""
+    if len(signal) == 0:
+        return 0.0
+    return float(max(signal.max(), -signal.min()))
 
 
 def _normalize(signal: np.ndarray) -> np.ndarray:
-    """Normalize signal to -1.0 to 1.0 range."""
-    peak = np.max(np.abs(signal))
+    """Normalize signal to -1.0 to 1.0 range (in place)."""
+    peak = peak_abs(signal)
     if peak > 0:
-        return signal / peak
+        signal /= peak
     return signal
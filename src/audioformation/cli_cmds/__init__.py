@@ -0,0 +1 @@
+"""CLI subcommands, one module each, loaded lazily by ``audioformation.cli.main``."""
@@ -0,0 +1,161 @@
+"""``audioformation cast`` — manage project characters and voices."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from audioformation.cli import _project_guard
+
+
+@click.group()
+def cast() -> None:
+    """Manage project characters and voices."""
+    pass
+
+
+@cast.command("list")
+@click.argument("project_id")
+def cast_list(project_id: str) -> None:
+    """List characters in a project."""
+    ctx = _project_guard(project_id)
+
+    try:
+        pj = ctx.project
+    except FileNotFoundError:
+        click.secho("ERROR project.json not found.", fg="red")
+        sys.exit(1)
+
+    characters = pj.get("characters", {})
+    if not characters:
+        click.echo(f"No characters found in project {project_id}.")
+        return
+
+    click.secho(f"Cast for {project_id}:", bold=True)
+    click.echo(f"{'ID':<15} {'Name':<20} {'Engine':<12} {'Voice/Ref'}")
+    click.echo("─" * 80)
+
+    for char_id, char_data in characters.items():
+        name = char_data.get("name", "")
+        engine = char_data.get("engine", "")
+        voice = char_data.get("voice") or char_data.get("reference_audio") or ""
+
+        # Truncate long paths for display
+        if len(voice) > 30 and "/" in voice:
+            voice = "..." + voice[-27:]
+
+        click.echo(f"{char_id:<15} {name[:19]:<20} {engine:<12} {voice}")
+
+
+@cast.command("add")
+@click.argument("project_id")
+@click.option("--id", "char_id", required=True, help="Character ID (e.g., 'hero').")
+@click.option("--name", required=True, help="Display name.")
+@click.option("--engine", default="edge", help="TTS engine (default: edge).")
+@click.option("--voice", default=None, help="Voice ID (for edge/cloud) or None.")
+@click.option("--dialect", default="msa", help="Dialect code (msa, eg, etc.).")
+@click.option("--persona", default="", help="Description of character persona.")
+def cast_add(
+    project_id: str,
+    char_id: str,
+    name: str,
+    engine: str,
+    voice: str | None,
+    dialect: str,
+    persona: str,
+) -> None:
+    """Add or update a character in project.json."""
+    from audioformation.project import save_project_json
+
+    pj = _project_guard(project_id).project
+
+    char_entry = {
+        "name": name,
+        "engine": engine,
+        "voice": voice,
+        "dialect": dialect,
+        "persona": persona,
+        "reference_audio": None,
+    }
+
+    # If updating, preserve existing fields if not overwritten
+    if char_id in pj.get("characters", {}):
+        existing = pj["characters"][char_id]
+        if not voice and existing.get("voice"):
+            char_entry["voice"] = existing["voice"]
+        if not persona and existing.get("persona"):
+            char_entry["persona"] = existing["persona"]
+        if existing.get("reference_audio"):
+            char_entry["reference_audio"] = existing["reference_audio"]
+        action = "Updated"
+    else:
+        action = "Added"
+
+    pj.setdefault("characters", {})[char_id] = char_entry
+    save_project_json(project_id, pj)
+
+    click.secho(f"✓ {action} character: {char_id}", fg="green")
+
+
+@cast.command("clone")
+@click.argument("project_id")
+@click.option("--id", "char_id", required=True, help="Character ID.")
+@click.option(
+    "--reference",
+    type=click.Path(exists=True, path_type=Path),
+    required=True,
+    help="Path to reference audio file.",
+)
+@click.option("--name", default=None, help="Character name (optional if exists).")
+def cast_clone(
+    project_id: str, char_id: str, reference: Path, name: str | None
+) -> None:
+    """
+    Setup voice cloning: copy audio ref and set engine to XTTS.
+    """
+    from audioformation.project import save_project_json
+    from audioformation.utils.fileio import fast_copy
+    from audioformation.utils.security import sanitize_filename
+
+    ctx = _project_guard(project_id)
+    voices_dir = ctx.path / "02_VOICES" / "references"
+    voices_dir.mkdir(parents=True, exist_ok=True)
+
+    # Copy file
+    safe_name = sanitize_filename(reference.name)
+    dest_path = voices_dir / safe_name
+    fast_copy(reference, dest_path)
+
+    # Relative path for project.json
+    rel_path = f"02_VOICES/references/{safe_name}"
+
+    pj = ctx.project
+    characters = pj.setdefault("characters", {})
+
+    if char_id in characters:
+        char_data = characters[char_id]
+        char_data["engine"] = "xtts"
+        char_data["reference_audio"] = rel_path
+        # Clear voice ID since we are using reference
+        char_data["voice"] = None
+        if name:
+            char_data["name"] = name
+        action = "Updated"
+    else:
+        if not name:
+            name = char_id.title()
+        char_data = {
+            "name": name,
+            "engine": "xtts",
+            "voice": None,
+            "dialect": "msa",
+            "persona": "Voice clone",
+            "reference_audio": rel_path,
+        }
+        characters[char_id] = char_data
+        action = "Created"
+
+    save_project_json(project_id, pj)
+
+    click.secho(f"✓ Copied reference to: {rel_path}", fg="green")
+    click.secho(f"✓ {action} character '{char_id}' using XTTS engine.", fg="green")
@@ -0,0 +1,88 @@
+"""``audioformation compare`` — generate A/B comparisons using multiple engines."""
+
+import asyncio
+from pathlib import Path
+
+import click
+
+from audioformation.cli import _project_guard, _run_async
+from audioformation.cli_cmds.preview import (
+    _generate_preview,
+    _is_cached,
+    _preview_request,
+    _preview_text,
+    _preview_voice,
+    _report_cached,
+    _report_preview,
+)
+
+
+@click.command()
+@click.argument("project_id")
+@click.argument("chapter_id")
+@click.option(
+    "--engines",
+    type=str,
+    default="edge,gtts",
+    help="Comma-separated engines to compare.",
+)
+def compare(project_id: str, chapter_id: str, engines: str) -> None:
+    """Generate A/B comparisons using multiple engines."""
+    from audioformation.engines.registry import registry
+
+    engine_list = [e.strip() for e in engines.split(",")]
+
+    click.echo(f"Comparing engines: {', '.join(engine_list)}")
+
+    ctx = _project_guard(project_id)
+    chapter, text = _preview_text(ctx, chapter_id, duration=30.0, chars=None)
+    click.echo(f"  Length: {len(text)} chars (~{len(text) / 15:.1f}s)")
+
+    jobs = []
+    for eng in engine_list:
+        _, voice = _preview_voice(ctx.project, chapter, eng, None)
+        request = _preview_request(ctx.path, chapter, text, eng, voice, label=eng)
+        if _is_cached(request.output_path):
+            click.echo(f"\n--- {eng} ---")
+            _report_cached(request.output_path)
+            continue
+        try:
+            tts = registry.get(eng)
+        except KeyError:
+            click.echo(f"\n--- {eng} ---")
+            click.secho(f"✗ Engine '{eng}' not available.", fg="red")
+            continue
+        jobs.append((eng, voice, tts, request))
+
+    if jobs:
+        _run_async(_compare_all(jobs))
+
+
+async def _compare_all(jobs: list[tuple]) -> None:
+    """
+    Generate every engine's preview concurrently.
+
+    Each preview is a network/TTS round-trip, so the whole comparison takes
+    as long as the slowest engine; results print as each one lands.
+    """
+
+    async def _one(eng: str, voice: str | None, tts, request) -> tuple:
+        try:
+            result = await _generate_preview(tts, request)
+            return eng, voice, request.output_path, result
+        except Exception as e:
+            return eng, voice, request.output_path, e
+
+    for next_done in asyncio.as_completed([_one(*job) for job in jobs]):
+        eng, voice, output_path, result = await next_done
+        _report_engine(eng, voice, output_path, result)
+
+
+def _report_engine(eng: str, voice: str | None, output_path: Path, result) -> None:
+    """Echo one engine's banner and outcome."""
+    click.echo(f"\n--- {eng} ---")
+    click.echo(f"  Voice:  {voice}")
+    if isinstance(result, Exception):
+        click.secho(f"✗ Error: {result}", fg="red")
+    else:
+        _report_preview(output_path, result)
@@ -0,0 +1,75 @@
+"""``audioformation compose`` — generate ambient pad music (Node 5)."""
+
+import sys
+
+import click
+
+from audioformation.cli import _project_guard, _unique_suffix
+
+
+@click.command("compose")
+@click.argument("project_id")
+@click.option(
+    "--preset",
+    default="contemplative",
+    help="Mood preset (contemplative, tense, wonder, etc.)",
+)
+@click.option(
+    "--duration", type=float, default=60.0, help="Duration in seconds (default: 60)"
+)
+@click.option(
+    "--output", "output_filename", default=None, help="Output filename (optional)"
+)
+@click.option(
+    "--list", "list_only", is_flag=True, help="List available presets and exit"
+)
+def compose(
+    project_id: str,
+    preset: str,
+    duration: float,
+    output_filename: str | None,
+    list_only: bool,
+) -> None:
+    """Generate ambient pad music (Node 5)."""
+    from audioformation.audio.composer import generate_pad, list_presets
+    from audioformation.pipeline import mark_node
+
+    ctx = _project_guard(project_id)
+
+    if list_only:
+        presets = list_presets()
+        click.echo("Available presets:")
+        for p in presets:
+            click.echo(f"  • {p}")
+        return
+
+    click.echo(f"Generating ambient pad for: {project_id}")
+    click.echo(f"  Preset:   {preset}")
+    click.echo(f"  Duration: {duration}s")
+
+    project_path = ctx.path
+    music_dir = project_path / "05_MUSIC" / "generated"
+    music_dir.mkdir(parents=True, exist_ok=True)
+
+    if not output_filename:
+        output_filename = f"{preset}_{_unique_suffix()}.wav"
+
+    output_path = music_dir / output_filename
+
+    try:
+        generate_pad(
+            preset,
+            duration_sec=duration,
+            output_path=output_path,
+        )
+    except ValueError as e:
+        click.secho(f"✗ Error: {e}", fg="red")
+        sys.exit(1)
+    except Exception as e:
+        click.secho(f"ERROR Generation failed: {e}", fg="red")
+        sys.exit(1)
+
+    click.secho(f"✓ Saved: {output_path.name}", fg="green")
+
+    # Update pipeline status
+    mark_node(project_path, "compose", "complete", preset=preset, duration=duration)
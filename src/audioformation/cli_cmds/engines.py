@@ -0,0 +1,110 @@
+"""``audioformation engines`` — manage TTS engines."""
+
+import os
+import sys
+
+import click
+
+from audioformation.cli import _run_async
+
+_VOICE_ROW_FMT = "{:<35} {:<40} {:<10} {}"
+
+
+@click.group()
+def engines() -> None:
+    """Manage TTS engines."""
+    pass
+
+
+@engines.command("list")
+def engines_list():
+    """List available TTS engines."""
+    from audioformation.engines.registry import registry
+
+    available = registry.list_available()
+
+    click.secho("Available Engines:", bold=True)
+    for name in available:
+        try:
+            caps = registry.get_capabilities(name)
+            features = []
+            if caps.get("supports_cloning"):
+                features.append("cloning")
+            if caps.get("supports_ssml"):
+                features.append("SSML")
+            if caps.get("requires_gpu"):
+                features.append("GPU")
+            if caps.get("requires_api_key"):
+                features.append("API key")
+
+            feature_str = f" ({', '.join(features)})" if features else ""
+            status = ""
+            if caps.get("requires_api_key"):
+                api_key_name = caps.get("api_key_name")
+                if not os.getenv(api_key_name):
+                    status = f" [SET {api_key_name}]"
+
+            click.echo(f"  • {name}{feature_str}{status}")
+        except Exception as e:
+            click.echo(f"  • {name} [ERROR: {e}]")
+
+
+@engines.command("test")
+@click.argument("engine_name")
+@click.option("--device", type=click.Choice(["gpu", "cpu"]), default=None)
+def engines_test(engine_name: str, device: str | None) -> None:
+    """Test if a TTS engine is available and functional."""
+    from audioformation.engines.registry import registry
+
+    try:
+        engine = registry.get(engine_name)
+    except KeyError as e:
+        click.secho(f"ERROR {e}", fg="red")
+        sys.exit(1)
+
+    click.echo(f"Testing engine: {engine_name}...")
+
+    ok = _run_async(engine.test_connection())
+
+    if ok:
+        click.secho(f"✓ {engine_name} is available.", fg="green")
+    else:
+        click.secho(f"✗ {engine_name} is NOT available.", fg="red")
+        sys.exit(1)
+
+
+@engines.command("voices")
+@click.argument("engine_name")
+@click.option(
+    "--lang", type=str, default=None, help="Filter by language prefix (e.g., 'ar')."
+)
+def engines_voices(engine_name: str, lang: str | None) -> None:
+    """List voices available on an engine."""
+    from audioformation.engines.registry import registry
+
+    try:
+        engine = registry.get(engine_name)
+    except KeyError as e:
+        click.secho(f"ERROR {e}", fg="red")
+        sys.exit(1)
+
+    voices = _run_async(engine.list_voices(language=lang))
+
+    if not voices:
+        click.echo(
+            f"No voices found for engine '{engine_name}'"
+            + (f" with language '{lang}'" if lang else "")
+            + "."
+        )
+        return
+
+    # Edge lists hundreds of voices: build the table and write it once
+    lines = [_VOICE_ROW_FMT.format("ID", "Name", "Locale", "Gender"), "─" * 95]
+    lines.extend(
+        _VOICE_ROW_FMT.format(
+            v.get("id", ""), v.get("name", ""), v.get("locale", ""), v.get("gender", "")
+        )
+        for v in voices
+    )
+    lines.append(f"\nTotal: {len(voices)} voices")
+    click.echo("\n".join(lines))
@@ -0,0 +1,194 @@
+"""``audioformation export`` — export final audio files (Node 8)."""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import click
+
+from audioformation.cli import _ICON_OK, _project_guard
+
+_ICON_EXPORT_FAILED = click.style("✗", fg="red")
+
+
+@click.command("export")
+@click.argument("project_id")
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["mp3", "wav", "m4b"]),
+    default="mp3",
+    help="Export format.",
+)
+@click.option(
+    "--bitrate",
+    type=int,
+    default=None,
+    help="MP3 bitrate in kbps (default: from project.json).",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Chapters to encode at once (default: one per CPU core).",
+)
+def export_audio(
+    project_id: str, fmt: str, bitrate: int | None, jobs: int | None
+) -> None:
+    """Export final audio files (Node 8)."""
+    from audioformation.export.m4b import export_project_m4b
+    from audioformation.export.metadata import generate_manifest
+    from audioformation.pipeline import update_node_status, can_proceed_to
+
+    ctx = _project_guard(project_id)
+
+    # Verify gates (including QC Final)
+    can, reason = can_proceed_to(project_id, "export")
+    if not can:
+        click.secho(f"ERROR Cannot export: {reason}", fg="red")
+        click.echo("  Run: audioformation qc-final " + project_id)
+        sys.exit(1)
+
+    project_path = ctx.path
+    export_config = ctx.project.get("export", {})
+
+    export_dir = project_path / "07_EXPORT"
+
+    # ── M4B / Audiobook Export ──
+    if fmt == "m4b":
+        click.echo("Exporting full audiobook as M4B...")
+        audiobook_dir = export_dir / "audiobook"
+        audiobook_dir.mkdir(parents=True, exist_ok=True)
+
+        # Determine filename
+        filename = f"{project_id}.m4b"
+        out_path = audiobook_dir / filename
+
+        # Run export
+        update_node_status(project_id, "export", "running", mode="m4b")
+        ok = export_project_m4b(
+            project_id, out_path, bitrate=export_config.get("m4b_aac_bitrate", 128)
+        )
+
+        if ok:
+            click.secho(f"✓ Created: {out_path}", fg="green", bold=True)
+            update_node_status(project_id, "export", "complete", mode="m4b")
+        else:
+            click.secho("✗ M4B export failed.", fg="red")
+            update_node_status(project_id, "export", "failed")
+
+        return
+
+    # ── Chapter-based Export (MP3/WAV) ──
+
+    # Source: Mixed files from 06_MIX/renders
+    mix_dir = project_path / "06_MIX" / "renders"
+
+    chapter_files = _find_mixed_wavs(mix_dir)
+
+    if not chapter_files:
+        click.secho("✗ No mixed audio files found in 06_MIX/renders/.", fg="red")
+        click.echo("  Run: audioformation mix " + project_id)
+        sys.exit(1)
+
+    chapters_dir = export_dir / "chapters"
+    chapters_dir.mkdir(parents=True, exist_ok=True)
+
+    update_node_status(project_id, "export", "running")
+
+    mp3_bitrate = bitrate or export_config.get("mp3_bitrate", 192)
+
+    click.echo(f"Exporting {len(chapter_files)} chapters as {fmt.upper()}...")
+    click.echo()
+
+    # Encoding happens in ffmpeg subprocesses, so threads are enough to run
+    # one per core; map() yields in chapter order, keeping the output ordered.
+    # Each ffmpeg gets its share of the cores so jobs x threads ~= cpu count.
+    cpus = os.cpu_count() or 1
+    workers = min(len(chapter_files), jobs or cpus)
+    export_one = partial(
+        _export_one,
+        fmt=fmt,
+        out_dir=chapters_dir,
+        export_dir=export_dir,
+        bitrate=mp3_bitrate,
+        threads=max(1, cpus // workers),
+    )
+    entries = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for wav_path, (out_path, entry) in zip(
+            chapter_files, pool.map(export_one, chapter_files)
+        ):
+            if entry is not None:
+                click.echo(f"  {_ICON_OK} {out_path.name}")
+                entries.append(entry)
+            else:
+                click.echo(f"  {_ICON_EXPORT_FAILED} {wav_path.stem} — export failed")
+
+    # Generate manifest
+    click.echo()
+    click.echo("Generating manifest...")
+    manifest_path = generate_manifest(
+        export_dir,
+        project_id,
+        metadata=export_config.get("metadata", {}),
+        entries=entries,
+    )
+    click.echo(f"  {_ICON_OK} {manifest_path.name}")
+
+    click.echo()
+    success_count = len(entries)
+    if success_count == len(chapter_files):
+        click.secho("✓ Export complete.", fg="green", bold=True)
+        update_node_status(project_id, "export", "complete")
+    else:
+        click.secho(
+            f"⚠ Exported {success_count}/{len(chapter_files)} files.", fg="yellow"
+        )
+        update_node_status(project_id, "export", "partial")
+
+    click.echo(f"  Output: {export_dir}")
+
+
+def _find_mixed_wavs(mix_dir: Path) -> list[Path]:
+    """Sorted chapter WAVs in mix_dir from a single scandir pass."""
+    try:
+        with os.scandir(mix_dir) as it:
+            names = sorted(
+                e.name for e in it if e.name.endswith(".wav") and e.is_file()
+            )
+    except FileNotFoundError:
+        return []
+    return [mix_dir / name for name in names]
+
+
+def _export_one(
+    wav_path: Path,
+    fmt: str,
+    out_dir: Path,
+    export_dir: Path,
+    bitrate: int,
+    threads: int = 0,
+) -> tuple[Path, dict[str, Any] | None]:
+    """
+    Encode one mixed chapter into out_dir.
+
+    Returns the output path and, on success, its manifest entry: the file is
+    hashed by the same worker while it is still in the page cache.
+    """
+    from audioformation.export.metadata import manifest_entry
+    from audioformation.export.mp3 import export_mp3, export_wav
+
+    out_path = out_dir / f"{wav_path.stem}.{fmt}"
+    if fmt == "mp3":
+        ok = export_mp3(wav_path, out_path, bitrate=bitrate, threads=threads)
+    elif fmt == "wav":
+        ok = export_wav(wav_path, out_path)
+    else:
+        ok = False
+
+    return out_path, manifest_entry(out_path, export_dir) if ok else None
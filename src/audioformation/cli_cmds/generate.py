@@ -0,0 +1,103 @@
+"""``audioformation generate`` — run TTS generation (Node 3)."""
+
+import sys
+
+import click
+
+from audioformation.cli import (
+    _ICON_FAIL,
+    _STATUS_ICONS,
+    _project_guard,
+    _run_async,
+)
+
+
+@click.command()
+@click.argument("project_id")
+@click.option(
+    "--engine",
+    type=str,
+    default=None,
+    help="Override TTS engine (edge, xtts, elevenlabs).",
+)
+@click.option(
+    "--device", type=click.Choice(["gpu", "cpu"]), default=None, help="Device for XTTS."
+)
+@click.option(
+    "--chapters",
+    type=str,
+    default=None,
+    help="Comma-separated chapter IDs to generate. Default: all.",
+)
+def generate(
+    project_id: str, engine: str | None, device: str | None, chapters: str | None
+) -> None:
+    """Run TTS generation (Node 3)."""
+    from audioformation.generate import generate_project
+    from audioformation.pipeline import can_proceed_to
+
+    _project_guard(project_id)
+
+    # Check gate
+    can, reason = can_proceed_to(project_id, "generate")
+    if not can:
+        click.secho(f"ERROR Cannot generate: {reason}", fg="red")
+        click.echo("  Run: audioformation validate " + project_id)
+        sys.exit(1)
+
+    chapter_list = [c.strip() for c in chapters.split(",")] if chapters else None
+
+    click.echo(f"Generating audio for: {project_id}")
+    if engine:
+        click.echo(f"  Engine: {engine}")
+    if chapter_list:
+        click.echo(f"  Chapters: {', '.join(chapter_list)}")
+    click.echo()
+
+    def _cli_progress(msg: str):
+        click.echo(msg)
+
+    try:
+        result = _run_async(
+            generate_project(
+                project_id,
+                engine_name=engine,
+                device=device,
+                chapters=chapter_list,
+                progress_callback=_cli_progress,
+            )
+        )
+    except Exception as e:
+        click.secho(f"ERROR Generation error: {e}", fg="red")
+        sys.exit(1)
+
+    # Display results
+    for detail in result.get("details", []):
+        ch_id = detail["chapter_id"]
+        ch_status = detail["status"]
+        total = detail.get("total_chunks", 0)
+        failed = detail.get("failed_chunks", 0)
+
+        if ch_status in ("complete", "partial"):
+            icon = _STATUS_ICONS[ch_status]
+        else:
+            icon = _ICON_FAIL
+
+        click.echo(f"  {icon} {ch_id}: {total} chunks, {failed} failed")
+
+    click.echo()
+    fail_rate = result.get("fail_rate_percent", 0)
+    if fail_rate == 0:
+        click.secho("✓ Generation complete.", fg="green", bold=True)
+    elif fail_rate <= 5:
+        click.secho(
+            f"✓ Generation complete with {fail_rate:.1f}% failures.", fg="yellow"
+        )
+    else:
+        click.secho(
+            f"ERROR Generation had {fail_rate:.1f}% failures — review QC report.",
+            fg="red",
+        )
+        sys.exit(1)
+
+    click.echo(f"  Next: audioformation qc {project_id} --report")
@@ -0,0 +1,37 @@
+"""``audioformation hardware`` — detect and display hardware capabilities."""
+
+import click
+
+
+@click.command()
+def hardware() -> None:
+    """Detect and display hardware capabilities."""
+    from audioformation.utils.hardware import detect_all
+
+    hw = detect_all()
+
+    click.secho("Hardware Detection:", bold=True)
+    click.echo()
+
+    if hw.get("gpu_available"):
+        click.secho("  GPU:", fg="green")
+        click.echo(f"    Name:     {hw['gpu_name']}")
+        click.echo(
+            f"    VRAM:     {hw['vram_total_gb']} GB total, {hw['vram_free_gb']} GB free"
+        )
+        click.echo(f"    CUDA:     {hw.get('cuda_version', 'unknown')}")
+        click.echo(f"    Strategy: {hw['recommended_vram_strategy']}")
+    else:
+        click.secho("  GPU: None detected", fg="yellow")
+        click.echo("    XTTS will use CPU (slower) or fall back to edge-tts")
+
+    click.echo()
+
+    if hw.get("ffmpeg_available"):
+        click.secho("  ffmpeg: ✓", fg="green")
+        click.echo(f"    Path:    {hw['ffmpeg_path']}")
+        click.echo(f"    Version: {hw.get('ffmpeg_version', 'unknown')}")
+    else:
+        click.secho("  ffmpeg: ERROR NOT FOUND", fg="red")
+        click.echo("    Install: https://ffmpeg.org/download.html")
+        click.echo("    Required for audio processing and export.")
@@ -0,0 +1,65 @@
+"""``audioformation ingest`` — import text files into a project (Node 1)."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from audioformation.cli import _project_guard
+
+_TAG_INGESTED = click.style("[OK]", fg="green")
+_TAG_SKIPPED = click.style("[--]", fg="white")
+
+
+@click.command()
+@click.argument("project_id")
+@click.option(
+    "--source",
+    type=click.Path(exists=True, path_type=Path),
+    required=True,
+    help="Directory containing .txt chapter files.",
+)
+@click.option(
+    "--language",
+    type=str,
+    default=None,
+    help="Override language for all files (ar/en). Auto-detects if omitted.",
+)
+def ingest(project_id: str, source: Path, language: str | None) -> None:
+    """Import text files into a project (Node 1)."""
+    from audioformation.ingest import ingest_text
+
+    _project_guard(project_id)
+
+    click.echo(f"Ingesting text from: {source}")
+
+    try:
+        result = ingest_text(project_id, source, language=language)
+    except (FileNotFoundError, ValueError) as e:
+        click.secho(f"ERROR {e}", fg="red")
+        sys.exit(1)
+
+    click.echo()
+    for detail in result["details"]:
+        if detail["status"] == "ingested":
+            lang = detail.get("language", "?")
+            chars = detail.get("characters", 0)
+            diacrit = detail.get("diacritization", "")
+            diacrit_str = f" [{diacrit}]" if diacrit else ""
+            click.echo(
+                f"  {_TAG_INGESTED} {detail['file']} -> "
+                f"{detail['chapter_id']} ({lang}, {chars} chars{diacrit_str})"
+            )
+        else:
+            click.echo(
+                f"  {_TAG_SKIPPED} {detail['file']} -- "
+                f"{detail.get('reason', 'skipped')}"
+            )
+
+    click.echo()
+    click.secho(
+        f"OK Ingested {result['ingested']} files, skipped {result['skipped']}.",
+        fg="green",
+    )
+
+    click.echo(f"  Next: audioformation validate {project_id}")
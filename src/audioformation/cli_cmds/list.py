@@ -0,0 +1,35 @@
+"""``audioformation list`` — list all projects."""
+
+import click
+
+# Parsed once; per-row str.format skips re-evaluating five f-string specs
+_ROW_FMT = "{:<30} {:<22} {:<10} {:<15} {}"
+
+
+@click.command("list")
+def list_projects() -> None:
+    """List all projects."""
+    from audioformation.project import list_projects as _list
+
+    projects = _list()
+
+    if not projects:
+        click.echo("No projects found.")
+        click.echo("  Create one: audioformation new MY_PROJECT")
+        return
+
+    lines = [
+        _ROW_FMT.format("ID", "Created", "Chapters", "Stage", "Languages"),
+        "─" * 95,
+    ]
+    lines.extend(
+        _ROW_FMT.format(
+            p["id"][:30],
+            p["created"][:19],
+            p["chapters"],
+            p["pipeline_node"],
+            ", ".join(p.get("languages", [])),
+        )
+        for p in projects
+    )
+    click.echo("\n".join(lines))
@@ -0,0 +1,47 @@
+"""``audioformation mix`` — mix voice and music with ducking (Node 6)."""
+
+import sys
+
+import click
+
+from audioformation.cli import _project_guard
+
+
+@click.command("mix")
+@click.argument("project_id")
+@click.option(
+    "--music",
+    "music_file",
+    default=None,
+    help="Optional: Background music file (in 05_MUSIC/generated).",
+)
+def mix(project_id: str, music_file: str | None) -> None:
+    """Mix voice and music with ducking (Node 6)."""
+    from audioformation.mix import mix_project
+    from audioformation.pipeline import can_proceed_to
+
+    _project_guard(project_id)
+
+    # Check gates
+    can, reason = can_proceed_to(project_id, "mix")
+    if not can:
+        click.secho(f"ERROR Cannot start mixing: {reason}", fg="red")
+        sys.exit(1)
+
+    click.echo(f"Starting mix for project: {project_id}")
+
+    def _cli_progress(msg: str):
+        # Naive color mapping
+        if "ERROR" in msg:
+            click.secho(msg, fg="red")
+        elif "✓" in msg:
+            click.secho(msg, fg="green", bold=True)
+        elif "⚠" in msg:
+            click.secho(msg, fg="yellow")
+        else:
+            click.echo(msg)
+
+    success = mix_project(project_id, music_file, progress_callback=_cli_progress)
+
+    if not success:
+        sys.exit(1)
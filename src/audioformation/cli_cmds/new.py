@@ -0,0 +1,48 @@
+"""``audioformation new`` — create a new audio project."""
+
+import sys
+
+import click
+
+
+@click.command()
+@click.argument("name")
+def new(name: str) -> None:
+    """Create a new audio project."""
+    from audioformation.pipeline import mark_node
+    from audioformation.project import create_project
+    from audioformation.utils.hardware import write_hardware_json
+
+    try:
+        project_path = create_project(name)
+    except (FileExistsError, ValueError) as e:
+        click.secho(f"ERROR {e}", fg="red")
+        sys.exit(1)
+
+    click.echo("  Detecting hardware...")
+    hw = write_hardware_json(project_path)
+
+    click.secho(f"OK Created project: {project_path.name}", fg="green")
+    click.echo(f"  Path: {project_path.resolve()}")
+
+    # Write pipeline status — bootstrap complete
+    mark_node(project_path, "bootstrap", "complete")
+
+    if hw.get("gpu_available"):
+        click.echo(f"  GPU:  {hw['gpu_name']} ({hw['vram_total_gb']} GB VRAM)")
+        click.echo(f"  VRAM strategy: {hw['recommended_vram_strategy']}")
+    else:
+        click.echo("  GPU:  None detected (CPU mode)")
+
+    if hw.get("ffmpeg_available"):
+        click.echo("  ffmpeg: OK")
+    else:
+        click.secho(
+            "  ffmpeg: ERROR NOT FOUND — install ffmpeg and add to PATH", fg="yellow"
+        )
+
+    click.echo()
+    click.echo("Next steps:")
+    click.echo(f"  1. Add text files to {project_path.name}/01_TEXT/chapters/")
+    click.echo(f"  2. Edit {project_path.name}/project.json (chapters + characters)")
+    click.echo(f"  3. Run: audioformation validate {project_path.name}")
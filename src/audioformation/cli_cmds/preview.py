@@ -0,0 +1,204 @@
+"""``audioformation preview`` — generate a quick preview of a chapter."""
+
+import dataclasses
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+import click
+
+from audioformation.cli import (
+    _project_guard,
+    _ProjectContext,
+    _run_async,
+)
+from audioformation.engines.base import GenerationRequest, GenerationResult
+
+
+@click.command()
+@click.argument("project_id")
+@click.argument("chapter_id")
+@click.option(
+    "--duration",
+    type=float,
+    default=30.0,
+    help="Preview duration in seconds (default: 30).",
+)
+@click.option(
+    "--chars",
+    type=int,
+    default=None,
+    help="Preview length in characters (overrides duration).",
+)
+@click.option("--engine", type=str, default=None, help="Override TTS engine.")
+@click.option("--voice", type=str, default=None, help="Override voice ID.")
+def preview(
+    project_id: str,
+    chapter_id: str,
+    duration: float,
+    chars: int | None,
+    engine: str | None,
+    voice: str | None,
+) -> None:
+    """Generate a quick preview of a chapter."""
+    from audioformation.engines.registry import registry
+
+    ctx = _project_guard(project_id)
+    chapter, text = _preview_text(ctx, chapter_id, duration, chars)
+
+    # Determine character/engine
+    target_engine, target_voice = _preview_voice(ctx.project, chapter, engine, voice)
+
+    click.echo(f"Generating preview for {project_id}/{chapter_id}")
+    click.echo(f"  Engine: {target_engine}")
+    click.echo(f"  Voice:  {target_voice}")
+    click.echo(f"  Length: {len(text)} chars (~{len(text) / 15:.1f}s)")
+
+    request = _preview_request(ctx.path, chapter, text, target_engine, target_voice)
+    if _is_cached(request.output_path):
+        _report_cached(request.output_path)
+        return
+
+    try:
+        tts = registry.get(target_engine)
+    except KeyError:
+        click.secho(f"✗ Engine '{target_engine}' not available.", fg="red")
+        sys.exit(1)
+
+    # Run generation
+    try:
+        result = _run_async(_generate_preview(tts, request))
+        _report_preview(request.output_path, result)
+    except Exception as e:
+        click.secho(f"✗ Error: {e}", fg="red")
+
+
+def _preview_text(
+    ctx: _ProjectContext, chapter_id: str, duration: float, chars: int | None
+) -> tuple[dict[str, Any], str]:
+    """Look up a chapter and cut its source text to preview length."""
+    # Find chapter
+    chapter = next(
+        (c for c in ctx.project.get("chapters", []) if c["id"] == chapter_id), None
+    )
+    if not chapter:
+        click.secho(f"✗ Chapter '{chapter_id}' not found.", fg="red")
+        sys.exit(1)
+
+    # Load source text
+    source_path = ctx.path / chapter.get("source", "")
+    if not source_path.exists():
+        click.secho(f"✗ Source file not found: {source_path}", fg="red")
+        sys.exit(1)
+
+    # Approx 15 chars per second for speech
+    preview_chars = chars or int(duration * 15)
+
+    # Only the head of the chapter is used: read that plus a margin for
+    # leading whitespace instead of decoding the whole source
+    with source_path.open(encoding="utf-8") as f:
+        text = f.read(preview_chars + 4096).strip()
+
+    # Truncate text for preview
+    if len(text) > preview_chars:
+        # Cut at last space to be clean
+        cut_point = text[:preview_chars].rfind(" ")
+        if cut_point > 0:
+            text = text[:cut_point] + "..."
+        else:
+            text = text[:preview_chars] + "..."
+
+    return chapter, text
+
+
+def _preview_voice(
+    pj: dict[str, Any],
+    chapter: dict[str, Any],
+    engine: str | None,
+    voice: str | None,
+) -> tuple[str, str | None]:
+    """Engine and voice for a preview: overrides, else the chapter's character."""
+    char_id = chapter.get("character", "narrator")
+    char_data = pj.get("characters", {}).get(char_id, {})
+
+    return engine or char_data.get("engine", "edge"), voice or char_data.get("voice")
+
+
+def _preview_request(
+    project_path: Path,
+    chapter: dict[str, Any],
+    text: str,
+    engine: str,
+    voice: str | None,
+    label: str = "",
+) -> GenerationRequest:
+    """
+    Single-request generation job writing into 03_GENERATED/compare/.
+
+    The file name is keyed on everything that shapes the audio (engine,
+    voice, language, text), so repeating a preview reuses the earlier file.
+    """
+    language = chapter.get("language", "ar")
+    key = hashlib.blake2b(
+        f"{engine}|{voice}|{language}|{text}".encode("utf-8"), digest_size=8
+    ).hexdigest()
+
+    preview_dir = project_path / "03_GENERATED" / "compare"
+    preview_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"preview_{chapter['id']}_{label}" if label else f"preview_{chapter['id']}"
+    output_path = preview_dir / f"{stem}_{key}.wav"
+
+    return GenerationRequest(
+        text=text,
+        output_path=output_path,
+        voice=voice,
+        language=language,
+        # Use simple single-request generation for preview (no chunking)
+    )
+
+
+async def _generate_preview(tts, request: GenerationRequest) -> GenerationResult:
+    """
+    Generate one preview, publishing it at its hashed path only when done.
+
+    The engine writes a ``.partial`` sibling that is renamed into place on
+    success, so a failed or interrupted run never leaves a truncated file
+    for _is_cached() to reuse.
+    """
+    final_path = request.output_path
+    partial_path = final_path.with_name(f"{final_path.stem}.partial{final_path.suffix}")
+    try:
+        result = await tts.generate(
+            dataclasses.replace(request, output_path=partial_path)
+        )
+        if result.success and partial_path.exists():
+            os.replace(partial_path, final_path)
+            result.output_path = final_path
+        return result
+    finally:
+        partial_path.unlink(missing_ok=True)
+
+
+def _is_cached(output_path: Path) -> bool:
+    """True if an identical preview has already been generated."""
+    try:
+        return output_path.stat().st_size > 0
+    except FileNotFoundError:
+        return False
+
+
+def _report_cached(output_path: Path) -> None:
+    """Echo a reused preview."""
+    click.secho(f"✓ Cached preview: {output_path.name}", fg="green")
+    click.echo(f"  Path: {output_path}")
+
+
+def _report_preview(output_path: Path, result: GenerationResult) -> None:
+    """Echo the outcome of one preview generation."""
+    if result.success:
+        click.secho(f"✓ Saved preview: {output_path.name}", fg="green")
+        click.echo(f"  Path: {output_path}")
+    else:
+        click.secho(f"✗ Preview failed: {result.error}", fg="red")
@@ -0,0 +1,106 @@
+"""``audioformation process`` — normalize and trim generated audio (Node 4)."""
+
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import click
+
+from audioformation.cli import _ICON_FAIL, _ICON_OK, _project_guard
+
+# Per-chunk WAV stems (ch01_000); stitched chapters are ch01, ch01_intro
+_CHUNK_STEM_RE = re.compile(r".*_\d+")
+
+
+@click.command("process")
+@click.argument("project_id")
+def process_audio(project_id: str) -> None:
+    """Normalize and trim generated audio (Node 4)."""
+    from audioformation.audio.processor import trim_and_normalize
+    from audioformation.pipeline import update_node_status
+
+    ctx = _project_guard(project_id)
+    project_path = ctx.path
+    pj = ctx.project
+    target_lufs = pj.get("mix", {}).get("target_lufs", -16.0)
+    true_peak = pj.get("mix", {}).get("true_peak_limit_dbtp", -1.0)
+
+    raw_dir = project_path / "03_GENERATED" / "raw"
+    processed_dir = project_path / "03_GENERATED" / "processed"
+    processed_dir.mkdir(parents=True, exist_ok=True)
+
+    # Find stitched chapter WAVs (ch01.wav, ch01_intro.wav — NOT ch01_000.wav chunks)
+    chapter_wavs = _find_chapter_wavs(raw_dir)
+
+    if not chapter_wavs:
+        click.secho("ERROR No stitched chapter files found in raw/", fg="red")
+        click.echo("  Run: audioformation generate " + project_id)
+        sys.exit(1)
+
+    click.echo(f"Processing {len(chapter_wavs)} chapter files...")
+    click.echo(f"  Target LUFS: {target_lufs}")
+    click.echo()
+
+    update_node_status(project_id, "process", "running")
+
+    def _process_chapter(wav_path: Path) -> bool:
+        # Trim silence and normalize in one read/write
+        return trim_and_normalize(
+            wav_path,
+            processed_dir / wav_path.name,
+            target_lufs=target_lufs,
+            true_peak=true_peak,
+        )
+
+    # Chapters are independent and the DSP runs in libsndfile/numpy outside
+    # the GIL, so a thread per chapter keeps every core busy; map() yields
+    # results in chapter order, keeping the progress output ordered.
+    success_count = 0
+    workers = min(len(chapter_wavs), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for wav_path, norm_ok in zip(
+            chapter_wavs, pool.map(_process_chapter, chapter_wavs)
+        ):
+            if norm_ok:
+                click.echo(f"  {_ICON_OK} {wav_path.name}")
+                success_count += 1
+            else:
+                click.echo(f"  {_ICON_FAIL} {wav_path.name} — normalization failed")
+
+    click.echo()
+    if success_count == len(chapter_wavs):
+        click.secho("✓ Processing complete.", fg="green", bold=True)
+        update_node_status(project_id, "process", "complete")
+    else:
+        click.secho(
+            f"⚠ Processed {success_count}/{len(chapter_wavs)} files.", fg="yellow"
+        )
+        update_node_status(project_id, "process", "partial")
+
+    click.echo(f"  Output: {processed_dir}")
+
+
+def _find_chapter_wavs(raw_dir: Path) -> list[Path]:
+    """
+    Sorted stitched chapter WAVs in raw_dir, skipping per-chunk files.
+
+    raw/ can hold thousands of chunk WAVs, so names are filtered as plain
+    strings from one scandir pass: no stat or Path object per skipped file.
+    """
+    try:
+        with os.scandir(raw_dir) as it:
+            names = sorted(
+                e.name
+                for e in it
+                if e.name.endswith(".wav") and not _is_chunk_name(e.name[:-4])
+            )
+    except FileNotFoundError:
+        return []
+    return [raw_dir / name for name in names]
+
+
+def _is_chunk_name(stem: str) -> bool:
+    """Chunk files have a numeric suffix after an underscore (ch01_000)."""
+    return _CHUNK_STEM_RE.fullmatch(stem) is not None
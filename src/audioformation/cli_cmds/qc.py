@@ -0,0 +1,106 @@
+"""``audioformation qc`` — view QC scan results (Node 3.5)."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import click
+
+from audioformation.cli import _ICON_FAIL, _ICON_WARN, _project_guard
+from audioformation.utils import jsonio
+
+
+@click.command()
+@click.argument("project_id")
+@click.option("--report", is_flag=True, help="Print QC report summary.")
+def qc(project_id: str, report: bool) -> None:
+    """View QC scan results (Node 3.5)."""
+    project_path = _project_guard(project_id).path
+    gen_dir = project_path / "03_GENERATED"
+
+    # Find QC reports
+    reports = _find_reports(gen_dir)
+
+    if not reports:
+        click.echo("No QC reports found. Run generation first.")
+        click.echo(f"  audioformation generate {project_id}")
+        return
+
+    # Reports are parsed on worker threads, overlapping the file I/O. map()
+    # yields them in order, so output is unchanged, and each parse tree is
+    # released once printed: only the two running totals outlive the loop.
+    total_chunks = 0
+    total_failed = 0
+    with ThreadPoolExecutor(max_workers=min(8, len(reports))) as pool:
+        for report_path, data in zip(reports, pool.map(_read_report, reports)):
+            _print_report(report_path, data, report)
+            total_chunks += data.get("total_chunks", 0)
+            total_failed += data.get("failures", 0)
+
+    # Write pipeline status — qc_scan
+    from audioformation.pipeline import mark_node
+
+    # Calculate overall result
+    fail_pct = (total_failed / total_chunks * 100) if total_chunks > 0 else 0
+
+    qc_status = "failed" if fail_pct > 5 else "complete"
+    mark_node(
+        project_path,
+        "qc_scan",
+        qc_status,
+        chunks_scanned=total_chunks,
+        fail_percent=round(fail_pct, 1),
+    )
+
+
+def _find_reports(gen_dir: Path) -> list[Path]:
+    """Sorted qc_report*.json files, matched by name from one scandir pass."""
+    try:
+        with os.scandir(gen_dir) as it:
+            names = sorted(
+                e.name
+                for e in it
+                if e.name.startswith("qc_report") and e.name.endswith(".json")
+            )
+    except FileNotFoundError:
+        return []
+    return [gen_dir / name for name in names]
+
+
+def _read_report(report_path: Path) -> dict:
+    """Parse one qc_report*.json file."""
+    return jsonio.loads(report_path.read_bytes())
+
+
+def _print_report(report_path: Path, data: dict, detailed: bool) -> None:
+    """Print one report's summary, plus failing/warning chunks if detailed."""
+    # A detailed report can list thousands of chunks: build the text and
+    # write it with one echo instead of one echo (and flush) per line
+    lines = [
+        click.style(f"QC Report: {report_path.name}", bold=True),
+        f"  Chunks:  {data.get('total_chunks', 0)}",
+        f"  Passed:  {data.get('passed', 0)}",
+        f"  Warns:   {data.get('warnings', 0)}",
+        f"  Failed:  {data.get('failures', 0)}",
+        f"  Fail %:  {data.get('fail_rate_percent', 0):.1f}%",
+    ]
+
+    if detailed:
+        lines.append("")
+        for chunk in data.get("chunks", []):
+            status = chunk.get("status", "pass")
+            if status == "fail":
+                icon = _ICON_FAIL
+            elif status == "warn":
+                icon = _ICON_WARN
+            else:
+                continue
+            lines.append(f"    {icon} {chunk['chunk_id']}")
+            for check_name, check_data in chunk.get("checks", {}).items():
+                if check_data.get("status") == status:
+                    lines.append(
+                        f"      └─ {check_name}: {check_data.get('message', '')}"
+                    )
+
+    lines.append("")
+    click.echo("\n".join(lines))
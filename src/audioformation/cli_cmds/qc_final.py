@@ -0,0 +1,54 @@
+"""``audioformation qc-final`` — run Final QC on mixed audio (Node 7)."""
+
+import sys
+
+import click
+
+from audioformation.cli import _ICON_FAIL, _LABEL_OK, _project_guard
+
+
+@click.command("qc-final")
+@click.argument("project_id")
+def qc_final(project_id: str) -> None:
+    """Run Final QC on mixed audio (Node 7)."""
+    from audioformation.qc.final import scan_final_mix
+    from audioformation.pipeline import can_proceed_to
+
+    _project_guard(project_id)
+
+    # Gates check
+    can, reason = can_proceed_to(project_id, "qc_final")
+    if not can:
+        click.secho(f"ERROR Cannot run QC Final: {reason}", fg="red")
+        sys.exit(1)
+
+    click.echo(f"Running QC Final for: {project_id}")
+
+    report = scan_final_mix(project_id)
+
+    click.echo()
+    click.secho("QC Final Report", bold=True)
+    click.echo(f"  Target LUFS: {report.target_lufs} (±1.0)")
+    click.echo(f"  Limit True Peak: {report.true_peak_limit} dBTP")
+    click.echo("-" * 60)
+
+    for res in report.results:
+        status_icon = _LABEL_OK if res.status == "pass" else _ICON_FAIL
+        click.echo(
+            f"  {status_icon} {res.filename:<25} "
+            f"LUFS: {res.lufs:>5.1f}  TP: {res.true_peak:>5.1f}"
+        )
+
+        if res.status == "fail":
+            for msg in res.messages:
+                click.echo(f"      └─ {msg}")
+
+    click.echo("-" * 60)
+
+    if report.passed:
+        click.secho("✓ QC Final PASSED. Ready for export.", fg="green", bold=True)
+    else:
+        click.secho(
+            "ERROR QC Final FAILED. Adjust mix settings and retry.", fg="red", bold=True
+        )
+        sys.exit(1)
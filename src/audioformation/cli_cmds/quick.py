@@ -0,0 +1,131 @@
+"""``audioformation quick`` — quick TTS generation without a project."""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import click
+
+from audioformation.cli import _run_async
+from audioformation.config import DEFAULT_CHUNK_MAX_CHARS, DEFAULT_CROSSFADE_MS
+
+
+@click.command()
+@click.argument("text", required=False)
+@click.option("--engine", type=str, default="edge", help="TTS engine.")
+@click.option("--voice", type=str, default="ar-SA-HamedNeural", help="Voice ID.")
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Output file path.",
+)
+def quick(text: str | None, engine: str, voice: str, output: Path | None) -> None:
+    """Quick TTS generation without a project."""
+    import sys as _sys
+
+    # Read from stdin if no text argument
+    if not text:
+        if not _sys.stdin.isatty():
+            # Raw bytes in one read: no text-mode newline/decoder passes
+            try:
+                text = _sys.stdin.buffer.read().decode("utf-8").strip()
+            except UnicodeDecodeError as e:
+                click.secho(f"✗ Input is not valid UTF-8 (byte {e.start}).", fg="red")
+                sys.exit(1)
+        else:
+            click.secho(
+                "✗ No text provided. Pass as argument or pipe via stdin.", fg="red"
+            )
+            sys.exit(1)
+
+    if not text:
+        click.secho("✗ Empty text.", fg="red")
+        sys.exit(1)
+
+    from audioformation.engines.registry import registry
+
+    # Default output path
+    if output is None:
+        output = Path("quick_output.mp3")
+
+    click.echo(f'Generating: "{text[:60]}{"..." if len(text) > 60 else ""}"')
+    click.echo(f"  Engine: {engine}")
+    click.echo(f"  Voice:  {voice}")
+
+    try:
+        tts = registry.get(engine)
+    except KeyError as e:
+        click.secho(f"ERROR {e}", fg="red")
+        sys.exit(1)
+
+    # Engines that emit the target format write it directly. Otherwise (and
+    # for long text, which is stitched as PCM) generate WAV and convert.
+    if (
+        output.suffix.lower().lstrip(".") in tts.native_formats
+        and len(text) <= DEFAULT_CHUNK_MAX_CHARS
+    ):
+        gen_output = output
+    else:
+        gen_output = output.with_suffix(".wav")
+
+    result = _run_async(_generate_text(tts, text, voice, gen_output))
+
+    if not result.success:
+        click.secho(f"✗ Generation failed: {result.error}", fg="red")
+        sys.exit(1)
+
+    # Convert to target format if needed
+    if output.suffix == ".mp3" and gen_output != output:
+        from audioformation.export.mp3 import export_mp3
+
+        if export_mp3(gen_output, output, bitrate=192):
+            gen_output.unlink(missing_ok=True)
+        else:
+            click.secho("✗ MP3 conversion failed. WAV saved instead.", fg="yellow")
+            output = gen_output
+
+    click.secho(f"✓ Saved: {output}", fg="green")
+    click.echo(f"  Duration: {result.duration_sec:.1f}s")
+
+
+async def _generate_text(tts, text: str, voice: str, output_path: Path):
+    """
+    Generate speech for text of any length into output_path.
+
+    Short text is a single request. Longer text (e.g. a chapter piped in on
+    stdin) is split into chunks that are generated one at a time, like
+    project generation, then crossfade-stitched in order.
+    """
+    from audioformation.audio.processor import crossfade_stitch, get_duration
+    from audioformation.engines.base import GenerationRequest, GenerationResult
+    from audioformation.utils.text import chunk_text
+
+    if len(text) <= DEFAULT_CHUNK_MAX_CHARS:
+        request = GenerationRequest(text=text, output_path=output_path, voice=voice)
+        return await tts.generate(request)
+
+    chunks = chunk_text(text, max_chars=DEFAULT_CHUNK_MAX_CHARS)
+
+    with tempfile.TemporaryDirectory(prefix="af_quick_") as tmp:
+        chunk_paths = [Path(tmp) / f"chunk_{i:04d}.wav" for i in range(len(chunks))]
+
+        # Sequential: local models and rate-limited services can't take
+        # several requests at once
+        for chunk, path in zip(chunks, chunk_paths):
+            request = GenerationRequest(text=chunk, output_path=path, voice=voice)
+            result = await tts.generate(request)
+            if not result.success:
+                return result
+
+        if not crossfade_stitch(
+            chunk_paths, output_path, crossfade_ms=DEFAULT_CROSSFADE_MS
+        ):
+            return GenerationResult(success=False, error="Failed to stitch chunks.")
+
+    return GenerationResult(
+        success=True,
+        output_path=output_path,
+        duration_sec=get_duration(output_path),
+    )
@@ -0,0 +1,192 @@
+"""``audioformation run`` — run the full pipeline or resume from a node."""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import click
+
+from audioformation.cli import _project_guard
+from audioformation.cli_cmds.validate import validate
+from audioformation.cli_cmds.generate import generate
+from audioformation.cli_cmds.process import process_audio
+from audioformation.cli_cmds.compose import compose
+from audioformation.cli_cmds.mix import mix
+from audioformation.cli_cmds.qc_final import qc_final
+from audioformation.cli_cmds.export import export_audio
+
+
+@click.command()
+@click.argument("project_id")
+@click.option("--all", "run_all", is_flag=True, help="Run complete pipeline.")
+@click.option(
+    "--from", "from_node", type=str, default=None, help="Resume from a specific node."
+)
+@click.option(
+    "--dry-run", is_flag=True, help="Estimate time and cost without generating."
+)
+@click.option("--engine", type=str, default=None, help="Override TTS engine.")
+def run(
+    project_id: str,
+    run_all: bool,
+    from_node: str | None,
+    dry_run: bool,
+    engine: str | None,
+) -> None:
+    """Run the full pipeline or resume from a node."""
+    from audioformation.config import PIPELINE_NODES
+    from audioformation.pipeline import get_resume_point, nodes_in_range
+
+    _project_guard(project_id)
+
+    if dry_run:
+        _dry_run(project_id, engine)
+        return
+
+    if not run_all and not from_node:
+        click.echo("Specify --all or --from <node>.")
+        click.echo(f"  Nodes: {', '.join(PIPELINE_NODES)}")
+        sys.exit(1)
+
+    start_node = (
+        get_resume_point(project_id, from_node) if from_node else PIPELINE_NODES[0]
+    )
+    nodes = nodes_in_range(start_node)
+
+    click.secho(f"Running pipeline: {project_id}", fg="cyan", bold=True)
+    click.echo(f"  Nodes: {' → '.join(nodes)}")
+    click.echo()
+
+    # Execute nodes by invoking the corresponding CLI commands
+    ctx = click.get_current_context()
+    overrides = {"generate": {"engine": engine}}
+
+    for node in nodes:
+        click.secho(f"── Node: {node} ──", fg="cyan")
+
+        if node in _NODE_COMMANDS:
+            cmd, kwargs = _NODE_COMMANDS[node]
+            kwargs = {**kwargs, **overrides.get(node, {})}
+            ctx.invoke(cmd, project_id=project_id, **kwargs)
+        else:
+            _run_manual_node(project_id, node)
+
+        click.echo()
+
+
+# node -> (command, arguments besides project_id) for `run`
+_NODE_COMMANDS: dict[str, tuple[click.Command, dict[str, Any]]] = {
+    "validate": (validate, {}),
+    "generate": (generate, {"engine": None, "device": None, "chapters": None}),
+    "process": (process_audio, {}),
+    "compose": (
+        compose,
+        {
+            "preset": "contemplative",
+            "duration": 60.0,
+            "output_filename": None,
+            "list_only": False,
+        },
+    ),
+    "mix": (mix, {"music_file": None}),
+    "qc_final": (qc_final, {}),
+    "export": (export_audio, {"fmt": "mp3", "bitrate": None}),
+}
+
+
+def _run_manual_node(project_id: str, node: str) -> None:
+    """Nodes `run` does not execute itself: bootstrap, ingest, qc_scan."""
+    from audioformation.pipeline import update_node_status
+
+    if node == "bootstrap":
+        click.echo("  Already complete (project exists).")
+        update_node_status(project_id, "bootstrap", "complete")
+    elif node == "ingest":
+        click.echo("  Skipping ingest — run manually with --source.")
+        click.echo(f"  audioformation ingest {project_id} --source ./chapters/")
+    elif node == "qc_scan":
+        click.echo("  QC scan runs automatically during generation.")
+        update_node_status(project_id, "qc_scan", "complete")
+
+
+def _dry_run(project_id: str, engine_name: str | None) -> None:
+    """Estimate generation time, chunk count, and cost."""
+    from audioformation.project import load_project_json, get_project_path
+    from audioformation.utils.text import chunk_text
+
+    pj = load_project_json(project_id)
+    project_path = get_project_path(project_id)
+    gen_config = pj.get("generation", {})
+    max_chars = gen_config.get("chunk_max_chars", 200)
+    strategy = gen_config.get("chunk_strategy", "breath_group")
+
+    chapters = pj.get("chapters", [])
+    total_chunks = 0
+    total_chars = 0
+
+    click.secho(f"Dry Run: {project_id}", fg="cyan", bold=True)
+    click.echo()
+
+    def _count_chunks(source_path: Path) -> tuple[int, int] | None:
+        """(characters, chunks) for one chapter source, None if missing."""
+        try:
+            text = source_path.read_text(encoding="utf-8").strip()
+        except (FileNotFoundError, IsADirectoryError):
+            return None
+        return len(text), len(chunk_text(text, max_chars=max_chars, strategy=strategy))
+
+    # Chapter files are read concurrently; map() keeps the listing in order
+    source_paths = [project_path / ch.get("source", "") for ch in chapters]
+    workers = min(32, len(source_paths), (os.cpu_count() or 1) + 4) or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        counts = list(pool.map(_count_chunks, source_paths))
+
+    for ch, count in zip(chapters, counts):
+        if count is None:
+            click.echo(f"  {ch['id']}: source file not found")
+            continue
+
+        n_chars, n_chunks = count
+        total_chunks += n_chunks
+        total_chars += n_chars
+
+        char_id = ch.get("character", "narrator")
+        char_data = pj.get("characters", {}).get(char_id, {})
+        eng = engine_name or char_data.get("engine", "edge")
+
+        click.echo(f"  {ch['id']}: {n_chars} chars → {n_chunks} chunks ({eng})")
+
+    click.echo()
+    click.echo(f"  Total characters: {total_chars:,}")
+    click.echo(f"  Total chunks:     {total_chunks}")
+
+    # Time estimates
+    edge_time = total_chunks * 2  # ~2s per chunk for edge-tts
+    xtts_gpu_time = total_chunks * 5  # ~5s per chunk for XTTS GPU
+    xtts_cpu_time = total_chunks * 20  # ~20s per chunk for XTTS CPU
+
+    click.echo()
+    click.echo("  Estimated generation time:")
+    click.echo(f"    edge-tts:  ~{_format_time(edge_time)}")
+    click.echo(f"    XTTS GPU:  ~{_format_time(xtts_gpu_time)}")
+    click.echo(f"    XTTS CPU:  ~{_format_time(xtts_cpu_time)}")
+
+    # Cost estimates for cloud
+    eleven_cost = total_chars * 0.00003  # ~\$30/1M chars
+    click.echo()
+    click.echo("  Estimated cloud costs:")
+    click.echo(f"    ElevenLabs: ~${eleven_cost:.2f}")
+    click.echo("    edge-tts:   $0.00 (free)")
+
+
+def _format_time(seconds: int) -> str:
+    """Format seconds into human-readable time string."""
+    m, s = divmod(seconds, 60)
+    h, m = divmod(m, 60)
+    if h:
+        return f"{h}h {m}m"
+    if m:
+        return f"{m}m {s}s"
+    return f"{s}s"
@@ -0,0 +1,32 @@
+"""``audioformation serve`` — start the AudioFormation API server."""
+
+import sys
+
+import click
+
+from audioformation.config import API_PORT
+
+
+@click.command()
+@click.option("--port", type=int, default=API_PORT, help="Port to bind.")
+@click.option("--host", type=str, default="0.0.0.0", help="Host to bind.")
+def serve(port: int, host: str) -> None:
+    """Start the AudioFormation API server."""
+    try:
+        import uvicorn
+        import importlib.util
+
+        if not importlib.util.find_spec("audioformation.server.app"):
+            raise ImportError()
+    except ImportError:
+        click.secho("✗ Server dependencies not installed.", fg="red")
+        click.echo('  Run: pip install "audioformation[server]"')
+        sys.exit(1)
+
+    click.secho(
+        f"🚀 Starting API server on http://localhost:{port}", fg="green", bold=True
+    )
+    click.echo(f"   Docs: http://localhost:{port}/docs")
+
+    # Ensure current environment variables (like ELEVENLABS_API_KEY) are preserved
+    uvicorn.run("audioformation.server.app:app", host=host, port=port, reload=True)
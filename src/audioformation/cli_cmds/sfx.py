@@ -0,0 +1,47 @@
+"""``audioformation sfx`` — fXForge: Procedural sound effects."""
+
+import sys
+
+import click
+
+from audioformation.audio.sfx import SFX_CHOICES
+from audioformation.cli import _project_guard, _unique_suffix
+
+
+@click.group()
+def sfx() -> None:
+    """FXForge: Procedural sound effects."""
+    pass
+
+
+@sfx.command("generate")
+@click.argument("project_id")
+@click.option(
+    "--type",
+    "sfx_type",
+    type=click.Choice(SFX_CHOICES),
+    required=True,
+)
+@click.option("--duration", type=float, default=1.0, help="Duration in seconds.")
+@click.option("--name", "filename", default=None, help="Output filename (optional).")
+def sfx_generate(
+    project_id: str, sfx_type: str, duration: float, filename: str | None
+) -> None:
+    """Generate a procedural sound effect."""
+    from audioformation.audio.sfx import generate_sfx
+
+    project_path = _project_guard(project_id).path
+    sfx_dir = project_path / "04_SFX" / "procedural"
+    sfx_dir.mkdir(parents=True, exist_ok=True)
+
+    if not filename:
+        filename = f"{sfx_type}_{_unique_suffix()}.wav"
+
+    output_path = sfx_dir / filename
+
+    try:
+        generate_sfx(sfx_type, output_path=output_path, duration=duration)
+        click.secho(f"✓ Generated {sfx_type}: {output_path.name}", fg="green")
+    except Exception as e:
+        click.secho(f"ERROR Failed: {e}", fg="red")
+        sys.exit(1)
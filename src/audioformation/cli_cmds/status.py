@@ -0,0 +1,59 @@
+"""``audioformation status`` — show detailed project status."""
+
+import sys
+from collections import Counter
+from operator import methodcaller
+
+import click
+
+from audioformation.cli import _ICON_PENDING, _STATUS_ICONS, _project_guard
+
+_get_status = methodcaller("get", "status")
+
+
+@click.command()
+@click.argument("project_id")
+def status(project_id: str) -> None:
+    """Show detailed project status."""
+    from audioformation.config import PIPELINE_NODES, HARD_GATES, AUTO_GATES
+
+    ctx = _project_guard(project_id)
+
+    try:
+        pj = ctx.project
+        ps = ctx.status
+    except FileNotFoundError as e:
+        click.secho(f"ERROR {e}", fg="red")
+        sys.exit(1)
+
+    click.secho(f"Project: {pj['id']}", fg="cyan", bold=True)
+    click.echo(f"  Created:    {pj.get('created', 'unknown')}")
+    click.echo(f"  Languages:  {', '.join(pj.get('languages', []))}")
+    click.echo(f"  Chapters:   {len(pj.get('chapters', []))}")
+    click.echo(f"  Characters: {', '.join(pj.get('characters', {}).keys())}")
+    click.echo()
+
+    click.secho("Pipeline Status:", bold=True)
+    nodes = ps.get("nodes", {})
+
+    for node in PIPELINE_NODES:
+        node_data = nodes.get(node, {})
+        node_status = node_data.get("status", "pending")
+
+        icon = _STATUS_ICONS.get(node_status, _ICON_PENDING)
+
+        gate = ""
+        if node in HARD_GATES:
+            gate = " [HARD GATE]"
+        elif node in AUTO_GATES:
+            gate = " [AUTO GATE]"
+
+        click.echo(f"  {icon} {node:<15} {node_status:<12}{gate}")
+
+        # Chapter-level detail for generate node
+        if node == "generate" and "chapters" in node_data:
+            chapters = node_data["chapters"]
+            # Tally in C: map + methodcaller avoids a per-chapter Python frame
+            done = Counter(map(_get_status, chapters.values()))["complete"]
+            total = len(chapters)
+            click.echo(f"    Chapters: {done}/{total} complete")
@@ -0,0 +1,54 @@
+"""``audioformation validate`` — run validation gate (Node 2) on a project."""
+
+import sys
+
+import click
+
+from audioformation.cli import _ICON_FAIL, _ICON_WARN, _LABEL_OK, _project_guard
+
+
+@click.command()
+@click.argument("project_id")
+def validate(project_id: str) -> None:
+    """Run validation gate (Node 2) on a project."""
+    from audioformation.validation import validate_project
+    from audioformation.pipeline import update_node_status
+
+    _project_guard(project_id)
+
+    click.echo(f"Validating project: {project_id}")
+    click.echo()
+
+    result = validate_project(project_id)
+    summary = result.summary()
+
+    for msg in summary["details"]["passed"]:
+        click.echo(f"  {_LABEL_OK} {msg}")
+    # Diagnostics go to stderr so stdout stays a clean pass list + summary
+    for msg in summary["details"]["warnings"]:
+        click.echo(f"  {_ICON_WARN} {msg}", err=True)
+    for msg in summary["details"]["failures"]:
+        click.echo(f"  {_ICON_FAIL} {msg}", err=True)
+
+    click.echo()
+    click.echo(
+        f"Results: {summary['passed']} passed, "
+        f"{summary['warnings']} warnings, "
+        f"{summary['failures']} failures"
+    )
+
+    if result.ok:
+        click.secho("OK Validation PASSED", fg="green", bold=True)
+        update_node_status(project_id, "validate", "complete")
+    else:
+        click.secho(
+            "ERROR Validation FAILED — fix issues and retry", fg="red", bold=True
+        )
+        # Pass the first failure as the error for the pipeline status
+        first_fail = (
+            summary["details"]["failures"][0]
+            if summary["details"]["failures"]
+            else "Validation failed"
+        )
+        update_node_status(project_id, "validate", "failed", error=first_fail)
+        sys.exit(1)
@@ -85,6 +85,15 @@ class TTSEngine(ABC):
             return f"{self.name.upper()}_API_KEY"
         return None
 
+    @property
+    def native_formats(self) -> frozenset[str]:
+        """
+        Output formats (file suffixes without the dot) the engine writes
+        without a conversion step. Other suffixes, such as .wav for an
+        MP3-native service, are still produced by converting.
+        """
+        return frozenset({"wav"})
+
     @abstractmethod
     async def generate(self, request: GenerationRequest) -> GenerationResult:
         """
@@ -46,6 +46,10 @@ class EdgeTTSEngine(TTSEngine):
     def requires_api_key(self) -> bool:
         return False
 
+    @property
+    def native_formats(self) -> frozenset[str]:
+        return frozenset({"mp3"})
+
     async def generate(self, request: GenerationRequest) -> GenerationResult:
         """
         Generate audio using edge-tts.
@@ -63,6 +63,10 @@ class ElevenLabsEngine(TTSEngine):
     def requires_api_key(self) -> bool:
         return True  # ElevenLabs requires API key
 
+    @property
+    def native_formats(self) -> frozenset[str]:
+        return frozenset({"mp3"})
+
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None:
@@ -38,6 +38,10 @@ class GTTSEngine(TTSEngine):
     def requires_api_key(self) -> bool:
         return False
 
+    @property
+    def native_formats(self) -> frozenset[str]:
+        return frozenset({"mp3"})
+
     async def generate(self, request: GenerationRequest) -> GenerationResult:
         """Generate audio using gTTS."""
         try:
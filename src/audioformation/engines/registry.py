@@ -2,6 +2,7 @@
 Engine discovery and registration.
 """
 
+import inspect
 from typing import Any, Callable
 from audioformation.engines.base import TTSEngine
 
@@ -12,6 +13,7 @@ class EngineRegistry:
     def __init__(self) -> None:
         self._factories: dict[str, Callable[[], TTSEngine]] = {}
         self._engines: dict[str, TTSEngine] = {}
+        self._capabilities: dict[str, dict[str, Any]] = {}
 
     def register(self, name: str, factory: Callable[[], TTSEngine]) -> None:
         """Register an engine factory."""
@@ -36,29 +38,16 @@ class EngineRegistry:
             available = ", ".join(sorted(self._factories.keys()))
             raise KeyError(f"Engine '{name}' not registered. Available: {available}")
 
-        # Create a temporary instance to get capabilities
-        try:
-            engine = self._factories[name]()
-            return {
-                "supports_cloning": engine.supports_cloning,
-                "supports_ssml": engine.supports_ssml,
-                "requires_gpu": engine.requires_gpu,
-                "requires_api_key": engine.requires_api_key,
-                "api_key_name": engine.api_key_name,
-            }
-        except Exception as e:
-            # Handle engines that require configuration (e.g., API keys)
-            if "API key" in str(e):
-                # Return default capabilities for engines that need API keys
-                return {
-                    "supports_cloning": True,  # Assume based on engine type
-                    "supports_ssml": False,
-                    "requires_gpu": False,
-                    "requires_api_key": True,
-                    "api_key_name": f"{name.upper()}_API_KEY",
-                    "error": "API key required",
-                }
-            raise
+        if name not in self._capabilities:
+            self._capabilities[name] = _read_capabilities(self._factories[name])
+        return dict(self._capabilities[name])
+
+    async def aclose(self) -> None:
+        """Close instantiated engines that hold async resources (HTTP clients)."""
+        for engine in self._engines.values():
+            close = getattr(engine, "close", None)
+            if inspect.iscoroutinefunction(close):
+                await close()
 
     def list_available(self) -> list[str]:
         """Return names of all registered engines."""
@@ -69,6 +58,24 @@ class EngineRegistry:
         return name in self._factories
 
 
+def _read_capabilities(factory: Callable[..., TTSEngine]) -> dict[str, Any]:
+    """Capability flags of an engine factory."""
+    if isinstance(factory, type):
+        # The capability properties are constant per class, so read them off
+        # a bare instance: __init__ (model setup, API clients, key checks)
+        # never runs just to list engines.
+        engine = factory.__new__(factory)
+    else:
+        engine = factory()
+    return {
+        "supports_cloning": engine.supports_cloning,
+        "supports_ssml": engine.supports_ssml,
+        "requires_gpu": engine.requires_gpu,
+        "requires_api_key": engine.requires_api_key,
+        "api_key_name": engine.api_key_name,
+    }
+
+
 # Global registry instance
 registry = EngineRegistry()
 
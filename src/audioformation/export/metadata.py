@@ -9,7 +9,7 @@ import hashlib
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 
 def sha256_file(path: Path) -> str:
@@ -21,10 +21,20 @@ def sha256_file(path: Path) -> str:
     return h.hexdigest()
 
 
+def manifest_entry(path: Path, export_dir: Path) -> dict[str, Any]:
+    """Manifest record (relative path, size, SHA256) for one exported file."""
+    return {
+        "path": str(path.relative_to(export_dir)),
+        "size_bytes": path.stat().st_size,
+        "sha256": sha256_file(path),
+    }
+
+
 def generate_manifest(
     export_dir: Path,
     project_id: str,
     metadata: dict[str, Any] | None = None,
+    entries: Iterable[dict[str, Any]] | None = None,
 ) -> Path:
     """
     Generate manifest.json with SHA256 checksums for all exported files.
@@ -33,20 +43,21 @@ def generate_manifest(
         export_dir: Directory containing exported files.
         project_id: Project identifier.
         metadata: Optional export metadata (author, title, etc.).
+        entries: manifest_entry() records already computed by the caller
+            (e.g. right after encoding); files they cover are not re-hashed
+            unless their size has changed since.
 
     Returns path to the manifest file.
     """
+    known = {e["path"]: e for e in entries or ()}
     files: list[dict[str, Any]] = []
 
     for path in sorted(export_dir.rglob("*")):
         if path.is_file() and path.name != "manifest.json":
-            files.append(
-                {
-                    "path": str(path.relative_to(export_dir)),
-                    "size_bytes": path.stat().st_size,
-                    "sha256": sha256_file(path),
-                }
-            )
+            entry = known.get(str(path.relative_to(export_dir)))
+            if entry is None or entry["size_bytes"] != path.stat().st_size:
+                entry = manifest_entry(path, export_dir)
+            files.append(entry)
 
     manifest = {
         "project_id": project_id,
@@ -13,6 +13,7 @@ def export_mp3(
     input_path: Path,
     output_path: Path,
     bitrate: int = 192,
+    threads: int = 0,
 ) -> bool:
     """
     Export an audio file as MP3.
@@ -21,6 +22,8 @@ def export_mp3(
         input_path: Source audio file (WAV, FLAC, etc.).
         output_path: Destination MP3 path.
         bitrate: MP3 bitrate in kbps.
+        threads: ffmpeg thread count (0 = auto). Pass 1 when several
+            files are encoded in parallel so the cores aren't oversubscribed.
 
     Returns True on success.
     """
@@ -29,7 +32,9 @@ def export_mp3(
         audio.export(
             str(output_path),
             format="mp3",
+            codec="libmp3lame",
             bitrate=f"{bitrate}k",
+            parameters=["-threads", str(threads)],
         )
         return output_path.exists() and output_path.stat().st_size > 0
     except Exception:
@@ -5,7 +5,6 @@ assign languages, prepare for generation.
 Pipeline Node 1: Ingest.
 """
 
-import shutil
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +15,7 @@ from audioformation.project import (
 )
 from audioformation.pipeline import update_node_status
 from audioformation.utils.arabic import detect_language, classify_diacritization
+from audioformation.utils.fileio import fast_copy
 from audioformation.utils.security import sanitize_filename
 
 # Non-chapter filenames to skip during ingest
@@ -87,7 +87,7 @@ def ingest_text(
 
         # Copy file (skip if source and destination are the same)
         if src_file.resolve() != dst_file.resolve():
-            shutil.copy2(src_file, dst_file)
+            fast_copy(src_file, dst_file)
 
         # Read content
         content = dst_file.read_text(encoding="utf-8").strip()
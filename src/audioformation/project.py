@@ -10,6 +10,8 @@ Every project is a directory under PROJECTS_ROOT containing:
 import json
 import os
 import re
+import threading
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -45,6 +47,7 @@ from audioformation.config import (
     DEFAULT_MP3_BITRATE,
     DEFAULT_M4B_AAC_BITRATE,
 )
+from audioformation.utils import jsonio
 from audioformation.utils.security import sanitize_project_id, validate_path_within
 
 
@@ -52,6 +55,24 @@ def get_project_path(project_id: str) -> Path:
     """
     Resolve and validate a project directory path.
     """
+    root = PROJECTS_ROOT
+    # Keyed on the root too, so redirecting PROJECTS_ROOT never serves a stale path
+    path = _project_child_path(project_id, root)
+
+    # Final safety check to satisfy automated scanners. Not cached: it
+    # resolves symlinks, and a project directory can be swapped for a
+    # symlink after its first lookup in a long-running server.
+    if not validate_path_within(path, root):
+        raise ValueError(
+            f"Security Alert: Path traversal detected for ID: {project_id}"
+        )
+
+    return path
+
+
+@lru_cache(maxsize=64)
+def _project_child_path(project_id: str, root: Path) -> Path:
+    """Project path under ``root`` from the ID (cached; pure string checks)."""
     # CODEQL FIX: Pure String Validation
     # We do NOT touch the filesystem (resolve()) here, as that triggers CodeQL.
     # Instead, we prove safety via strict Allowlist Regex and os.path.basename.
@@ -65,16 +86,8 @@ def get_project_path(project_id: str) -> Path:
         raise ValueError(f"Security Alert: Invalid Project ID format: {project_id}")
 
     # 3. Construct path safely
-    # Since safe_id cannot contain separators, this is guaranteed to be a child of PROJECTS_ROOT
-    path = PROJECTS_ROOT / safe_id
-
-    # Final safety check to satisfy automated scanners
-    if not validate_path_within(path, PROJECTS_ROOT):
-        raise ValueError(
-            f"Security Alert: Path traversal detected for ID: {project_id}"
-        )
-
-    return path
+    # Since safe_id cannot contain separators, this is guaranteed to be a child of root
+    return root / safe_id
 
 
 def create_project(project_id: str) -> Path:
@@ -96,10 +109,9 @@ def create_project(project_id: str) -> Path:
     # Create all directories
     for dir_rel in PROJECT_DIRS:
         (project_path / dir_rel).mkdir(parents=True, exist_ok=True)
-        # Add .gitkeep to keep empty dirs in version control
-        gitkeep = project_path / dir_rel / ".gitkeep"
-        if not gitkeep.exists():
-            gitkeep.touch()
+        # Add .gitkeep to keep empty dirs in version control (the tree is
+        # brand new, so no need to stat for an existing one first)
+        (project_path / dir_rel / ".gitkeep").touch()
 
     # Write default project.json
     project_json = _default_project_json(safe_id)
@@ -121,12 +133,16 @@ def list_projects() -> list[dict[str, Any]]:
 
     Returns list of dicts with id, created, and pipeline status summary.
     """
-    if not PROJECTS_ROOT.exists():
+    try:
+        # scandir entries carry their file type, so is_dir() needs no stat()
+        with os.scandir(PROJECTS_ROOT) as it:
+            entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    except FileNotFoundError:
         return []
 
     projects = []
-    for entry in sorted(PROJECTS_ROOT.iterdir()):
-        if entry.is_dir() and (entry / "project.json").exists():
+    for entry in entries:
+        if os.path.exists(os.path.join(entry.path, "project.json")):
             try:
                 pj = load_project_json(entry.name)
                 ps = load_pipeline_status(entry.name)
@@ -156,15 +172,20 @@ def list_projects() -> list[dict[str, Any]]:
 def load_project_json(project_id: str) -> dict[str, Any]:
     """Load and return project.json for the given project."""
     path = get_project_path(project_id) / "project.json"
-    if not path.exists():
-        raise FileNotFoundError(f"project.json not found for '{project_id}'")
-    return json.loads(path.read_text(encoding="utf-8"))
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"project.json not found for '{project_id}'") from None
+    # Callers edit the result before saving, so never hand out the cached tree
+    return _copy_json(_read_json_cached(str(path), st.st_mtime_ns, st.st_size))
 
 
 def save_project_json(project_id: str, data: dict[str, Any]) -> None:
     """Write project.json for the given project."""
     path = get_project_path(project_id) / "project.json"
     _write_json(path, data)
+    # A rewrite inside one mtime tick could keep the same (mtime, size) key
+    _read_json_cached.cache_clear()
 
 
 def load_pipeline_status(project_id: str) -> dict[str, Any]:
@@ -172,7 +193,7 @@ def load_pipeline_status(project_id: str) -> dict[str, Any]:
     path = get_project_path(project_id) / "pipeline-status.json"
     if not path.exists():
         raise FileNotFoundError(f"pipeline-status.json not found for '{project_id}'")
-    return json.loads(path.read_text(encoding="utf-8"))
+    return jsonio.loads(path.read_bytes())
 
 
 def save_pipeline_status(project_id: str, data: dict[str, Any]) -> None:
@@ -196,11 +217,36 @@ def project_exists(project_id: str) -> bool:
 
 
 def _write_json(path: Path, data: dict[str, Any]) -> None:
-    """Write JSON with consistent formatting."""
-    path.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    """
+    Write JSON with consistent formatting.
+
+    The file is replaced atomically, so a concurrent reader (e.g. the
+    dashboard polling pipeline status) never sees a half-written file.
+    """
+    # Per-writer temp name: concurrent writers must not share one temp file
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    text = jsonio.dumps_pretty(data)
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)  # don't leave a partial temp file behind
+        raise
+
+
+@lru_cache(maxsize=32)
+def _read_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parsed JSON for one (path, mtime, size) version of a file."""
+    return jsonio.loads(Path(path).read_bytes())
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy a parsed JSON tree (only dicts and lists are mutable)."""
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
 
 
 def _current_node(status: dict[str, Any]) -> str:
@@ -21,12 +21,7 @@ from audioformation.project import (
     get_project_path,
     load_project_json,
 )
-from audioformation.audio.processor import (
-    measure_lufs,
-    measure_true_peak,
-    detect_clipping,
-    get_duration,
-)
+from audioformation.audio.processor import analyze_audio
 from audioformation.pipeline import update_node_status
 
 
@@ -216,13 +211,12 @@ def scan_final_mix(project_id: str) -> FinalQCReport:
     for f in files:
         # Measure
         try:
-            duration = get_duration(f)
-            lufs = measure_lufs(f)
-            tp = measure_true_peak(f)
-            clip_info = detect_clipping(
-                f, threshold_dbfs=0.0
-            )  # Check for hard clipping > 0dBFS
-            clipped = clip_info["clipped"]
+            # Check for hard clipping > 0dBFS
+            metrics = analyze_audio(f, clip_threshold_dbfs=0.0)
+            duration = metrics["duration_sec"]
+            lufs = metrics["lufs"]
+            tp = metrics["true_peak"]
+            clipped = metrics["clipped"]
         except Exception as e:
             # Measurement failed
             report.results.append(
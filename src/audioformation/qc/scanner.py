@@ -12,7 +12,6 @@ Checks:
 Results: PASS / WARN / FAIL per check, per chunk.
 """
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
@@ -25,6 +24,7 @@ from audioformation.audio.processor import (
     detect_clipping,
     get_duration,
 )
+from audioformation.utils import jsonio
 
 
 @dataclass
@@ -94,10 +94,7 @@ class QCReport:
 
     def save(self, path: Path) -> None:
         """Write QC report as JSON."""
-        path.write_text(
-            json.dumps(self.to_dict(), indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
+        path.write_text(jsonio.dumps_pretty(self.to_dict()), encoding="utf-8")
 
 
 def scan_chunk(
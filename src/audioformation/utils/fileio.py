@@ -0,0 +1,56 @@
+"""
+File copy helpers.
+
+copy_file_range() lets the kernel move the bytes (and reflink them on
+copy-on-write filesystems such as Btrfs/XFS), so large reference audio is
+never pumped through a user-space buffer.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+
+def fast_copy(src: Path, dst: Path) -> Path:
+    """
+    Copy file ``src`` to file path ``dst`` with metadata, like shutil.copy2.
+
+    Uses os.copy_file_range where available, falling back to
+    shutil.copyfile (which itself uses sendfile on Linux).
+
+    Raises shutil.SameFileError if src and dst are the same file.
+    """
+    src, dst = Path(src), Path(dst)
+    if dst.exists() and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src} and {dst} are the same file")
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            _copy_range(src, dst)
+        except OSError:
+            # e.g. EXDEV on older kernels, or a filesystem without support
+            shutil.copyfile(src, dst)
+    else:
+        shutil.copyfile(src, dst)
+
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _copy_range(src: Path, dst: Path) -> None:
+    """
+    Kernel-side copy of the whole file via copy_file_range.
+
+    Some filesystems report EOF (a 0-byte copy) before the end of the file;
+    the copy is then redone with shutil.copyfile rather than left truncated.
+    """
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        remaining = os.fstat(fin.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(fin.fileno(), fout.fileno(), remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+
+    if remaining > 0:
+        shutil.copyfile(src, dst)
@@ -5,9 +5,12 @@ Writes results to 00_CONFIG/hardware.json.
 Used by engine selection and VRAM management strategy.
 """
 
+import importlib.util
 import json
 import shutil
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -32,7 +35,12 @@ def detect_gpu() -> dict[str, Any]:
         "recommended_vram_strategy": "cpu_only",
     }
 
-    # Try PyTorch detection first
+    # Try PyTorch detection first — probe for it without importing, since
+    # importing torch just to find it missing (or CPU-only) costs seconds.
+    if not _module_available("torch"):
+        result.update(_detect_gpu_nvidia_smi())
+        return result
+
     try:
         import torch
 
@@ -59,6 +67,15 @@ def detect_gpu() -> dict[str, Any]:
     return result
 
 
+def _module_available(name: str) -> bool:
+    """Check whether a top-level module is importable without executing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        # Already in sys.modules without a usable __spec__ (e.g. a stub)
+        return sys.modules.get(name) is not None
+
+
 def _detect_gpu_nvidia_smi() -> dict[str, Any]:
     """Fallback GPU detection via nvidia-smi CLI."""
     updates: dict[str, Any] = {}
@@ -136,8 +153,13 @@ def detect_ffmpeg() -> dict[str, Any]:
 
 def detect_all() -> dict[str, Any]:
     """Run all hardware detection and return combined results."""
-    gpu = detect_gpu()
-    ffmpeg = detect_ffmpeg()
+    # The GPU probe (torch import / nvidia-smi) and the ffmpeg probe are
+    # independent and mostly blocked on imports or subprocesses — overlap them.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        gpu_future = pool.submit(detect_gpu)
+        ffmpeg_future = pool.submit(detect_ffmpeg)
+        gpu = gpu_future.result()
+        ffmpeg = ffmpeg_future.result()
 
     return {
         **gpu,
@@ -0,0 +1,56 @@
+"""
+JSON read/write helpers for project files and QC reports.
+
+Uses orjson when it is installed (``pip install audioformation[json]``),
+otherwise the stdlib json module. Output matches the stdlib format used
+throughout the project: 2-space indent, UTF-8 text, trailing newline.
+"""
+
+import json
+import math
+import numbers
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+else:
+    # numpy scalars show up in QC metrics; stdlib json takes float64 as float
+    _ORJSON_PRETTY = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON from text or raw UTF-8 bytes."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # stdlib json writes -Infinity/NaN, which orjson rejects; files
+            # saved that way (e.g. peak_dbfs of a silent chunk) must still load
+            pass
+    return json.loads(data)
+
+
+def dumps_pretty(data: Any) -> str:
+    """Serialize to indented JSON text with a trailing newline."""
+    # orjson writes inf/nan as null; keep stdlib's -Infinity/NaN round-trip
+    if orjson is not None and not _has_non_finite(data):
+        try:
+            raw = orjson.dumps(data, option=_ORJSON_PRETTY)
+            return raw.decode("utf-8") + "\n"
+        except TypeError:
+            # e.g. non-str keys or ints wider than 64 bits: let stdlib handle it
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+
+
+def _has_non_finite(data: Any) -> bool:
+    """True if any float in a JSON-like structure is inf or nan."""
+    if isinstance(data, dict):
+        return any(_has_non_finite(v) for v in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(v) for v in data)
+    if isinstance(data, numbers.Real) and not isinstance(data, numbers.Integral):
+        return not math.isfinite(data)
+    return False
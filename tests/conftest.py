@@ -2,6 +2,7 @@
 
 import sys
 import json
+import shutil
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -215,17 +216,18 @@ def isolate_projects(tmp_path, monkeypatch):
     return projects_root
 
 
-@pytest.fixture
-def sample_project(tmp_path, isolate_projects):
-    """
-    Create a minimal valid project inside the isolated PROJECTS_ROOT.
-    """
+# Chapter text for the sample projects, encoded once at import time
+_CH01_BYTES = "مرحبا بالعالم. هذا فصل تجريبي للاختبار.".encode("utf-8")
+_CH02_BYTES = "The morning light filtered through the ancient windows.".encode("utf-8")
+_CH03_BYTES = "في ذلك الصباح الباكر، كانت الشمس تشرق ببطء.".encode("utf-8")
+
+
+def _build_sample_project(project_dir: Path) -> None:
+    """Write a minimal valid project (one Arabic chapter) into project_dir."""
     from audioformation.config import PROJECT_DIRS
 
-    projects_root = isolate_projects
-    project_id = "TEST_PROJECT"
-    project_dir = projects_root / project_id
-    project_dir.mkdir(exist_ok=True)
+    project_id = project_dir.name
+    project_dir.mkdir(parents=True, exist_ok=True)
 
     for subdir in PROJECT_DIRS:
         (project_dir / subdir).mkdir(parents=True, exist_ok=True)
@@ -341,27 +343,15 @@ def sample_project(tmp_path, isolate_projects):
     )
 
     chapters_dir = project_dir / "01_TEXT" / "chapters"
-    (chapters_dir / "ch01.txt").write_text(
-        "مرحبا بالعالم. هذا فصل تجريبي للاختبار.", encoding="utf-8"
-    )
+    (chapters_dir / "ch01.txt").write_bytes(_CH01_BYTES)
 
-    return {"id": project_id, "dir": project_dir, "projects_root": projects_root}
 
-
-@pytest.fixture
-def sample_project_with_text(sample_project):
-    """Extends sample_project with multiple chapters already ingested."""
-    project_dir = sample_project["dir"]
+def _add_sample_chapters(project_dir: Path) -> None:
+    """Extend a sample project with three chapters already ingested."""
     chapters_dir = project_dir / "01_TEXT" / "chapters"
 
-    (chapters_dir / "ch02.txt").write_text(
-        "The morning light filtered through the ancient windows.", encoding="utf-8"
-    )
-    (chapters_dir / "ch03.txt").write_text(
-        "في ذلك الصباح الباكر، كانت الشمس تشرق ببطء.", encoding="utf-8"
-    )
-
-    import json
+    (chapters_dir / "ch02.txt").write_bytes(_CH02_BYTES)
+    (chapters_dir / "ch03.txt").write_bytes(_CH03_BYTES)
 
     project_json_path = project_dir / "project.json"
     config = json.loads(project_json_path.read_text(encoding="utf-8"))
@@ -412,8 +402,49 @@ def sample_project_with_text(sample_project):
     }
     status_path.write_text(json.dumps(status, indent=2), encoding="utf-8")
 
-    sample_project["chapters"] = ["ch01", "ch02", "ch03"]
-    return sample_project
+
+@pytest.fixture(scope="session")
+def _sample_project_template(tmp_path_factory):
+    """Build the sample project tree once per session."""
+    project_dir = tmp_path_factory.mktemp("template") / "TEST_PROJECT"
+    _build_sample_project(project_dir)
+    return project_dir
+
+
+@pytest.fixture(scope="session")
+def _sample_project_with_text_template(tmp_path_factory, _sample_project_template):
+    """Build the multi-chapter sample project tree once per session."""
+    project_dir = tmp_path_factory.mktemp("template_text") / "TEST_PROJECT"
+    shutil.copytree(_sample_project_template, project_dir)
+    _add_sample_chapters(project_dir)
+    return project_dir
+
+
+@pytest.fixture
+def sample_project(isolate_projects, _sample_project_template):
+    """
+    Create a minimal valid project inside the isolated PROJECTS_ROOT.
+
+    Copies a session-scoped template instead of rebuilding it per test.
+    """
+    projects_root = isolate_projects
+    project_dir = projects_root / _sample_project_template.name
+    shutil.copytree(_sample_project_template, project_dir, dirs_exist_ok=True)
+    return {"id": project_dir.name, "dir": project_dir, "projects_root": projects_root}
+
+
+@pytest.fixture
+def sample_project_with_text(isolate_projects, _sample_project_with_text_template):
+    """Like sample_project, with multiple chapters already ingested."""
+    projects_root = isolate_projects
+    project_dir = projects_root / _sample_project_with_text_template.name
+    shutil.copytree(_sample_project_with_text_template, project_dir, dirs_exist_ok=True)
+    return {
+        "id": project_dir.name,
+        "dir": project_dir,
+        "projects_root": projects_root,
+        "chapters": ["ch01", "ch02", "ch03"],
+    }
 
 
 @pytest.fixture
@@ -0,0 +1,212 @@
+"""Tests for shared CLI helpers and small commands."""
+
+import asyncio
+import re
+from unittest.mock import patch
+
+import pytest
+
+from click.testing import CliRunner
+
+from audioformation.cli import _project_guard, _run_async, _unique_suffix, main
+
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+
+def test_run_async_reuses_one_event_loop():
+    first = _run_async(_current_loop())
+    second = _run_async(_current_loop())
+
+    assert first is second
+    assert not first.is_closed()
+
+
+def test_run_async_inside_running_loop():
+    async def outer():
+        # A nested call can't block on this loop, so it runs on the worker thread
+        return _run_async(_current_loop()), asyncio.get_running_loop()
+
+    inner_loop, outer_loop = asyncio.run(outer())
+    assert inner_loop is not outer_loop
+
+
+def test_status_icons(sample_project, isolate_projects):
+    from audioformation.pipeline import update_node_status
+
+    update_node_status(sample_project["id"], "bootstrap", "complete")
+    update_node_status(sample_project["id"], "validate", "failed")
+
+    result = CliRunner().invoke(main, ["status", sample_project["id"]])
+
+    assert result.exit_code == 0
+    assert "✓ bootstrap" in result.output
+    assert "X validate" in result.output
+    assert "· export" in result.output
+
+
+def test_project_guard_returns_context(sample_project, isolate_projects):
+    ctx = _project_guard(sample_project["id"])
+
+    assert ctx.path == sample_project["dir"]
+    assert ctx.project["id"] == sample_project["id"]
+    assert ctx.project is ctx.project  # loaded once per command
+    assert "nodes" in ctx.status
+
+
+@pytest.mark.parametrize("project_id", ["NOPE", "../../etc"])
+def test_project_guard_exits_for_missing_project(project_id, isolate_projects):
+    result = CliRunner().invoke(main, ["status", project_id])
+
+    assert result.exit_code == 1
+    assert "Project not found" in result.output
+
+
+def test_status_chapter_counts(sample_project, isolate_projects):
+    from audioformation.pipeline import update_node_status
+
+    chapters = {
+        "ch01": {"status": "complete"},
+        "ch02": {"status": "failed"},
+        "ch03": {"status": "complete"},
+        "ch04": {},
+    }
+    update_node_status(sample_project["id"], "generate", "partial", chapters=chapters)
+
+    result = CliRunner().invoke(main, ["status", sample_project["id"]])
+
+    assert "Chapters: 2/4 complete" in result.output
+
+
+def test_unique_suffix_is_readable_and_distinct():
+    suffixes = {_unique_suffix() for _ in range(50)}
+
+    assert len(suffixes) == 50
+    assert all(re.fullmatch(r"\d{8}-\d{6}-[0-9a-f]{4}-\d+", s) for s in suffixes)
+
+
+def test_validate_diagnostics_go_to_stderr(sample_project, isolate_projects):
+    from audioformation.validation import ValidationResult
+
+    result = ValidationResult()
+    result.pass_("project.json found")
+    result.warn("no reference audio")
+    result.fail("chapter ch02 missing")
+
+    with patch("audioformation.validation.validate_project", return_value=result):
+        out = CliRunner().invoke(main, ["validate", sample_project["id"]])
+
+    assert out.exit_code == 1
+    assert "project.json found" in out.stdout
+    assert "Results: 1 passed, 1 warnings, 1 failures" in out.stdout
+    assert "chapter ch02 missing" not in out.stdout
+    assert "no reference audio" in out.stderr
+    assert "chapter ch02 missing" in out.stderr
+
+
+def test_list_rows_are_aligned(isolate_projects):
+    from audioformation.project import create_project
+
+    create_project("SHORT")
+    create_project("A_VERY_LONG_PROJECT_IDENTIFIER_THAT_OVERFLOWS")
+
+    result = CliRunner().invoke(main, ["list"])
+
+    assert result.exit_code == 0
+    header, rule, *rows = result.output.splitlines()
+    assert header.startswith("ID" + " " * 29 + "Created")
+    assert len(rows) == 2
+    # Over-long IDs are cut so the Created column stays put
+    assert {row.index(" 20") for row in rows} == {30}
+    assert rows[1].endswith("ar, en")
+
+
+def test_engines_list_flags_missing_api_key(monkeypatch):
+    monkeypatch.delenv("ELEVENLABS_API_KEY", raising=False)
+
+    result = CliRunner().invoke(main, ["engines", "list"])
+
+    assert result.exit_code == 0
+    assert "• edge (SSML)" in result.output
+    assert "ERROR" not in result.output
+
+
+def test_dry_run_lists_chapters_in_order(sample_project_with_text, isolate_projects):
+    project_dir = sample_project_with_text["dir"]
+    (project_dir / "01_TEXT" / "chapters" / "ch02.txt").unlink()
+
+    result = CliRunner().invoke(
+        main, ["run", sample_project_with_text["id"], "--dry-run"]
+    )
+
+    assert result.exit_code == 0, result.output
+    out = result.output
+    assert out.index("ch01:") < out.index("ch02:") < out.index("ch03:")
+    assert "ch02: source file not found" in out
+    assert re.search(r"ch03: \d+ chars → \d+ chunks \(edge\)", out)
+
+
+@pytest.mark.parametrize(
+    "seconds, expected",
+    [(0, "0s"), (59, "59s"), (60, "1m 0s"), (3599, "59m 59s"), (7260, "2h 1m")],
+)
+def test_format_time(seconds, expected):
+    from audioformation.cli_cmds.run import _format_time
+
+    assert _format_time(seconds) == expected
+
+
+def test_engines_voices_table():
+    voices = [
+        {"id": "ar-SA-HamedNeural", "name": "Hamed", "locale": "ar-SA", "gender": "M"},
+        {"id": "en-US-AriaNeural", "name": "Aria", "locale": "en-US", "gender": "F"},
+    ]
+    with patch(
+        "audioformation.engines.edge_tts.EdgeTTSEngine.list_voices",
+        return_value=voices,
+    ):
+        result = CliRunner().invoke(main, ["engines", "voices", "edge"])
+
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[0].startswith("ID" + " " * 34 + "Name")
+    assert lines[2] == f"{'ar-SA-HamedNeural':<35} {'Hamed':<40} {'ar-SA':<10} M"
+    assert lines[-1] == "Total: 2 voices"
+
+
+def test_run_dispatches_nodes_in_order(sample_project, isolate_projects, monkeypatch):
+    import click
+
+    from audioformation.cli_cmds import run as run_mod
+
+    calls = []
+
+    def _recorder(node):
+        @click.command()
+        @click.argument("project_id")
+        @click.option("--engine", default=None)
+        def cmd(project_id, engine=None, **kwargs):
+            calls.append((node, engine))
+
+        return cmd
+
+    table = {
+        node: (_recorder(node), {})
+        for node in ("validate", "generate", "process", "compose")
+    }
+    table["generate"] = (table["generate"][0], {"engine": None})
+    monkeypatch.setattr(run_mod, "_NODE_COMMANDS", table)
+
+    result = CliRunner().invoke(
+        main, ["run", sample_project["id"], "--all", "--engine", "gtts"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert calls == [
+        ("validate", None),
+        ("generate", "gtts"),
+        ("process", None),
+        ("compose", None),
+    ]
+    assert "QC scan runs automatically" in result.output
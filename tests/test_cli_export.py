@@ -0,0 +1,82 @@
+"""Tests for the 'export' CLI command."""
+
+from unittest.mock import patch
+
+from click.testing import CliRunner
+import numpy as np
+import pytest
+import soundfile as sf
+
+from audioformation.cli import main
+from audioformation.pipeline import get_node_status, update_node_status
+
+
+@pytest.fixture
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture
+def mixed_chapters(sample_project):
+    pid = sample_project["id"]
+    update_node_status(pid, "validate", "complete")
+    update_node_status(pid, "qc_final", "complete")
+
+    renders = sample_project["dir"] / "06_MIX" / "renders"
+    renders.mkdir(parents=True, exist_ok=True)
+    sr = 24000
+    tone = 0.1 * np.sin(2 * np.pi * 440 * np.arange(sr) / sr)
+    for name in ("ch03.wav", "ch01.wav", "ch02.wav"):
+        sf.write(str(renders / name), tone, sr)
+    return sample_project
+
+
+def test_export_wav_chapters(runner, mixed_chapters, isolate_projects):
+    pid = mixed_chapters["id"]
+    result = runner.invoke(main, ["export", pid, "--format", "wav", "--jobs", "2"])
+
+    assert result.exit_code == 0
+    # Progress is printed in chapter order even though chapters run in parallel
+    out = result.output
+    assert out.index("ch01.wav") < out.index("ch02.wav") < out.index("ch03.wav")
+
+    chapters = mixed_chapters["dir"] / "07_EXPORT" / "chapters"
+    assert sorted(p.name for p in chapters.glob("*.wav")) == [
+        "ch01.wav",
+        "ch02.wav",
+        "ch03.wav",
+    ]
+    assert get_node_status(pid, "export")["status"] == "complete"
+
+
+def test_export_partial_failure(runner, mixed_chapters, isolate_projects):
+    def fail_ch02(wav_path, out_path, bitrate=192, threads=0):
+        if wav_path.stem == "ch02":
+            return False
+        out_path.write_bytes(b"mock mp3 data")
+        return True
+
+    with patch("audioformation.export.mp3.export_mp3", side_effect=fail_ch02):
+        result = runner.invoke(main, ["export", mixed_chapters["id"]])
+
+    assert "ch02 — export failed" in result.output
+    assert "Exported 2/3 files" in result.output
+    assert get_node_status(mixed_chapters["id"], "export")["status"] == "partial"
+
+
+def test_export_rejects_zero_jobs(runner, mixed_chapters, isolate_projects):
+    result = runner.invoke(main, ["export", mixed_chapters["id"], "--jobs", "0"])
+
+    assert result.exit_code == 2
+
+
+def test_export_without_mixed_files(runner, mixed_chapters, isolate_projects):
+    renders = mixed_chapters["dir"] / "06_MIX" / "renders"
+    for wav in renders.glob("*.wav"):
+        wav.unlink()
+    (renders / "notes.txt").write_text("not audio")
+
+    result = runner.invoke(main, ["export", mixed_chapters["id"], "--format", "wav"])
+
+    assert result.exit_code == 1
+    assert "No mixed audio files found" in result.output
@@ -56,3 +56,117 @@ def test_preview_invalid_chapter(runner, sample_project, isolate_projects):
     )
     assert result.exit_code != 0
     assert "not found" in result.output
+
+
+def test_compare_runs_engines_concurrently(runner, sample_project, isolate_projects):
+    """Each engine waits for the other to start, which only works in parallel."""
+    import asyncio
+
+    started = {"edge": asyncio.Event(), "gtts": asyncio.Event()}
+
+    def _fake(name, other):
+        async def generate(self, request):
+            started[name].set()
+            await asyncio.wait_for(started[other].wait(), timeout=2)
+            return GenerationResult(success=True, output_path=request.output_path)
+
+        return generate
+
+    with (
+        patch(
+            "audioformation.engines.edge_tts.EdgeTTSEngine.generate",
+            _fake("edge", "gtts"),
+        ),
+        patch(
+            "audioformation.engines.gtts_engine.GTTSEngine.generate",
+            _fake("gtts", "edge"),
+        ),
+    ):
+        result = runner.invoke(
+            main, ["compare", sample_project["id"], "ch01", "--engines", "edge,gtts"]
+        )
+
+    assert result.exit_code == 0
+    assert result.output.count("✓ Saved preview") == 2
+    assert "--- edge ---" in result.output
+    assert "--- gtts ---" in result.output
+    assert "preview_ch01_edge_" in result.output
+    assert "preview_ch01_gtts_" in result.output
+
+
+def test_compare_unknown_engine(runner, sample_project, isolate_projects):
+    result = runner.invoke(
+        main, ["compare", sample_project["id"], "ch01", "--engines", "nope"]
+    )
+
+    assert result.exit_code == 0
+    assert "Engine 'nope' not available" in result.output
+
+
+def test_preview_truncates_long_source(runner, sample_project, isolate_projects):
+    source = sample_project["dir"] / "01_TEXT" / "chapters" / "ch01.txt"
+    source.write_text("\n  " + "word " * 100_000, encoding="utf-8")
+
+    with patch("audioformation.engines.edge_tts.EdgeTTSEngine.generate") as mock_gen:
+        mock_gen.return_value = GenerationResult(success=True)
+        result = runner.invoke(
+            main, ["preview", sample_project["id"], "ch01", "--chars", "22"]
+        )
+
+    assert result.exit_code == 0
+    request = mock_gen.call_args[0][0]
+    assert request.text == "word word word word..."
+
+
+def test_preview_reuses_identical_output(runner, sample_project, isolate_projects):
+    async def _write(self, request):
+        request.output_path.write_bytes(b"RIFF fake wav")
+        return GenerationResult(success=True, output_path=request.output_path)
+
+    args = ["preview", sample_project["id"], "ch01", "--chars", "40"]
+    with patch(
+        "audioformation.engines.edge_tts.EdgeTTSEngine.generate",
+        autospec=True,
+        side_effect=_write,
+    ) as mock_gen:
+        first = runner.invoke(main, args)
+        second = runner.invoke(main, args)
+        other_voice = runner.invoke(main, [*args, "--voice", "en-US-AriaNeural"])
+
+    assert "Saved preview" in first.output
+    assert "Cached preview" in second.output
+    assert "Saved preview" in other_voice.output
+    assert mock_gen.call_count == 2
+
+    compare_dir = sample_project["dir"] / "03_GENERATED" / "compare"
+    assert len(list(compare_dir.glob("preview_ch01_*.wav"))) == 2
+
+
+def test_failed_preview_is_not_reused(runner, sample_project, isolate_projects):
+    calls = []
+
+    async def _write(self, request):
+        calls.append(request.output_path)
+        request.output_path.write_bytes(b"RIFF trunc")
+        if len(calls) == 1:
+            raise RuntimeError("connection reset")
+        return GenerationResult(success=True, output_path=request.output_path)
+
+    args = ["preview", sample_project["id"], "ch01", "--chars", "40"]
+    with patch(
+        "audioformation.engines.edge_tts.EdgeTTSEngine.generate",
+        autospec=True,
+        side_effect=_write,
+    ):
+        first = runner.invoke(main, args)
+        second = runner.invoke(main, args)
+
+    assert "connection reset" in first.output
+    assert "Saved preview" in second.output
+    assert len(calls) == 2
+
+    compare_dir = sample_project["dir"] / "03_GENERATED" / "compare"
+    (saved,) = compare_dir.iterdir()
+    assert saved.name.startswith("preview_ch01_")
+    assert ".partial" not in saved.name
+    assert saved.read_bytes() == b"RIFF trunc"
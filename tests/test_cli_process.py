@@ -0,0 +1,83 @@
+"""Tests for the 'process' CLI command."""
+
+from unittest.mock import patch
+
+from click.testing import CliRunner
+import numpy as np
+import pytest
+import soundfile as sf
+
+from audioformation.cli import main
+from audioformation.pipeline import get_node_status
+
+
+@pytest.fixture
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture
+def raw_chapters(sample_project):
+    raw_dir = sample_project["dir"] / "03_GENERATED" / "raw"
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    sr = 24000
+    tone = 0.1 * np.sin(2 * np.pi * 440 * np.arange(sr) / sr)
+    for name in ("ch03.wav", "ch01.wav", "ch02.wav", "ch01_000.wav"):
+        sf.write(str(raw_dir / name), np.concatenate([np.zeros(sr // 2), tone]), sr)
+    return sample_project
+
+
+def test_process_chapters(runner, raw_chapters, isolate_projects):
+    pid = raw_chapters["id"]
+    result = runner.invoke(main, ["process", pid])
+
+    assert result.exit_code == 0
+    # Progress is printed in chapter order even though chapters run in parallel
+    out = result.output
+    assert out.index("ch01.wav") < out.index("ch02.wav") < out.index("ch03.wav")
+    assert "ch01_000" not in out
+
+    processed = raw_chapters["dir"] / "03_GENERATED" / "processed"
+    assert sorted(p.name for p in processed.iterdir()) == [
+        "ch01.wav",
+        "ch02.wav",
+        "ch03.wav",
+    ]
+    assert get_node_status(pid, "process")["status"] == "complete"
+
+
+def test_process_partial_failure(runner, raw_chapters, isolate_projects):
+    def fail_ch02(wav_path, *args, **kwargs):
+        return wav_path.name != "ch02.wav"
+
+    with patch(
+        "audioformation.audio.processor.trim_and_normalize", side_effect=fail_ch02
+    ):
+        result = runner.invoke(main, ["process", raw_chapters["id"]])
+
+    assert "ch02.wav — normalization failed" in result.output
+    assert "Processed 2/3 files" in result.output
+    assert get_node_status(raw_chapters["id"], "process")["status"] == "partial"
+
+
+def test_process_without_raw_dir(runner, sample_project, isolate_projects):
+    result = runner.invoke(main, ["process", sample_project["id"]])
+
+    assert result.exit_code == 1
+    assert "No stitched chapter files found" in result.output
+
+
+@pytest.mark.parametrize(
+    "stem, is_chunk",
+    [
+        ("ch01", False),
+        ("ch01_000", True),
+        ("ch01_intro", False),
+        ("ch01_intro_012", True),
+        ("ch01_", False),
+    ],
+)
+def test_is_chunk_name(stem, is_chunk):
+    from audioformation.cli_cmds.process import _is_chunk_name
+
+    assert _is_chunk_name(stem) is is_chunk
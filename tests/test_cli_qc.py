@@ -0,0 +1,102 @@
+"""Tests for the 'qc' CLI command."""
+
+import json
+
+from click.testing import CliRunner
+import pytest
+
+from audioformation.cli import main
+from audioformation.pipeline import get_node_status
+
+
+@pytest.fixture
+def runner():
+    return CliRunner()
+
+
+def _write_report(path, total, failures, chunks=()):
+    path.write_text(
+        json.dumps(
+            {
+                "total_chunks": total,
+                "passed": total - failures,
+                "warnings": 0,
+                "failures": failures,
+                "fail_rate_percent": failures / total * 100,
+                "chunks": list(chunks),
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_qc_no_reports(runner, sample_project, isolate_projects):
+    result = runner.invoke(main, ["qc", sample_project["id"]])
+
+    assert result.exit_code == 0
+    assert "No QC reports found" in result.output
+
+
+def test_qc_reports_printed_in_order(runner, sample_project, isolate_projects):
+    """Reports are read together but printed sorted, and totals are combined."""
+    gen_dir = sample_project["dir"] / "03_GENERATED"
+    _write_report(gen_dir / "qc_report_ch02.json", 10, 1)
+    _write_report(
+        gen_dir / "qc_report_ch01.json",
+        10,
+        0,
+        chunks=[
+            {
+                "chunk_id": "ch01_000",
+                "status": "warn",
+                "checks": {"snr": {"status": "warn", "message": "low SNR"}},
+            }
+        ],
+    )
+
+    result = runner.invoke(main, ["qc", sample_project["id"], "--report"])
+
+    assert result.exit_code == 0
+    out = result.output
+    assert out.index("qc_report_ch01.json") < out.index("qc_report_ch02.json")
+    assert "snr: low SNR" in out
+
+    node = get_node_status(sample_project["id"], "qc_scan")
+    assert node["status"] == "complete"
+    assert node["chunks_scanned"] == 20
+    assert node["fail_percent"] == 5.0
+
+
+def test_qc_detailed_report_layout(runner, sample_project, isolate_projects):
+    gen_dir = sample_project["dir"] / "03_GENERATED"
+    _write_report(
+        gen_dir / "qc_report_ch01.json",
+        3,
+        1,
+        chunks=[
+            {"chunk_id": "ch01_000", "status": "pass", "checks": {}},
+            {
+                "chunk_id": "ch01_001",
+                "status": "fail",
+                "checks": {
+                    "clipping": {"status": "fail", "message": "clipped"},
+                    "snr": {"status": "warn", "message": "low SNR"},
+                },
+            },
+        ],
+    )
+
+    result = runner.invoke(main, ["qc", sample_project["id"], "--report"])
+
+    assert result.output == (
+        "QC Report: qc_report_ch01.json\n"
+        "  Chunks:  3\n"
+        "  Passed:  2\n"
+        "  Warns:   0\n"
+        "  Failed:  1\n"
+        "  Fail %:  33.3%\n"
+        "\n"
+        "    X ch01_001\n"
+        "      └─ clipping: clipped\n"
+        "\n"
+    )
@@ -0,0 +1,92 @@
+"""Tests for the 'quick' CLI command."""
+
+import asyncio
+from unittest.mock import patch
+
+from click.testing import CliRunner
+import numpy as np
+import pytest
+import soundfile as sf
+
+from audioformation.cli import main
+from audioformation.engines.base import GenerationResult
+
+
+@pytest.fixture
+def fake_edge():
+    """Edge engine stand-in writing 0.5s of tone per request."""
+    calls = []
+    state = {"active": 0, "peak": 0}
+
+    async def generate(self, request):
+        calls.append(request.text)
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        sr = 24000
+        sf.write(str(request.output_path), np.full(sr // 2, 0.1), sr)
+        return GenerationResult(
+            success=True, output_path=request.output_path, duration_sec=0.5
+        )
+
+    with patch("audioformation.engines.edge_tts.EdgeTTSEngine.generate", generate):
+        yield calls, state
+
+
+def test_quick_short_text_from_stdin(fake_edge, tmp_path):
+    calls, _ = fake_edge
+    out = tmp_path / "out.wav"
+
+    result = CliRunner().invoke(main, ["quick", "-o", str(out)], input="Hello.\n")
+
+    assert result.exit_code == 0, result.output
+    assert calls == ["Hello."]
+    assert out.exists()
+
+
+def test_quick_rejects_non_utf8_stdin(fake_edge, tmp_path):
+    calls, _ = fake_edge
+
+    result = CliRunner().invoke(
+        main, ["quick", "-o", str(tmp_path / "out.wav")], input=b"caf\xe9\n"
+    )
+
+    assert result.exit_code == 1
+    assert "not valid UTF-8" in result.output
+    assert calls == []
+
+
+def test_quick_long_text_is_chunked_and_stitched(fake_edge, tmp_path):
+    calls, state = fake_edge
+    out = tmp_path / "out.wav"
+    text = " ".join(f"Sentence number {i} goes here." for i in range(60))
+
+    result = CliRunner().invoke(main, ["quick", "-o", str(out)], input=text)
+
+    assert result.exit_code == 0, result.output
+    assert len(calls) > 4
+    assert state["peak"] == 1  # chunks are generated one at a time
+    # One stitched file: every 0.5s chunk, less the crossfade overlaps
+    assert sf.info(str(out)).duration > 0.35 * len(calls)
+    assert list(tmp_path.glob("*.wav")) == [out]
+
+
+def test_quick_mp3_written_directly_by_mp3_engine(fake_edge, tmp_path):
+    calls, _ = fake_edge
+    out = tmp_path / "out.mp3"
+
+    with patch("audioformation.export.mp3.export_mp3") as mock_export:
+        result = CliRunner().invoke(main, ["quick", "Hello.", "-o", str(out)])
+
+    assert result.exit_code == 0, result.output
+    assert calls == ["Hello."]
+    mock_export.assert_not_called()
+    assert out.exists()
+    assert not out.with_suffix(".wav").exists()
+
+
+def test_native_formats():
+    from audioformation.engines.edge_tts import EdgeTTSEngine
+
+    assert EdgeTTSEngine().native_formats == frozenset({"mp3"})
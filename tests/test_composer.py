@@ -11,9 +11,15 @@ from audioformation.audio.composer import (
 )
 from audioformation.audio.synthesis import (
     oscillator,
+    oscillator_from_phase,
     cents_to_ratio,
     generate_noise,
     apply_envelope,
+    band_filter,
+    peak_abs,
+    simple_lowpass,
+    simple_highpass,
+    time_vector,
 )
 
 
@@ -44,6 +50,29 @@ class TestPresets:
         assert p.base_amplitude == 0.0
         assert p.noise_amplitude == 0.0
 
+    def test_builtin_presets_compiled_once(self) -> None:
+        from audioformation.audio.composer import _compile_preset
+
+        compiled = _compile_preset(get_preset("tense"))
+        assert _compile_preset(get_preset("tense")) is compiled
+        assert len(compiled.layers) == 3
+        assert compiled.filter_sos.shape == (2, 6)
+
+    def test_edited_preset_is_recompiled(self) -> None:
+        import dataclasses
+
+        from audioformation.audio.composer import _compile_preset
+
+        p = dataclasses.replace(get_preset("tense"))
+        compiled = _compile_preset(p)
+        p.lowpass_hz /= 2
+        p.base_amplitude = 0.0
+
+        recompiled = _compile_preset(p)
+        assert recompiled is not compiled
+        assert len(recompiled.layers) == 2
+        assert not np.array_equal(recompiled.filter_sos, compiled.filter_sos)
+
 
 class TestOscillators:
     """Tests for waveform generation."""
@@ -72,6 +101,28 @@ class TestOscillators:
         sine = oscillator(440.0, 0.1, 44100, "sine")
         np.testing.assert_array_almost_equal(sig, sine)
 
+    def test_float32_dtype(self) -> None:
+        sig = oscillator(440.0, 0.1, 44100, "sine", dtype=np.float32)
+        assert sig.dtype == np.float32
+
+    def test_time_vector_cached_and_read_only(self) -> None:
+        t = time_vector(4410, 44100)
+        assert time_vector(4410, 44100) is t
+        assert not t.flags.writeable
+        np.testing.assert_allclose(
+            t, np.linspace(0, 0.1, 4410, endpoint=False), atol=1e-12
+        )
+
+    def test_from_phase_matches_oscillator(self) -> None:
+        t = np.arange(44100, dtype=np.float64) / 44100
+        for wave in ["sine", "triangle", "saw"]:
+            out = oscillator_from_phase(
+                t * 220.0, wave, out=np.empty(44100, dtype=np.float32)
+            )
+            np.testing.assert_allclose(
+                out, oscillator(220.0, 1.0, 44100, wave), atol=1e-6
+            )
+
     def test_cents_to_ratio(self) -> None:
         assert cents_to_ratio(0) == pytest.approx(1.0)
         assert cents_to_ratio(1200) == pytest.approx(2.0)
@@ -96,12 +147,99 @@ class TestNoise:
         noise = generate_noise(44100, "brown", rng)
         assert noise.shape == (44100,)
 
+    def test_noise_into_out_buffer(self) -> None:
+        for color in ["white", "pink", "brown"]:
+            buf = np.empty(4410, dtype=np.float32)
+            noise = generate_noise(4410, color, np.random.default_rng(5), out=buf)
+            expected = generate_noise(
+                4410, color, np.random.default_rng(5), dtype=np.float32
+            )
+            assert noise.dtype == np.float32
+            np.testing.assert_array_equal(noise, expected)
+            if color == "white":
+                assert noise is buf
+
     def test_noise_is_normalized(self) -> None:
         rng = np.random.default_rng(42)
         for color in ["white", "pink", "brown"]:
             noise = generate_noise(44100, color, rng)
             assert np.max(np.abs(noise)) <= 1.01
 
+    def test_colored_noise_tilts_toward_lows(self) -> None:
+        for color in ["pink", "brown"]:
+            noise = generate_noise(44100, color, np.random.default_rng(3))
+            spectrum = np.abs(np.fft.rfft(noise)) ** 2  # 1 Hz bins
+            assert spectrum[20:200].mean() > spectrum[5000:20000].mean() * 10
+
+    def test_noise_float32_dtype(self) -> None:
+        rng = np.random.default_rng(42)
+        for color in ["white", "pink", "brown"]:
+            noise = generate_noise(4410, color, rng, dtype=np.float32)
+            assert noise.dtype == np.float32
+
+
+class TestPeak:
+    """Tests for the peak reduction used by normalization."""
+
+    def test_peak_abs_negative_peak(self) -> None:
+        assert peak_abs(np.array([0.1, -0.7, 0.5])) == pytest.approx(0.7)
+
+    def test_peak_abs_empty(self) -> None:
+        assert peak_abs(np.array([])) == 0.0
+
+
+class TestFilters:
+    """Tests for the one-pole filter chain."""
+
+    @staticmethod
+    def _reference_lowpass(sig: np.ndarray, cutoff_hz: float, sr: int) -> np.ndarray:
+        rc = 1.0 / (2 * np.pi * cutoff_hz)
+        alpha = (1.0 / sr) / (rc + 1.0 / sr)
+        out = np.zeros_like(sig)
+        out[0] = alpha * sig[0]
+        for i in range(1, len(sig)):
+            out[i] = out[i - 1] + alpha * (sig[i] - out[i - 1])
+        return out
+
+    @staticmethod
+    def _reference_highpass(sig: np.ndarray, cutoff_hz: float, sr: int) -> np.ndarray:
+        rc = 1.0 / (2 * np.pi * cutoff_hz)
+        alpha = rc / (rc + 1.0 / sr)
+        out = np.zeros_like(sig)
+        out[0] = sig[0]
+        for i in range(1, len(sig)):
+            out[i] = alpha * (out[i - 1] + sig[i] - sig[i - 1])
+        return out
+
+    def test_simple_filters_match_one_pole_recurrence(self) -> None:
+        sig = np.random.default_rng(5).standard_normal(2000) + 0.5
+        np.testing.assert_allclose(
+            simple_lowpass(sig, 800, 44100),
+            self._reference_lowpass(sig, 800, 44100),
+            atol=1e-9,
+        )
+        np.testing.assert_allclose(
+            simple_highpass(sig, 60, 44100),
+            self._reference_highpass(sig, 60, 44100),
+            atol=1e-9,
+        )
+
+    def test_band_filter_matches_sequential_filters(self) -> None:
+        rng = np.random.default_rng(7)
+        sig = rng.standard_normal(4410) + 0.25
+        lowpassed = self._reference_lowpass(sig, 1500, 44100)
+        expected = self._reference_highpass(lowpassed, 40, 44100)
+        result = band_filter(sig, 1500, 40, 44100)
+        np.testing.assert_allclose(result, expected, atol=1e-9)
+
+    def test_band_filter_preserves_float32(self) -> None:
+        sig = np.ones(1000, dtype=np.float32)
+        assert band_filter(sig, 1500, 40, 44100).dtype == np.float32
+
+    def test_band_filter_bypass(self) -> None:
+        sig = np.ones(100)
+        assert band_filter(sig, 44100, 0, 44100) is sig
+
 
 class TestEnvelope:
     """Tests for fade-in/fade-out."""
@@ -116,6 +254,23 @@ class TestEnvelope:
         result = apply_envelope(sig, 44100, fade_in_sec=0.0, fade_out_sec=1.0)
         assert result[-1] == pytest.approx(0.0, abs=0.001)
 
+    def test_inplace_modifies_signal(self) -> None:
+        sig = np.ones(1000, dtype=np.float32)
+        result = apply_envelope(sig, 1000, 0.1, 0.1, inplace=True)
+        assert result is sig
+        assert sig[0] == 0.0
+        assert sig[500] == 1.0
+
+    def test_copy_leaves_input_untouched(self) -> None:
+        sig = np.ones(1000)
+        apply_envelope(sig, 1000, 0.1, 0.1)
+        assert np.all(sig == 1.0)
+
+    def test_overlapping_fades_prefer_fade_out(self) -> None:
+        sig = np.ones(100)
+        result = apply_envelope(sig, 100, fade_in_sec=1.0, fade_out_sec=1.0)
+        np.testing.assert_allclose(result, np.linspace(1, 0, 100))
+
     def test_middle_is_unaffected(self) -> None:
         sig = np.ones(44100 * 10)  # 10 seconds
         result = apply_envelope(sig, 44100, fade_in_sec=1.0, fade_out_sec=1.0)
@@ -145,6 +300,18 @@ class TestGeneratePad:
         audio = generate_pad("silence", duration_sec=2.0)
         assert np.max(np.abs(audio)) < 0.001
 
+    def test_silence_preset_skips_synthesis(self, monkeypatch) -> None:
+        from audioformation.audio import composer
+
+        def _unexpected(*args, **kwargs):
+            raise AssertionError("silence should not be synthesized")
+
+        monkeypatch.setattr(composer, "_render_pad", _unexpected)
+        audio = generate_pad("silence", duration_sec=1.0)
+        assert audio.dtype == np.float32
+        assert len(audio) == 44100
+        assert not audio.any()
+
     def test_no_clipping(self) -> None:
         for preset_name in list_presets():
             audio = generate_pad(preset_name, duration_sec=2.0)
@@ -37,6 +37,48 @@ class TestEngineRegistry:
         engine2 = registry.get("edge")
         assert engine1 is engine2
 
+    def test_capabilities_without_instantiation(self) -> None:
+        from audioformation.engines.edge_tts import EdgeTTSEngine
+        from audioformation.engines.registry import EngineRegistry
+
+        class NeedsKeyEngine(EdgeTTSEngine):
+            def __init__(self) -> None:
+                raise ValueError("API key required")
+
+            @property
+            def requires_api_key(self) -> bool:
+                return True
+
+        reg = EngineRegistry()
+        reg.register("keyed", NeedsKeyEngine)
+
+        caps = reg.get_capabilities("keyed")
+        assert caps["requires_api_key"] is True
+        assert caps["api_key_name"] == "EDGE_API_KEY"
+        assert caps["supports_ssml"] is True
+        assert reg._engines == {}
+
+    def test_aclose_closes_async_engines(self) -> None:
+        import asyncio
+
+        from audioformation.engines.edge_tts import EdgeTTSEngine
+        from audioformation.engines.registry import EngineRegistry
+
+        class ClientEngine(EdgeTTSEngine):
+            closed = False
+
+            async def close(self) -> None:
+                self.closed = True
+
+        reg = EngineRegistry()
+        reg.register("client", ClientEngine)
+        reg.register("edge", EdgeTTSEngine)
+        engine = reg.get("client")
+        reg.get("edge")
+
+        asyncio.run(reg.aclose())
+        assert engine.closed is True
+
 
 class TestGenerationRequest:
     """Tests for the generation request data class."""
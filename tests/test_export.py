@@ -8,7 +8,11 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from audioformation.export.mp3 import export_mp3, export_wav, export_project_mp3
-from audioformation.export.metadata import sha256_file, generate_manifest
+from audioformation.export.metadata import (
+    generate_manifest,
+    manifest_entry,
+    sha256_file,
+)
 
 
 @pytest.fixture
@@ -43,6 +47,22 @@ class TestMP3Export:
             assert output.exists()
             assert output.stat().st_size > 0
 
+    def test_export_passes_encoder_and_threads(
+        self, sample_wav: Path, tmp_path: Path
+    ) -> None:
+        with patch("audioformation.export.mp3.AudioSegment") as MockAudioSegment:
+            mock_segment = MockAudioSegment.from_file.return_value
+            mock_segment.export.side_effect = lambda path, **kwargs: Path(
+                path
+            ).write_bytes(b"mock mp3 data")
+
+            export_mp3(sample_wav, tmp_path / "out.mp3", bitrate=128, threads=2)
+
+            kwargs = mock_segment.export.call_args.kwargs
+            assert kwargs["codec"] == "libmp3lame"
+            assert kwargs["bitrate"] == "128k"
+            assert kwargs["parameters"] == ["-threads", "2"]
+
     def test_export_project_mp3(self, sample_wav: Path, sample_project) -> None:
         """Test exporting full project as MP3."""
         # Setup mixed file
@@ -211,3 +231,21 @@ class TestManifest:
         manifest_path = generate_manifest(export_dir, "TEST")
         data = json.loads(manifest_path.read_text())
         assert data["total_files"] == 2
+
+    def test_manifest_reuses_precomputed_entries(self, tmp_path: Path) -> None:
+        export_dir = tmp_path / "export"
+        sub = export_dir / "chapters"
+        sub.mkdir(parents=True)
+        (sub / "ch01.mp3").write_bytes(b"fake mp3")
+        (sub / "ch02.mp3").write_bytes(b"fake mp3 2")
+        entry = manifest_entry(sub / "ch01.mp3", export_dir)
+
+        with patch(
+            "audioformation.export.metadata.sha256_file", return_value="rehashed"
+        ) as mock_hash:
+            manifest_path = generate_manifest(export_dir, "TEST", entries=[entry])
+
+        data = json.loads(manifest_path.read_text())
+        assert data["files"][0] == entry
+        assert data["files"][1]["sha256"] == "rehashed"
+        assert mock_hash.call_count == 1  # only the file without an entry
@@ -4,7 +4,11 @@ import pytest
 import json
 from unittest.mock import patch
 
-from audioformation.export.m4b import export_project_m4b, _generate_ffmetadata
+from audioformation.export.m4b import (
+    _aac_encoder,
+    _generate_ffmetadata,
+    export_project_m4b,
+)
 
 
 @pytest.fixture
@@ -44,6 +48,7 @@ def test_export_m4b_success(setup_mixed_files):
     with (
         patch("subprocess.run") as mock_run,
         patch("audioformation.export.m4b.get_duration", return_value=60.0),
+        patch("audioformation.export.m4b._aac_encoder", return_value="aac"),
     ):
         mock_run.return_value.returncode = 0
 
@@ -92,6 +97,7 @@ def test_export_with_cover_art(setup_mixed_files):
     with (
         patch("subprocess.run") as mock_run,
         patch("audioformation.export.m4b.get_duration", return_value=10.0),
+        patch("audioformation.export.m4b._aac_encoder", return_value="aac"),
     ):
         mock_run.return_value.returncode = 0
 
@@ -103,3 +109,34 @@ def test_export_with_cover_art(setup_mixed_files):
         # Check mapping logic
         assert "-disposition:v" in cmd
         assert "attached_pic" in cmd
+
+
+@pytest.mark.parametrize(
+    "encoders, expected",
+    [
+        (
+            " A..... aac                  AAC\n A..... libfdk_aac Fraunhofer\n",
+            "libfdk_aac",
+        ),
+        (" A..... aac                  AAC\n", "aac"),
+    ],
+)
+def test_aac_encoder_prefers_fdk(encoders, expected):
+    _aac_encoder.cache_clear()
+    try:
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value.stdout = encoders
+            assert _aac_encoder() == expected
+            assert _aac_encoder() == expected
+            assert mock_run.call_count == 1  # probed once per process
+    finally:
+        _aac_encoder.cache_clear()
+
+
+def test_aac_encoder_without_ffmpeg():
+    _aac_encoder.cache_clear()
+    try:
+        with patch("subprocess.run", side_effect=FileNotFoundError):
+            assert _aac_encoder() == "aac"
+    finally:
+        _aac_encoder.cache_clear()
@@ -0,0 +1,61 @@
+"""Tests for file copy helpers."""
+
+import os
+import shutil
+
+import pytest
+
+from audioformation.utils import fileio
+from audioformation.utils.fileio import fast_copy
+
+
+@pytest.fixture
+def src_file(tmp_path):
+    src = tmp_path / "ref.wav"
+    src.write_bytes(os.urandom(256 * 1024 + 7))
+    os.utime(src, (1_600_000_000, 1_600_000_000))
+    return src
+
+
+def test_copies_content_and_mtime(src_file, tmp_path):
+    dst = fast_copy(src_file, tmp_path / "copy.wav")
+
+    assert dst.read_bytes() == src_file.read_bytes()
+    assert dst.stat().st_mtime == src_file.stat().st_mtime
+
+
+def test_overwrites_existing_destination(src_file, tmp_path):
+    dst = tmp_path / "copy.wav"
+    dst.write_bytes(b"x" * (1024 * 1024))
+
+    fast_copy(src_file, dst)
+    assert dst.read_bytes() == src_file.read_bytes()
+
+
+def test_falls_back_when_copy_file_range_fails(src_file, tmp_path, monkeypatch):
+    def unsupported(*args):
+        raise OSError(18, "Invalid cross-device link")
+
+    monkeypatch.setattr(fileio.os, "copy_file_range", unsupported, raising=False)
+
+    dst = fast_copy(src_file, tmp_path / "copy.wav")
+    assert dst.read_bytes() == src_file.read_bytes()
+
+
+def test_falls_back_when_copy_file_range_stops_early(src_file, tmp_path, monkeypatch):
+    calls = []
+
+    def stops_early(*args):
+        calls.append(args)
+        return 4096 if len(calls) == 1 else 0  # reports EOF after one block
+
+    monkeypatch.setattr(fileio.os, "copy_file_range", stops_early, raising=False)
+
+    dst = fast_copy(src_file, tmp_path / "copy.wav")
+    assert dst.read_bytes() == src_file.read_bytes()
+
+
+def test_same_file_raises(src_file):
+    with pytest.raises(shutil.SameFileError):
+        fast_copy(src_file, src_file)
+    assert src_file.stat().st_size == 256 * 1024 + 7
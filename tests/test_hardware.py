@@ -55,6 +55,17 @@ class TestHardwareDetection:
         assert result["vram_total_gb"] > 14.0
         assert result["cuda_available"] is True
 
+    @patch("subprocess.run", side_effect=FileNotFoundError)
+    @patch("audioformation.utils.hardware._module_available", return_value=False)
+    def test_detect_gpu_skips_torch_import_when_absent(self, mock_avail, mock_run):
+        """Torch is never imported when find_spec says it is not installed."""
+        mock_torch = MagicMock()
+        with patch.dict(sys.modules, {"torch": mock_torch}):
+            result = detect_gpu()
+        mock_avail.assert_called_once_with("torch")
+        mock_torch.cuda.is_available.assert_not_called()
+        assert result["gpu_available"] is False
+
     @patch("subprocess.run", side_effect=FileNotFoundError)
     def test_detect_gpu_none(self, mock_run):
         """Test no GPU detected."""
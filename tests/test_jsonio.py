@@ -0,0 +1,71 @@
+"""Tests for the JSON read/write helpers."""
+
+import json
+
+import numpy as np
+import pytest
+
+from audioformation.utils import jsonio
+
+SAMPLE = {
+    "id": "NOVEL",
+    "title": "رواية",
+    "chapters": [{"id": "ch01", "duration": 12.5, "ok": True}],
+    "empty": {},
+    "none": None,
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+def test_dumps_matches_stdlib_format(backend):
+    expected = json.dumps(SAMPLE, indent=2, ensure_ascii=False) + "\n"
+    assert jsonio.dumps_pretty(SAMPLE) == expected
+
+
+def test_loads_text_and_bytes(backend):
+    text = jsonio.dumps_pretty(SAMPLE)
+    assert jsonio.loads(text) == SAMPLE
+    assert jsonio.loads(text.encode("utf-8")) == SAMPLE
+
+
+def test_dumps_numpy_scalars(backend):
+    assert jsonio.loads(jsonio.dumps_pretty({"lufs": np.float64(-16.5)})) == {
+        "lufs": -16.5
+    }
+
+
+def test_dumps_falls_back_for_non_str_keys(backend):
+    assert jsonio.loads(jsonio.dumps_pretty({1: "a"})) == {"1": "a"}
+
+
+def test_invalid_json_raises_decode_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        jsonio.loads(b"{not json")
+
+
+def test_dumps_keeps_non_finite_floats(backend):
+    data = {"peak_dbfs": float("-inf"), "snr": [float("nan"), 1.0]}
+
+    text = jsonio.dumps_pretty(data)
+
+    assert text == json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+    loaded = jsonio.loads(text)
+    assert loaded["peak_dbfs"] == float("-inf")
+    assert np.isnan(loaded["snr"][0])
+
+
+def test_loads_stdlib_written_non_finite(backend):
+    legacy = json.dumps({"peak_dbfs": float("-inf"), "lufs": float("nan")})
+
+    loaded = jsonio.loads(legacy.encode("utf-8"))
+
+    assert loaded["peak_dbfs"] == float("-inf")
+    assert np.isnan(loaded["lufs"])
@@ -171,16 +171,51 @@ class TestAudioMixer:
             }
         )
 
-        voice = AudioSegment.from_file(
-            str(mix_project / "03_GENERATED" / "processed" / "ch01.wav")
+        voice, sr = sf.read(
+            str(mix_project / "03_GENERATED" / "processed" / "ch01.wav"),
+            dtype="float32",
+            always_2d=True,
         )
-        envelope = mixer._generate_envelope(voice, len(voice) + 2000)
+        total_samples = len(voice) + 2 * sr
+        envelope = mixer._generate_envelope(voice, sr, total_samples)
 
         assert isinstance(envelope, np.ndarray)
-        assert len(envelope) == len(voice) + 2000
+        assert len(envelope) == total_samples
         assert envelope.min() >= 0.0
         assert envelope.max() <= 1.0
 
+    def test_energy_timestamps_match_chunked_dbfs(self):
+        """Vectorized energy VAD agrees with slicing 50ms chunks and reading dBFS."""
+        from audioformation.audio.mixer import AudioMixer
+
+        sr = 22050  # 1102.5 frames per 50ms chunk: uneven boundaries
+        rng = np.random.default_rng(3)
+        gate = np.repeat(rng.random(20) > 0.5, sr // 8)
+        noise = rng.uniform(-3000, 3000, (len(gate), 2)) * gate[:, np.newaxis]
+        samples = noise.astype(np.int16)
+        voice = AudioSegment(
+            samples.tobytes(),
+            frame_rate=sr,
+            sample_width=2,
+            channels=2,
+        )
+
+        expected = []
+        start = None
+        for i in range(0, len(voice), 50):
+            if voice[i : i + 50].dBFS > -40.0:
+                start = i if start is None else start
+            elif start is not None:
+                expected.append({"start": start, "end": i})
+                start = None
+        if start is not None:
+            expected.append({"start": start, "end": len(voice)})
+
+        mixer = AudioMixer({"ducking": {"method": "energy"}})
+        assert expected
+        timestamps = mixer._get_energy_timestamps(samples / 32768.0, sr)
+        assert timestamps == expected
+
     def test_master_volume_applied(self, mix_project):
         """Master volume < 1.0 reduces output level."""
         from audioformation.audio.mixer import AudioMixer
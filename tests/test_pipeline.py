@@ -61,6 +61,10 @@ class TestNodeStatus:
         assert bs["status"] == "complete"
         assert ig["status"] == "running"
 
+    def test_write_leaves_no_temp_files(self, sample_project) -> None:
+        update_node_status(sample_project["id"], "ingest", "complete")
+        assert not list(sample_project["dir"].glob("*.tmp"))
+
 
 class TestChapterStatus:
     """Tests for chunk-level generation tracking."""
@@ -6,8 +6,10 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 # Import soundfile, although it might be mocked by conftest
+import soundfile as sf
 
 from audioformation.audio.processor import (
+    analyze_audio,
     measure_lufs,
     measure_true_peak,
     detect_clipping,
@@ -16,6 +18,7 @@ from audioformation.audio.processor import (
     crossfade_stitch,
     normalize_lufs,
     trim_silence,
+    trim_and_normalize,
 )
 
 
@@ -88,7 +91,10 @@ class TestMeasureLUFS:
         sf.write(str(quiet), quiet_audio, sr)
 
         # Mock Meter to return different values
-        with patch("pyloudnorm.Meter") as MockMeter:
+        with (
+            patch("audioformation.audio.processor.libloudness", None),
+            patch("pyloudnorm.Meter") as MockMeter,
+        ):
             meter_inst = MockMeter.return_value
             meter_inst.integrated_loudness.side_effect = [-10.0, -40.0]
 
@@ -98,6 +104,17 @@ class TestMeasureLUFS:
             assert lufs_loud == -10.0
             assert lufs_quiet == -40.0
 
+    def test_prefers_libloudness(self, sine_wav: Path) -> None:
+        fake = MagicMock()
+        fake.integrated_loudness.return_value = -18.5
+
+        with patch("audioformation.audio.processor.libloudness", fake):
+            assert measure_lufs(sine_wav) == -18.5
+
+        data, rate = fake.integrated_loudness.call_args[0]
+        assert data.ndim == 2
+        assert rate == 24000
+
 
 class TestTruePeak:
     """Tests for true peak measurement."""
@@ -157,6 +174,19 @@ class TestDetectClipping:
             assert result["clipped"] is True
             assert result["clipped_samples"] > 0
 
+    def test_counts_both_polarities(self, tmp_path: Path) -> None:
+        path = tmp_path / "stereo.wav"
+        data = np.full((1000, 2), 0.1)
+        data[10, 0] = 0.99
+        data[20, 1] = -0.99
+        data[30, :] = -1.0
+        sf.write(str(path), data, 24000, subtype="FLOAT")
+
+        result = detect_clipping(path, threshold_dbfs=-0.5)
+        assert result["clipped_samples"] == 4
+        assert result["total_samples"] == 2000
+        assert result["peak_dbfs"] == pytest.approx(0.0, abs=1e-6)
+
     def test_returns_expected_keys(self, sine_wav: Path) -> None:
         result = detect_clipping(sine_wav)
         assert "clipped" in result
@@ -179,6 +209,62 @@ class TestDuration:
         sr = get_sample_rate(sine_wav)
         assert sr == 24000
 
+    @pytest.mark.parametrize(
+        "subtype,channels", [("PCM_16", 1), ("PCM_24", 2), ("FLOAT", 2)]
+    )
+    def test_wav_header_skips_libsndfile(
+        self, tmp_path: Path, subtype: str, channels: int
+    ) -> None:
+        path = tmp_path / "tone.wav"
+        sf.write(str(path), np.zeros((12345, channels)), 44100, subtype=subtype)
+
+        with patch("soundfile.info") as mock_info:
+            assert get_sample_rate(path) == 44100
+            assert get_duration(path) == pytest.approx(12345 / 44100)
+        mock_info.assert_not_called()
+
+    def test_non_wav_falls_back_to_soundfile(self, tmp_path: Path) -> None:
+        path = tmp_path / "tone.flac"
+        sf.write(str(path), np.zeros(8000), 16000)
+
+        assert get_duration(path) == pytest.approx(0.5)
+        assert get_sample_rate(path) == 16000
+
+    def test_info_cached_until_rewritten(self, tmp_path: Path) -> None:
+        path = tmp_path / "tone.flac"
+        sf.write(str(path), np.zeros(24000), 24000)
+
+        with patch("soundfile.info", wraps=sf.info) as mock_info:
+            assert get_sample_rate(path) == 24000
+            get_duration(path)
+            assert mock_info.call_count == 1
+
+            sf.write(str(path), np.zeros(48000), 48000)
+            assert get_sample_rate(path) == 48000
+            assert get_duration(path) == pytest.approx(1.0)
+            assert mock_info.call_count == 2
+
+
+class TestAnalyzeAudio:
+    """analyze_audio matches the single-purpose helpers."""
+
+    def test_matches_individual_measurements(self, sine_wav: Path) -> None:
+        metrics = analyze_audio(sine_wav, clip_threshold_dbfs=-12.0)
+
+        assert metrics["duration_sec"] == pytest.approx(get_duration(sine_wav))
+        assert metrics["sample_rate"] == get_sample_rate(sine_wav)
+        assert metrics["lufs"] == pytest.approx(measure_lufs(sine_wav))
+        assert metrics["true_peak"] == pytest.approx(measure_true_peak(sine_wav))
+        clip_info = detect_clipping(sine_wav, threshold_dbfs=-12.0)
+        assert clip_info["clipped"] is True
+        for key, value in clip_info.items():
+            assert metrics[key] == value
+
+    def test_reads_file_once(self, sine_wav: Path) -> None:
+        with patch("soundfile.read", wraps=sf.read) as mock_read:
+            analyze_audio(sine_wav)
+        assert mock_read.call_count == 1
+
 
 class TestCrossfadeStitch:
     """Tests for chunk stitching with crossfade."""
@@ -187,50 +273,134 @@ class TestCrossfadeStitch:
         self, multi_chunks: list[Path], tmp_path: Path
     ) -> None:
         output = tmp_path / "stitched.wav"
-        with patch("pydub.AudioSegment") as MockAudioSegment:
-            mock_segment = MagicMock()
-            mock_segment.__len__.return_value = 1000  # 1 second
-            MockAudioSegment.from_file.return_value = mock_segment
-            MockAudioSegment.silent.return_value = mock_segment
-            MockAudioSegment.empty.return_value = mock_segment
-            mock_segment.append.return_value = mock_segment
-            mock_segment.__add__.return_value = mock_segment
-            mock_segment.__iadd__.return_value = mock_segment
 
-            # Simulate export
-            def _export(path, format=None, **kwargs):
-                Path(path).touch()
+        ok = crossfade_stitch(multi_chunks, output, crossfade_ms=50)
+        assert ok is True
+
+        data, sr = sf.read(str(output))
+        # 100ms lead + 3 x 500ms chunks - 2 x 50ms overlaps
+        assert sr == 24000
+        assert len(data) == 2400 + 3 * 12000 - 2 * 1200
+        assert np.all(data[:2400] == 0)
+
+    def test_crossfade_is_linear(self, tmp_path: Path) -> None:
+        sr = 1000
+        a, b = tmp_path / "a.wav", tmp_path / "b.wav"
+        sf.write(str(a), np.full(200, 0.5), sr, subtype="FLOAT")
+        sf.write(str(b), np.full(200, -0.5), sr, subtype="FLOAT")
+        output = tmp_path / "out.flac"
 
-            mock_segment.export.side_effect = _export
+        ok = crossfade_stitch([a, b], output, crossfade_ms=100, leading_silence_ms=0)
+        assert ok is True
+
+        data, _ = sf.read(str(output))
+        assert len(data) == 300
+        ramp = np.linspace(0.0, 1.0, 100)
+        expected = 0.5 * ramp[::-1] - 0.5 * ramp
+        np.testing.assert_allclose(data[100:200], expected, atol=1e-4)
 
-            ok = crossfade_stitch(multi_chunks, output, crossfade_ms=50)
-            assert ok is True
-            assert output.exists()
+    def test_mixed_rates_and_channels(self, tmp_path: Path) -> None:
+        a, b = tmp_path / "a.wav", tmp_path / "b.wav"
+        sf.write(str(a), np.zeros(12000), 24000)
+        sf.write(str(b), np.zeros((22050, 2)), 44100)
+        output = tmp_path / "out.wav"
+
+        ok = crossfade_stitch([a, b], output, crossfade_ms=0, leading_silence_ms=0)
+        assert ok is True
+
+        info = sf.info(str(output))
+        assert info.samplerate == 44100
+        assert info.channels == 2
+        assert info.frames == 22050 + 22050
+
+    def test_mono_upmixed_to_every_channel(self, tmp_path: Path) -> None:
+        a, b = tmp_path / "a.wav", tmp_path / "b.wav"
+        sf.write(str(a), np.full(1000, 0.25), 8000, subtype="FLOAT")
+        sf.write(str(b), np.zeros((1000, 4)), 8000, subtype="FLOAT")
+        output = tmp_path / "out.wav"
+
+        ok = crossfade_stitch([a, b], output, crossfade_ms=0, leading_silence_ms=0)
+        assert ok is True
+
+        data, _ = sf.read(str(output))
+        assert data.shape == (2000, 4)
+        np.testing.assert_allclose(data[:1000], 0.25)
+
+    def test_unmatched_multichannel_fails(self, tmp_path: Path) -> None:
+        a, b = tmp_path / "a.wav", tmp_path / "b.wav"
+        sf.write(str(a), np.zeros((1000, 2)), 8000)
+        sf.write(str(b), np.zeros((1000, 4)), 8000)
+
+        assert crossfade_stitch([a, b], tmp_path / "out.wav") is False
 
 
 class TestNormalization:
     """Tests for LUFS normalization using ffmpeg."""
 
     @patch("subprocess.run")
-    def test_normalize_success(self, mock_run, tmp_path):
-        input_path = tmp_path / "input.wav"
+    def test_normalize_success(self, mock_run, sine_wav, tmp_path):
+        output_path = tmp_path / "output.wav"
+
+        ok = normalize_lufs(sine_wav, output_path, target_lufs=-20.0)
+        assert ok is True
+        # WAV output is scaled in-process, no ffmpeg round trip
+        mock_run.assert_not_called()
+        assert measure_lufs(output_path) == pytest.approx(-20.0, abs=0.1)
+        assert sf.info(str(output_path)).subtype == sf.info(str(sine_wav)).subtype
+
+    @patch("subprocess.run")
+    def test_normalize_respects_true_peak(self, mock_run, sine_wav, tmp_path):
         output_path = tmp_path / "output.wav"
-        input_path.touch()
 
-        # Mock pass 1: Measure
-        measure_res = MagicMock()
-        measure_res.returncode = 0
-        measure_res.stderr = '{"input_i": "-20.0", "input_tp": "-5.0", "input_lra": "5.0", "input_thresh": "-30.0"}'
+        ok = normalize_lufs(sine_wav, output_path, target_lufs=-5.0, true_peak=-3.0)
+        assert ok is True
+        assert measure_true_peak(output_path) <= -3.0 + 0.01
+
+    @patch("subprocess.run")
+    def test_normalize_compressed_output_single_pass(
+        self, mock_run, sine_wav, tmp_path
+    ):
+        mock_run.return_value = MagicMock(returncode=0)
 
-        # Mock pass 2: Apply
-        apply_res = MagicMock()
-        apply_res.returncode = 0
+        ok = normalize_lufs(sine_wav, tmp_path / "output.mp3", target_lufs=-20.0)
+        assert ok is True
+        assert mock_run.call_count == 1
+        assert any(arg.startswith("volume=") for arg in mock_run.call_args[0][0])
 
-        mock_run.side_effect = [measure_res, apply_res]
+    def test_normalize_short_clip_peak_normalizes(self, tmp_path):
+        # 300ms is under the 400ms loudness block pyloudnorm needs
+        input_path = tmp_path / "short.wav"
+        sr = 24000
+        t = np.arange(int(0.3 * sr)) / sr
+        sf.write(str(input_path), 0.1 * np.sin(2 * np.pi * 440 * t), sr)
+        output_path = tmp_path / "output.wav"
 
-        ok = normalize_lufs(input_path, output_path, target_lufs=-16.0)
+        ok = normalize_lufs(input_path, output_path, true_peak=-3.0)
         assert ok is True
-        assert mock_run.call_count == 2
+        assert measure_true_peak(output_path) == pytest.approx(-3.0, abs=0.01)
+
+    @patch("subprocess.run")
+    def test_normalize_decodes_unsupported_input_with_ffmpeg(self, mock_run, tmp_path):
+        from pydub import AudioSegment
+
+        mock_run.return_value = MagicMock(returncode=0)
+        input_path = tmp_path / "input.m4a"
+        input_path.write_bytes(b"not a libsndfile format")
+        sr = 24000
+        tone = (0.3 * np.sin(2 * np.pi * 440 * np.arange(sr) / sr) * 32767).astype(
+            "<i2"
+        )
+        segment = AudioSegment(
+            tone.tobytes(), frame_rate=sr, sample_width=2, channels=1
+        )
+
+        with patch("pydub.audio_segment.AudioSegment.from_file", return_value=segment):
+            ok = normalize_lufs(input_path, tmp_path / "output.mp3", target_lufs=-20.0)
+
+        assert ok is True
+        assert mock_run.call_count == 1
+        volume = next(a for a in mock_run.call_args[0][0] if a.startswith("volume="))
+        assert float(volume[len("volume=") : -len("dB")]) < 0
 
     @patch("subprocess.run")
     def test_normalize_fail_measure(self, mock_run, tmp_path):
@@ -244,23 +414,56 @@ class TestNormalization:
 
 
 class TestSilenceTrim:
-    """Tests for silence trimming using ffmpeg."""
+    """Tests for silence trimming."""
 
-    @patch("subprocess.run")
-    def test_trim_success(self, mock_run, tmp_path):
+    def test_trim_success(self, tmp_path):
+        input_path = tmp_path / "input.wav"
+        output_path = tmp_path / "output.wav"
+
+        sr = 24000
+        tone = 0.3 * np.sin(2 * np.pi * 440 * np.arange(sr) / sr)
+        data = np.concatenate([np.zeros(sr // 2), tone, np.zeros(sr)])
+        sf.write(str(input_path), data, sr)
+
+        ok = trim_silence(input_path, output_path)
+        assert ok is True
+
+        trimmed, _ = sf.read(str(output_path))
+        assert len(trimmed) == sr
+        np.testing.assert_allclose(trimmed, tone, atol=1e-4)
+        assert sf.info(str(output_path)).subtype == "PCM_16"
+
+    def test_short_blip_is_silence(self, tmp_path):
+        """Noise shorter than min_silence_ms doesn't stop the trim."""
         input_path = tmp_path / "input.wav"
         output_path = tmp_path / "output.wav"
 
+        sr = 1000
+        data = np.zeros(3000)
+        data[500:540] = 0.5  # 40ms click
+        data[1000:2000] = 0.5
+        sf.write(str(input_path), data, sr, subtype="FLOAT")
+
+        assert trim_silence(input_path, output_path, min_silence_ms=100) is True
+        trimmed, _ = sf.read(str(output_path))
+        assert len(trimmed) == 1000
+
+    @patch("subprocess.run")
+    def test_compressed_input_uses_ffmpeg(self, mock_run, tmp_path):
+        input_path = tmp_path / "input.mp3"
+        output_path = tmp_path / "output.wav"
+
         mock_res = MagicMock()
         mock_res.returncode = 0
         mock_run.return_value = mock_res
 
         ok = trim_silence(input_path, output_path)
         assert ok is True
+        assert mock_run.call_count == 1
 
     @patch("subprocess.run")
     def test_trim_fail(self, mock_run, tmp_path):
-        input_path = tmp_path / "input.wav"
+        input_path = tmp_path / "input.mp3"
         output_path = tmp_path / "output.wav"
 
         mock_run.side_effect = FileNotFoundError
@@ -268,6 +471,65 @@ class TestSilenceTrim:
         ok = trim_silence(input_path, output_path)
         assert ok is False
 
+    def test_trim_missing_wav_fails(self, tmp_path):
+        ok = trim_silence(tmp_path / "missing.wav", tmp_path / "output.wav")
+        assert ok is False
+
+
+class TestTrimAndNormalize:
+    """Tests for the fused trim + normalize pass."""
+
+    def test_matches_two_step_result(self, tmp_path):
+        input_path = tmp_path / "input.wav"
+        sr = 24000
+        tone = 0.1 * np.sin(2 * np.pi * 440 * np.arange(2 * sr) / sr)
+        sf.write(str(input_path), np.concatenate([np.zeros(sr), tone]), sr)
+
+        trim_silence(input_path, tmp_path / "trimmed.wav")
+        normalize_lufs(tmp_path / "trimmed.wav", tmp_path / "two_step.wav")
+
+        out = tmp_path / "fused.wav"
+        assert trim_and_normalize(input_path, out) is True
+
+        fused, _ = sf.read(str(out))
+        two_step, _ = sf.read(str(tmp_path / "two_step.wav"))
+        assert len(fused) == 2 * sr
+        np.testing.assert_allclose(fused, two_step, atol=2e-4)
+        assert sorted(p.name for p in tmp_path.glob("*.wav")) == [
+            "fused.wav",
+            "input.wav",
+            "trimmed.wav",
+            "two_step.wav",
+        ]
+
+    @patch("subprocess.run")
+    def test_compressed_input_falls_back_to_two_steps(self, mock_run, tmp_path):
+        mock_run.return_value = MagicMock(returncode=0)
+        output_path = tmp_path / "output.mp3"
+
+        with patch(
+            "audioformation.audio.processor.normalize_lufs", return_value=True
+        ) as mock_norm:
+            ok = trim_and_normalize(tmp_path / "input.mp3", output_path)
+
+        assert ok is True
+        assert mock_run.call_count == 1  # ffmpeg silenceremove
+        assert mock_norm.call_args[0][1] == output_path
+        assert not (tmp_path / "output_trimmed.wav").exists()
+
+    def test_missing_wav_fails(self, tmp_path):
+        assert trim_and_normalize(tmp_path / "missing.wav", tmp_path / "o.wav") is False
+
+    def test_short_clip_succeeds(self, tmp_path):
+        input_path = tmp_path / "short.wav"
+        sr = 24000
+        t = np.arange(int(0.3 * sr)) / sr
+        sf.write(str(input_path), 0.1 * np.sin(2 * np.pi * 440 * t), sr)
+        out = tmp_path / "out.wav"
+
+        assert trim_and_normalize(input_path, out, true_peak=-1.0) is True
+        assert measure_true_peak(out) == pytest.approx(-1.0, abs=0.01)
+
     def test_empty_list_returns_false(self, tmp_path: Path) -> None:
         output = tmp_path / "empty.wav"
         ok = crossfade_stitch([], output)
@@ -275,38 +537,72 @@ class TestSilenceTrim:
 
     def test_single_chunk(self, multi_chunks: list[Path], tmp_path: Path) -> None:
         output = tmp_path / "single.wav"
-        with patch("pydub.AudioSegment") as MockAudioSegment:
-            mock_segment = MagicMock()
-            MockAudioSegment.from_file.return_value = mock_segment
-            MockAudioSegment.silent.return_value = mock_segment
-            mock_segment.__add__.return_value = mock_segment
-            mock_segment.__iadd__.return_value = mock_segment
 
-            def _export(path, format=None, **kwargs):
-                Path(path).touch()
+        ok = crossfade_stitch([multi_chunks[0]], output, crossfade_ms=50)
+        assert ok is True
+        assert sf.info(str(output)).frames == 2400 + 12000
+
+    @patch("subprocess.run")
+    def test_mp3_output(
+        self, mock_run, multi_chunks: list[Path], tmp_path: Path
+    ) -> None:
+        output = tmp_path / "stitched.mp3"
+        mock_run.return_value = MagicMock(returncode=0)
 
-            mock_segment.export.side_effect = _export
+        ok = crossfade_stitch(multi_chunks, output, crossfade_ms=50)
+        assert ok is True
 
-            ok = crossfade_stitch([multi_chunks[0]], output, crossfade_ms=50)
-            assert ok is True
-            assert output.exists()
+        # Raw float32 samples are piped straight into one ffmpeg encode
+        cmd = mock_run.call_args[0][0]
+        assert cmd[0] == "ffmpeg"
+        assert cmd[-1] == str(output)
+        assert "f32le" in cmd
+        frames = 2400 + 3 * 12000 - 2 * 1200
+        assert len(mock_run.call_args.kwargs["input"]) == frames * 4
 
-    def test_mp3_output(self, multi_chunks: list[Path], tmp_path: Path) -> None:
-        output = tmp_path / "stitched.mp3"
-        with patch("pydub.AudioSegment") as MockAudioSegment:
-            mock_segment = MagicMock()
-            mock_segment.__len__.return_value = 1000
-            MockAudioSegment.from_file.return_value = mock_segment
-            MockAudioSegment.silent.return_value = mock_segment
-            mock_segment.append.return_value = mock_segment
-            mock_segment.__add__.return_value = mock_segment
-            mock_segment.__iadd__.return_value = mock_segment
-
-            def _export(path, format=None, **kwargs):
-                Path(path).touch()
-
-            mock_segment.export.side_effect = _export
-
-            ok = crossfade_stitch(multi_chunks, output, crossfade_ms=50)
-            assert ok is True
-            assert output.exists()
+    @patch("subprocess.run")
+    def test_encode_failure_returns_false(
+        self, mock_run, multi_chunks: list[Path], tmp_path: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=1)
+
+        ok = crossfade_stitch(multi_chunks, tmp_path / "stitched.m4a")
+        assert ok is False
+
+
+class TestBatchProcess:
+    """Tests for batch_process_project."""
+
+    def test_processes_every_chunk(self, sample_project) -> None:
+        from audioformation.audio.processor import batch_process_project
+
+        raw_dir = sample_project["dir"] / "03_GENERATED" / "raw"
+        raw_dir.mkdir(parents=True, exist_ok=True)
+        for i in range(5):
+            (raw_dir / f"ch01_{i:03d}.wav").touch()
+        processed_dir = sample_project["dir"] / "03_GENERATED" / "processed"
+        processed_dir.mkdir(parents=True, exist_ok=True)
+        (processed_dir / "ch01_000.wav").touch()  # already done
+
+        def _normalize(src, dst, *args, **kwargs):
+            Path(dst).touch()
+            return True
+
+        def _trim(src, dst, *args, **kwargs):
+            Path(dst).touch()
+            return "003" not in Path(dst).name
+
+        with (
+            patch(
+                "audioformation.audio.processor.normalize_lufs", side_effect=_normalize
+            ) as mock_norm,
+            patch("audioformation.audio.processor.trim_silence", side_effect=_trim),
+        ):
+            stats = batch_process_project(sample_project["id"])
+
+        assert mock_norm.call_count == 4
+        assert stats["total_files"] == 5
+        assert stats["processed"] == 4
+        assert stats["failed"] == 1
+        assert stats["errors"] == ["Silence trimming failed: ch01_003.wav"]
+        assert not list(processed_dir.glob("*.temp.wav"))
@@ -6,6 +6,7 @@ import pytest
 
 from audioformation.project import (
     create_project,
+    get_project_path,
     list_projects,
     load_project_json,
     load_pipeline_status,
@@ -136,6 +137,60 @@ class TestLoadSave:
         with pytest.raises(FileNotFoundError):
             load_project_json("GHOST_PROJECT")
 
+    def test_cached_load_returns_independent_copies(self, sample_project) -> None:
+        first = load_project_json(sample_project["id"])
+        first["languages"].append("xx")
+        first["chapters"].clear()
+
+        second = load_project_json(sample_project["id"])
+        assert "xx" not in second["languages"]
+        assert second["chapters"]
+
+    def test_same_size_rewrite_is_not_stale(self, sample_project) -> None:
+        pid = sample_project["id"]
+        pj = load_project_json(pid)
+        pj["id"] = pid[::-1]  # same length, so the file size doesn't change
+        save_project_json(pid, pj)
+
+        assert load_project_json(pid)["id"] == pid[::-1]
+
+    def test_failed_save_leaves_no_temp_file(self, sample_project, monkeypatch):
+        pid = sample_project["id"]
+        project_dir = get_project_path(pid)
+        before = (project_dir / "project.json").read_bytes()
+
+        def _fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("audioformation.project.os.replace", _fail)
+        with pytest.raises(OSError, match="disk full"):
+            save_project_json(pid, load_project_json(pid))
+
+        assert not list(project_dir.glob("*.tmp"))
+        assert (project_dir / "project.json").read_bytes() == before
+
+    def test_symlink_swapped_in_after_lookup_is_rejected(
+        self, isolate_projects: Path, tmp_path: Path
+    ) -> None:
+        (isolate_projects / "P1").mkdir()
+        assert get_project_path("P1") == isolate_projects / "P1"
+
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (isolate_projects / "P1").rmdir()
+        (isolate_projects / "P1").symlink_to(outside, target_is_directory=True)
+
+        with pytest.raises(ValueError, match="Path traversal"):
+            get_project_path("P1")
+
+    def test_project_path_follows_projects_root(
+        self, isolate_projects: Path, monkeypatch, tmp_path: Path
+    ) -> None:
+        assert get_project_path("P1") == isolate_projects / "P1"
+
+        monkeypatch.setattr("audioformation.project.PROJECTS_ROOT", tmp_path / "B")
+        assert get_project_path("P1") == tmp_path / "B" / "P1"
+
 
 class TestProjectExists:
     """Tests for existence checks."""
@@ -9,15 +9,19 @@ from audioformation.pipeline import get_node_status
 
 class TestQCFinalScanner:
     @pytest.fixture
-    def mock_processor(self):
-        """Mock audio measurement functions."""
-        with (
-            patch("audioformation.qc.final.measure_lufs") as m_lufs,
-            patch("audioformation.qc.final.measure_true_peak") as m_tp,
-            patch("audioformation.qc.final.detect_clipping") as m_clip,
-            patch("audioformation.qc.final.get_duration") as m_dur,
-        ):
-            yield {"lufs": m_lufs, "tp": m_tp, "clip": m_clip, "dur": m_dur}
+    def mock_analyze(self):
+        """Mock the single-decode audio measurement."""
+        with patch("audioformation.qc.final.analyze_audio") as m_analyze:
+            yield m_analyze
+
+    @staticmethod
+    def _metrics(lufs=-16.0, tp=-2.0, clipped=False, duration=60.0):
+        return {
+            "duration_sec": duration,
+            "lufs": lufs,
+            "true_peak": tp,
+            "clipped": clipped,
+        }
 
     @pytest.fixture
     def setup_mix_dir(self, sample_project):
@@ -28,15 +32,12 @@ class TestQCFinalScanner:
         wav.touch()
         return wav
 
-    def test_passing_audio(self, sample_project, setup_mix_dir, mock_processor):
+    def test_passing_audio(self, sample_project, setup_mix_dir, mock_analyze):
         """Test audio that meets all criteria."""
         # Setup: Target -16, Limit -1.0
         # Mock: -16.5 LUFS, -2.0 TP, No clipping
 
-        mock_processor["lufs"].return_value = -16.5
-        mock_processor["tp"].return_value = -2.0
-        mock_processor["clip"].return_value = {"clipped": False}
-        mock_processor["dur"].return_value = 60.0
+        mock_analyze.return_value = self._metrics(lufs=-16.5)
 
         report = scan_final_mix(sample_project["id"])
 
@@ -48,13 +49,10 @@ class TestQCFinalScanner:
         status = get_node_status(sample_project["id"], "qc_final")
         assert status["status"] == "complete"
 
-    def test_lufs_fail(self, sample_project, setup_mix_dir, mock_processor):
+    def test_lufs_fail(self, sample_project, setup_mix_dir, mock_analyze):
         """Test audio with bad LUFS (too loud)."""
         # Target -16, measured -12.0 (diff 4.0 > 3.0 tolerance)
-        mock_processor["lufs"].return_value = -12.0
-        mock_processor["tp"].return_value = -2.0
-        mock_processor["clip"].return_value = {"clipped": False}
-        mock_processor["dur"].return_value = 60.0
+        mock_analyze.return_value = self._metrics(lufs=-12.0)
 
         report = scan_final_mix(sample_project["id"])
 
@@ -63,25 +61,19 @@ class TestQCFinalScanner:
         assert report.results[0].status == "fail"
         assert any("LUFS" in m for m in report.results[0].messages)
 
-    def test_true_peak_fail(self, sample_project, setup_mix_dir, mock_processor):
+    def test_true_peak_fail(self, sample_project, setup_mix_dir, mock_analyze):
         """Test audio exceeding True Peak limit."""
         # Limit -1.0, measured -0.5
-        mock_processor["lufs"].return_value = -16.0
-        mock_processor["tp"].return_value = -0.5
-        mock_processor["clip"].return_value = {"clipped": False}
-        mock_processor["dur"].return_value = 60.0
+        mock_analyze.return_value = self._metrics(tp=-0.5)
 
         report = scan_final_mix(sample_project["id"])
 
         assert report.passed is False
         assert any("True Peak" in m for m in report.results[0].messages)
 
-    def test_clipping_fail(self, sample_project, setup_mix_dir, mock_processor):
+    def test_clipping_fail(self, sample_project, setup_mix_dir, mock_analyze):
         """Test audio with clipping detected."""
-        mock_processor["lufs"].return_value = -16.0
-        mock_processor["tp"].return_value = -2.0
-        mock_processor["clip"].return_value = {"clipped": True}
-        mock_processor["dur"].return_value = 60.0
+        mock_analyze.return_value = self._metrics(clipped=True)
 
         report = scan_final_mix(sample_project["id"])
 
@@ -102,10 +94,10 @@ class TestQCFinalScanner:
         assert report.total_files == 0
 
     def test_measurement_exception_handled(
-        self, sample_project, setup_mix_dir, mock_processor
+        self, sample_project, setup_mix_dir, mock_analyze
     ):
         """Scanner handles exceptions during file reading."""
-        mock_processor["lufs"].side_effect = ValueError("Corrupt file")
+        mock_analyze.side_effect = ValueError("Corrupt file")
 
         report = scan_final_mix(sample_project["id"])
 
@@ -1,5 +1,6 @@
 """Tests for FXForge (SFX generation)."""
 
+import numpy as np
 import pytest
 from pathlib import Path
 from click.testing import CliRunner
@@ -50,6 +51,24 @@ def test_generate_sfx_ui_click(tmp_path):
         assert out.exists()
 
 
+@pytest.mark.parametrize(
+    "sfx_type", ["whoosh", "impact", "ui_click", "static", "drone"]
+)
+def test_generate_sfx_float32(sfx_type):
+    """Every generator stays in float32, with no silent upcasts."""
+    data = generate_sfx(sfx_type, duration=0.5, seed=3)
+    assert data.dtype == np.float32
+    assert np.max(np.abs(data)) == pytest.approx(0.9)
+
+
+def test_ui_click_reuses_template():
+    """Repeated clicks are identical and don't alias the cached render."""
+    first = generate_sfx("ui_click")
+    first[:] = 0.0
+    second = generate_sfx("ui_click")
+    assert np.max(np.abs(second)) == pytest.approx(0.9)
+
+
 def test_generate_sfx_unknown_type():
     """Test invalid type raises error."""
     with pytest.raises(ValueError, match="Unknown SFX type"):
@@ -78,3 +97,73 @@ def test_cli_sfx_generate(runner, sample_project, isolate_projects):
         # Verify file in 04_SFX/procedural
         sfx_dir = sample_project["dir"] / "04_SFX" / "procedural"
         assert len(list(sfx_dir.glob("*.wav"))) == 1
+
+
+def test_whoosh_swell_envelope():
+    """Whoosh is pink noise under a 40/20/40 linear swell."""
+    from audioformation.audio.synthesis import generate_noise
+
+    n = 1000
+    data = generate_sfx("whoosh", duration=n / 44100, seed=7)
+    noise = generate_noise(n, "pink", np.random.default_rng(7))
+    envelope = np.concatenate(
+        [np.linspace(0, 1, 400), np.ones(200), np.linspace(1, 0, 400)]
+    )
+    expected = noise * envelope
+    expected *= 0.9 / np.max(np.abs(expected))
+    np.testing.assert_allclose(data, expected, atol=1e-6)
+
+
+def test_drone_detuned_saws():
+    """Drone is two detuned saws (55 / 55.5 Hz) through the lowpass."""
+    from audioformation.audio.synthesis import simple_lowpass
+
+    sr = 8000
+    data = generate_sfx("drone", duration=1.0, sample_rate=sr)
+    t = np.arange(sr) / sr
+    saws = sum(2 * (t * f - np.floor(t * f + 0.5)) for f in (55, 55.5))
+    expected = simple_lowpass(saws, 200, sr)
+    expected *= 0.9 / np.max(np.abs(expected))
+    np.testing.assert_allclose(data, expected, atol=1e-5)
+
+
+def test_impact_matches_reference():
+    """Impact is a 150->50Hz decaying kick plus a faster-decaying noise burst."""
+    from audioformation.audio.synthesis import generate_noise
+
+    sr = 8000
+    n = 4000
+    data = generate_sfx("impact", duration=n / sr, seed=11, sample_rate=sr)
+    t = np.arange(n) / sr
+    kick = np.sin(2 * np.pi * np.cumsum(np.linspace(150, 50, n)) / sr)
+    noise = generate_noise(n, "white", np.random.default_rng(11))
+    expected = kick * np.exp(-10 * t) * 0.7 + noise * np.exp(-20 * t) * 0.3
+    expected *= 0.9 / np.max(np.abs(expected))
+    np.testing.assert_allclose(data, expected, atol=1e-5)
+
+
+def test_seeded_sfx_rendered_once():
+    """Same seed renders once; callers still get private, writable arrays."""
+    from audioformation.audio import sfx
+
+    sfx._cached_sfx.cache_clear()
+    with patch.object(sfx, "_render_sfx", wraps=sfx._render_sfx) as render:
+        first = generate_sfx("whoosh", duration=0.2, seed=42)
+        first[:] = 0.0
+        second = generate_sfx("whoosh", duration=0.2, seed=42)
+        generate_sfx("whoosh", duration=0.2, seed=None)
+
+    assert render.call_count == 2  # one seeded render + one unseeded
+    assert second.flags.writeable
+    assert np.max(np.abs(second)) == pytest.approx(0.9)
+
+
+def test_long_seeded_sfx_not_cached():
+    """Long renders bypass the cache so it can't pin large buffers."""
+    from audioformation.audio import sfx
+
+    sfx._cached_sfx.cache_clear()
+    generate_sfx("drone", duration=3.0, seed=5, sample_rate=48000)
+    generate_sfx("whoosh", duration=0.2, seed=5)
+
+    assert sfx._cached_sfx.cache_info().currsize == 1